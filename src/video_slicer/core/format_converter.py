@@ -21,11 +21,20 @@ class FormatConverter:
         audio_codec: str = "copy",
         extra_args: Iterable[str] | None = None,
     ) -> Path:
-        args = ["-i", str(input_file), "-c:v", video_codec, "-c:a", audio_codec]
-        if extra_args:
-            args.extend(extra_args)
+        extra = list(extra_args or ())
+        if video_codec == "copy" and audio_codec == "copy" and not extra:
+            # Смена только контейнера: копируем все потоки одним флагом.
+            logger.debug("Конвертация без перекодирования (remux)")
+            args = ["-i", str(input_file), "-c", "copy", "-map", "0"]
+        else:
+            args = ["-i", str(input_file), "-c:v", video_codec, "-c:a", audio_codec]
+            args.extend(extra)
+        args.extend(ffmpeg_helper.faststart_args(output_file, extra))
         args.append(str(output_file))
-        logger.info("Начата конвертация %s -> %s", input_file, output_file)
+        log_info = logger.isEnabledFor(logging.INFO)
+        if log_info:
+            logger.info("Начата конвертация %s -> %s", input_file, output_file)
         ffmpeg_helper.run_ffmpeg(args)
-        logger.info("Конвертация завершена успешно")
+        if log_info:
+            logger.info("Конвертация завершена успешно")
         return output_file
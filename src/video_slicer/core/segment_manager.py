@@ -1,7 +1,7 @@
 """Управление списком сегментов."""
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from typing import List, Optional
 
 from ..models.segment import Segment
@@ -13,9 +13,12 @@ class SegmentManager:
 
     segments: List[Segment] = field(default_factory=list)
 
-    def add_segment(self, segment: Segment) -> None:
-        segment.index = len(self.segments) + 1
-        self.segments.append(segment)
+    def add_segment(self, segment: Segment) -> Segment:
+        """Добавляет сегмент в конец и возвращает сохранённый экземпляр с номером."""
+
+        stored = replace(segment, index=len(self.segments) + 1)
+        self.segments.append(stored)
+        return stored
 
     def insert_segment(self, index: int, segment: Segment) -> None:
         if index < 0:
@@ -23,17 +26,16 @@ class SegmentManager:
         if index > len(self.segments):
             index = len(self.segments)
         self.segments.insert(index, segment)
-        self._reindex()
+        self._reindex_from(index)
 
     def remove_segment(self, index: int) -> None:
         if 0 <= index < len(self.segments):
             del self.segments[index]
-            self._reindex()
+            self._reindex_from(index)
 
     def update_segment(self, index: int, segment: Segment) -> None:
         if 0 <= index < len(self.segments):
-            segment.index = self.segments[index].index
-            self.segments[index] = segment
+            self.segments[index] = replace(segment, index=self.segments[index].index)
 
     def clear(self) -> None:
         self.segments.clear()
@@ -43,6 +45,14 @@ class SegmentManager:
             return self.segments[index]
         return None
 
-    def _reindex(self) -> None:
-        for idx, segment in enumerate(self.segments, start=1):
-            segment.index = idx
+    def _reindex_from(self, start: int) -> None:
+        """Обновляет номера только у сегментов начиная с позиции ``start``.
+
+        Элементы до точки вставки/удаления не сдвигаются, поэтому их номера
+        остаются корректными и повторно не пересчитываются.
+        """
+        segments = self.segments
+        for position in range(start, len(segments)):
+            segment = segments[position]
+            if segment.index != position + 1:
+                segments[position] = replace(segment, index=position + 1)
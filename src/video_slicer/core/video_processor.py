@@ -2,8 +2,16 @@
 from __future__ import annotations
 
 import logging
+import os
+import shlex
+import shutil
+import threading
+from bisect import bisect_right
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from pathlib import Path
-from typing import Iterable, List
+from typing import Callable, Iterable, List
 
 from ..models.segment import Segment
 from ..utils import ffmpeg_helper
@@ -11,14 +19,71 @@ from ..utils.settings import AppSettings
 
 logger = logging.getLogger(__name__)
 
+SegmentCallback = Callable[[Segment], None]
+"""Уведомление о сегменте, вызываемое из потока пула."""
+SegmentFailureCallback = Callable[[Segment, Exception], None]
+"""Уведомление об ошибке сегмента, вызываемое из потока пула."""
+
+
+class SegmentProcessingError(RuntimeError):
+    """Часть сегментов пакета не обработана.
+
+    ``failures`` содержит пары «сегмент — ошибка» в порядке исходного списка.
+    """
+
+    def __init__(self, failures: List[tuple[Segment, Exception]]) -> None:
+        """Формирует сводку вида ``#номер: ошибка`` по одной строке на сегмент."""
+
+        details = "\n".join(f"#{segment.index}: {exc}" for segment, exc in failures)
+        super().__init__(f"Не удалось обработать сегментов: {len(failures)}\n{details}")
+        self.failures = failures
+
+
+@lru_cache(maxsize=256)
+def _tokenize_extra(value: str) -> tuple[str, ...]:
+    """Разбивает дополнительные параметры ffmpeg с учётом кавычек.
+
+    Результат кэшируется по исходной строке и возвращается кортежем, чтобы
+    его можно было безопасно разделять между потоками пула. При
+    незакрытой кавычке строка делится по пробелам, как раньше.
+    """
+    try:
+        return tuple(shlex.split(value))
+    except ValueError:
+        return tuple(value.split())
+
 
 class VideoProcessor:
-    """Обёртка над FFmpeg для нарезки видео на сегменты."""
+    """Обёртка над FFmpeg для нарезки видео на сегменты.
+
+    Политика поиска: ``-ss`` (и ``-t``) всегда передаются до ``-i``, то есть
+    как параметры входа. Тогда ffmpeg переходит к нужной позиции по индексу
+    контейнера и не декодирует весь префикс файла. При копировании видеопотока
+    дополнительно передаётся ``-noaccurate_seek``: копирование всё равно
+    начинается с ключевого кадра, и точный поиск лишь тратит время.
+
+    Для копирования начало сегмента привязывается к ближайшему предыдущему
+    ключевому кадру. ffprobe читает только окна перед началами сегментов:
+    ``slice_segments`` запрашивает их все одним вызовом до запуска пула, а
+    отдельный ``process_segment`` дочитывает окно своего начала. Найденные
+    кадры общие для всех потоков пула.
+    """
 
     SVS_METADATA_COMMENT = (
         "Processed with Simple Video Slicer (https://github.com/valderan/simple-video-slicer)"
     )
     SVS_METADATA_SOFTWARE = "Simple Video Slicer"
+    _SVS_METADATA_ARGS = (
+        "-metadata",
+        f"comment={SVS_METADATA_COMMENT}",
+        "-metadata",
+        f"encoder={SVS_METADATA_SOFTWARE}",
+        "-metadata",
+        f"software={SVS_METADATA_SOFTWARE}",
+    )
+    _STRIP_METADATA_ARGS = ("-map_metadata", "-1")
+    # Кодеки x264/x265, понимающие параметры ``-preset`` и ``-tune``.
+    X26X_CODECS = frozenset({"h264", "libx264", "hevc", "libx265"})
 
     def __init__(
         self,
@@ -26,52 +91,384 @@ class VideoProcessor:
         output_dir: Path,
         *,
         settings: AppSettings | None = None,
+        cancel_event: threading.Event | None = None,
     ) -> None:
         self.input_file = input_file
         self.output_dir = output_dir
+        self._input_str = str(input_file)
+        self._keyframes: List[float] = []
+        self._keyframe_starts: set[float] = set()
+        self._keyframes_lock = threading.Lock()
         self._settings = settings
+        self._cancel_event = cancel_event
+
+    def slice_segments(
+        self,
+        segments: Iterable[Segment],
+        *,
+        max_workers: int | None = None,
+        on_started: SegmentCallback | None = None,
+        on_finished: SegmentCallback | None = None,
+        on_failed: SegmentFailureCallback | None = None,
+    ) -> None:
+        """Нарезает сегменты параллельно, запуская несколько процессов FFmpeg.
+
+        Каждый выходной файл обрабатывается в отдельном потоке пула; сама
+        работа выполняется внешним процессом ffmpeg, и GIL не ограничивает
+        параллелизм. Сегменты с одинаковым выходным путём (например, главы с
+        совпадающими названиями) выполняются в одном потоке по очереди, как
+        при последовательной нарезке: два ffmpeg никогда не пишут в один файл,
+        и остаётся результат последнего сегмента. Сегменты с уникальным путём
+        и одинаковыми параметрами нарезки (см. ``_render_key``) кодируются
+        один раз, а остальные файлы создаются копией. Ошибка одного сегмента
+        не прерывает остальные: после завершения всех задач выбрасывается
+        ``SegmentProcessingError`` со сводкой неудачных сегментов. После
+        остановки через ``cancel_event`` выбрасывается
+        ``ffmpeg_helper.FFmpegCancelledError``, а копии не создаются.
+
+        Обратные вызовы ``on_started``, ``on_finished`` и ``on_failed``
+        получают каждый сегмент (в том числе копию) и могут вызываться
+        одновременно из разных потоков пула.
+        """
+        pending = list(segments)
+        if not pending:
+            return
+
+        output_paths = [self._output_path(segment) for segment in pending]
+        path_counts = Counter(output_paths)
+        primaries: dict[tuple, Segment] = {}
+        duplicates: List[tuple[Segment, Segment]] = []
+        groups: dict[Path, List[Segment]] = {}
+        for segment, output_path in zip(pending, output_paths):
+            if path_counts[output_path] == 1:
+                primary = primaries.setdefault(self._render_key(segment), segment)
+                if primary is not segment:
+                    duplicates.append((segment, primary))
+                    continue
+            groups.setdefault(output_path, []).append(segment)
+
+        self._load_keyframes(
+            segment.start
+            for group in groups.values()
+            for segment in group
+            if self._copies_video(segment)
+        )
+        workers = self.resolve_max_workers(len(groups), max_workers)
+        failed: dict[int, Exception] = {}
+
+        def report_failure(segment: Segment, exc: Exception) -> None:
+            """Запоминает ошибку сегмента и передаёт её в ``on_failed``."""
+
+            logger.error("Сегмент %s не обработан: %s", segment.index, exc)
+            failed[id(segment)] = exc
+            if on_failed is not None:
+                on_failed(segment, exc)
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(
+                    self._process_group, group, on_started, on_finished, report_failure
+                )
+                for group in groups.values()
+            ]
+            for completed, future in enumerate(as_completed(futures), start=1):
+                future.result()
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info("Готово файлов: %s из %s", completed, len(groups))
+
+        if self._cancel_event is not None and self._cancel_event.is_set():
+            raise ffmpeg_helper.FFmpegCancelledError("Обработка остановлена")
+
+        for segment, primary in duplicates:
+            error = failed.get(id(primary))
+            if error is None:
+                if on_started is not None:
+                    on_started(segment)
+                try:
+                    self._copy_output(
+                        self._output_path(primary), self._output_path(segment)
+                    )
+                except OSError as exc:
+                    error = exc
+                else:
+                    if on_finished is not None:
+                        on_finished(segment)
+                    continue
+            report_failure(segment, error)
+
+        if failed:
+            raise SegmentProcessingError(
+                [
+                    (segment, failed[id(segment)])
+                    for segment in pending
+                    if id(segment) in failed
+                ]
+            )
+
+    def _process_group(
+        self,
+        group: List[Segment],
+        on_started: SegmentCallback | None,
+        on_finished: SegmentCallback | None,
+        on_failed: SegmentFailureCallback,
+    ) -> None:
+        """Нарезает сегменты одного выходного файла по очереди.
+
+        Выполняется в потоке пула; после остановки оставшиеся сегменты группы
+        не запускаются и не считаются неудачными.
+        """
+        for segment in group:
+            if self._cancel_event is not None and self._cancel_event.is_set():
+                return
+            if on_started is not None:
+                on_started(segment)
+            try:
+                self.process_segment(segment)
+            except ffmpeg_helper.FFmpegCancelledError:
+                return
+            except Exception as exc:  # noqa: BLE001
+                on_failed(segment, exc)
+            else:
+                if on_finished is not None:
+                    on_finished(segment)
+
+    def _output_path(self, segment: Segment) -> Path:
+        """Путь выходного файла сегмента в каталоге назначения."""
+
+        return segment.output_path(self.output_dir, default_ext=self.input_file.suffix)
+
+    def _render_key(self, segment: Segment) -> tuple:
+        """Ключ параметров, от которых зависит содержимое выходного файла.
+
+        Сегменты с равными ключами дают побайтно одинаковый результат и
+        отличаются только именем файла.
+        """
+        return (
+            segment.start,
+            segment.end,
+            self._output_path(segment).suffix.lower(),
+            segment.convert,
+            segment.video_codec,
+            segment.audio_codec,
+            segment.crf,
+            segment.extra_args,
+            segment.remove_audio,
+        )
+
+    @staticmethod
+    def _copy_output(source: Path, target: Path) -> None:
+        """Создаёт ``target`` как независимую копию ``source``.
+
+        Жёсткая ссылка не подходит: файлы делили бы один inode, и следующая
+        нарезка с ``-y`` в любой из них перезаписала бы оба.
+        """
 
-    def slice_segments(self, segments: Iterable[Segment]) -> None:
-        for segment in segments:
-            self.process_segment(segment)
+        if source == target:
+            return
+        target.unlink(missing_ok=True)
+        shutil.copy2(source, target)
+        logger.info("Сегмент-дубликат сохранён в %s", target)
+
+    def resolve_max_workers(self, total: int, override: int | None = None) -> int:
+        """Определяет размер пула: не больше числа сегментов и ядер CPU.
+
+        Явное значение ``override`` или ``AppSettings.max_workers`` (если оно
+        больше нуля) дополнительно ограничивает число одновременных процессов.
+        """
+        workers = min(total, os.cpu_count() or 1)
+        cap = override
+        if cap is None:
+            cap = int(getattr(self._settings, "max_workers", 0) or 0)
+        if cap > 0:
+            workers = min(workers, cap)
+        return max(1, workers)
 
     def process_segment(self, segment: Segment) -> None:
-        output_path = segment.output_path(
-            self.output_dir, default_ext=self.input_file.suffix
+        """Нарезает один сегмент.
+
+        Если установлен ``cancel_event``, запущенный ffmpeg прерывается,
+        частично записанный файл удаляется и выбрасывается
+        ``ffmpeg_helper.FFmpegCancelledError``; после остановки новые
+        сегменты не запускаются вовсе. Сегмент с неположительной
+        длительностью не нарезается: выбрасывается ``ValueError``, чтобы
+        вызывающий код учёл его среди неудачных.
+        """
+        if self._cancel_event is not None and self._cancel_event.is_set():
+            raise ffmpeg_helper.FFmpegCancelledError("Обработка остановлена")
+        if segment.end is not None and segment.end <= segment.start:
+            raise ValueError(
+                f"Сегмент {segment.index} имеет неположительную длительность"
+            )
+
+        output_path = self._output_path(segment)
+        if self._is_stream_copy(segment):
+            args = self._fast_copy_args(segment, output_path)
+        else:
+            args = self._encode_args(segment, output_path)
+
+        log_info = logger.isEnabledFor(logging.INFO)
+        if log_info:
+            logger.info("Начата обработка сегмента %s", segment.index)
+        try:
+            ffmpeg_helper.run_ffmpeg(args, cancel_event=self._cancel_event)
+        except ffmpeg_helper.FFmpegCancelledError:
+            # Недописанный файл не должен выглядеть как готовый сегмент.
+            output_path.unlink(missing_ok=True)
+            raise
+        if log_info:
+            logger.info("Сегмент %s успешно сохранён в %s", segment.index, output_path)
+
+    @staticmethod
+    def _copies_video(segment: Segment) -> bool:
+        """Копируется ли видеопоток сегмента (начало привязывается к кадру)."""
+
+        return (segment.video_codec or "copy") == "copy"
+
+    @staticmethod
+    def _is_stream_copy(segment: Segment) -> bool:
+        """Проверяет, можно ли сохранить сегмент без перекодирования."""
+
+        return (
+            not segment.convert
+            and (segment.video_codec or "copy") == "copy"
+            and (segment.audio_codec or "copy") == "copy"
         )
-        args: List[str] = [
-            "-ss",
-            ffmpeg_helper.format_seconds(segment.start),
-        ]
+
+    def _seek_args(self, segment: Segment, *, copy_video: bool) -> List[str]:
+        """Формирует параметры поиска и входного файла (всё до ``-i`` включительно)."""
+
+        start = segment.start
+        if copy_video:
+            start = self._snap_to_keyframe(start)
+        args: List[str] = ["-ss", ffmpeg_helper.format_seconds(start)]
+        if copy_video:
+            args += ("-noaccurate_seek",)
         if segment.end is not None:
-            duration = segment.end - segment.start
-            args.extend(["-t", ffmpeg_helper.format_seconds(duration)])
-        args.extend(["-i", str(self.input_file)])
+            duration = segment.end - start
+            args += ("-t", ffmpeg_helper.format_seconds(duration))
+        args += ("-i", self._input_str)
+        return args
 
-        video_codec = segment.video_codec or "copy"
-        args.extend(["-c:v", video_codec])
-        if segment.remove_audio:
-            args.append("-an")
-        else:
-            audio_codec = segment.audio_codec or "copy"
-            args.extend(["-c:a", audio_codec])
-        if segment.convert and video_codec != "copy":
-            args.extend(["-crf", str(segment.crf)])
+    def _load_keyframes(self, starts: Iterable[float]) -> List[float]:
+        """Дочитывает ключевые кадры перед ещё не запрошенными моментами.
+
+        Каждое начало запрашивается у ffprobe не более одного раза. Если
+        ffprobe недоступен или завершился с ошибкой, кадры не добавляются и
+        время начала таких сегментов не корректируется.
+        """
+
+        with self._keyframes_lock:
+            missing = set(starts) - self._keyframe_starts
+            if missing:
+                self._keyframe_starts |= missing
+                try:
+                    found = ffmpeg_helper.probe_keyframes(self.input_file, missing)
+                except Exception as exc:  # noqa: BLE001
+                    logger.warning(
+                        "Не удалось получить ключевые кадры %s: %s",
+                        self.input_file,
+                        exc,
+                    )
+                    found = []
+                if found:
+                    self._keyframes = sorted(set(self._keyframes).union(found))
+            return self._keyframes
+
+    def _snap_to_keyframe(self, value: float) -> float:
+        """Возвращает время ближайшего ключевого кадра не позже ``value``.
+
+        Кадр дальше окна поиска не используется: он найден в окне другого
+        сегмента, и между ним и ``value`` могут быть непрочитанные кадры.
+        """
+
+        keyframes = self._load_keyframes((value,))
+        position = bisect_right(keyframes, value)
+        if position == 0:
+            return value
+        keyframe = keyframes[position - 1]
+        if value - keyframe > ffmpeg_helper.KEYFRAME_SEARCH_WINDOW:
+            return value
+        return keyframe
+
+    def _metadata_args(self) -> List[str]:
+        """Возвращает параметры метаданных согласно настройкам приложения."""
+
+        args: List[str] = []
         strip_metadata = bool(getattr(self._settings, "strip_metadata", False))
         add_svs_metadata = bool(getattr(self._settings, "embed_svs_metadata", False))
 
         if strip_metadata:
-            args.extend(["-map_metadata", "-1"])
+            args += self._STRIP_METADATA_ARGS
 
         if add_svs_metadata:
-            args.extend(["-metadata", f"comment={self.SVS_METADATA_COMMENT}"])
-            args.extend(["-metadata", f"encoder={self.SVS_METADATA_SOFTWARE}"])
-            args.extend(["-metadata", f"software={self.SVS_METADATA_SOFTWARE}"])
+            args += self._SVS_METADATA_ARGS
+        return args
 
-        if segment.convert and segment.extra_args:
-            args.extend(segment.extra_args.split())
-        args.append(str(output_path))
+    def _encoder_tuning_args(self, video_codec: str) -> List[str]:
+        """Параметры производительности кодировщика.
 
-        logger.info("Начата обработка сегмента %s", segment.index)
-        ffmpeg_helper.run_ffmpeg(args)
-        logger.info("Сегмент %s успешно сохранён в %s", segment.index, output_path)
+        ``-threads 0`` передаётся всегда, чтобы кодировщик занял все ядра.
+        Пресет и ``-tune zerolatency`` (режим ``fast_encode``: меньше буферов
+        кадров ценой качества) понимают только x264/x265. Параметры идут до
+        пользовательских ``extra_args``, поэтому последние имеют приоритет.
+        """
+
+        args: List[str] = ["-threads", "0"]
+        if video_codec not in self.X26X_CODECS:
+            return args
+        preset = getattr(self._settings, "preset", None)
+        if preset:
+            args += ("-preset", preset)
+        if getattr(self._settings, "fast_encode", False):
+            args += ("-tune", "zerolatency")
+        return args
+
+    def _fast_copy_args(self, segment: Segment, output_path: Path) -> List[str]:
+        """Минимальная команда для нарезки без перекодирования.
+
+        Используется единый флаг ``-c copy``, поэтому вместе с видео и аудио
+        копируются и субтитры/потоки данных. Все потоки (``-map 0``)
+        сохраняются только при совпадении контейнера с исходным: при смене
+        контейнера часть потоков может оказаться для него недопустимой, и
+        тогда ffmpeg выбирает потоки самостоятельно. CRF и дополнительные
+        параметры на этом пути не применяются.
+        """
+
+        args = self._seek_args(segment, copy_video=True)
+        keep_all_streams = (
+            output_path.suffix.lower() == self.input_file.suffix.lower()
+        )
+        if keep_all_streams:
+            args += ("-map", "0")
+            if segment.remove_audio:
+                args += ("-map", "-0:a")
+        elif segment.remove_audio:
+            args += ("-an",)
+        args += ("-c", "copy", "-avoid_negative_ts", "make_zero")
+        args += self._metadata_args()
+        args += ffmpeg_helper.faststart_args(output_path)
+        args += (str(output_path),)
+        return args
+
+    def _encode_args(self, segment: Segment, output_path: Path) -> List[str]:
+        """Команда для сегмента с перекодированием хотя бы одного потока."""
+
+        video_codec = segment.video_codec or "copy"
+        args = self._seek_args(segment, copy_video=video_codec == "copy")
+
+        if segment.remove_audio:
+            args += ("-c:v", video_codec, "-an")
+        else:
+            args += ("-c:v", video_codec, "-c:a", segment.audio_codec or "copy")
+        if segment.convert and video_codec != "copy":
+            args += ("-crf", str(segment.crf))
+            args += self._encoder_tuning_args(video_codec)
+        args += self._metadata_args()
+
+        extra_args: tuple[str, ...] = ()
+        if segment.convert and segment.extra_args:
+            extra_args = _tokenize_extra(segment.extra_args)
+            args += extra_args
+        args += ffmpeg_helper.faststart_args(output_path, extra_args)
+        args += (str(output_path),)
+        return args
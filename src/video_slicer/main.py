@@ -4,10 +4,6 @@ from __future__ import annotations
 import logging
 import sys
 
-from PySide6 import QtWidgets
-
-from video_slicer.ui.main_window import MainWindow
-
 
 def configure_logging() -> None:
     logging.basicConfig(
@@ -19,7 +15,15 @@ def configure_logging() -> None:
 
 def main() -> int:
     configure_logging()
-    app = QtWidgets.QApplication(sys.argv)
+    # Qt и модули интерфейса импортируются только при запуске GUI, чтобы
+    # импорт пакета (например, ради VideoProcessor) не загружал PySide6.
+    from PySide6 import QtWidgets
+
+    from video_slicer.ui.main_window import MainWindow
+
+    # Повторный запуск в том же процессе (тесты, встраивание) использует уже
+    # созданный экземпляр вместо второго QApplication.
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication(sys.argv)
     window = MainWindow()
     window.show()
     result = app.exec()
@@ -28,4 +32,4 @@ def main() -> int:
 
 
 if __name__ == "__main__":
-    raise SystemExit(main())
+    sys.exit(main())
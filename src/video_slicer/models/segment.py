@@ -2,13 +2,19 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
 
-@dataclass(slots=True)
+@dataclass(frozen=True, slots=True)
 class Segment:
-    """Описание одного фрагмента видео."""
+    """Описание одного фрагмента видео.
+
+    Экземпляры неизменяемы: изменённый сегмент создаётся через
+    ``dataclasses.replace``. Поэтому список сегментов можно передавать в
+    поток обработки без защитного копирования.
+    """
 
     start: float
     end: Optional[float] = None
@@ -28,13 +34,30 @@ class Segment:
         return max(0.0, self.end - self.start)
 
     def output_path(self, output_dir: Path, default_ext: str) -> Path:
-        if self.filename:
-            filename = self.filename
+        return self._compute_output_path(
+            self.filename, self.container, self.index, default_ext, output_dir
+        )
+
+    @staticmethod
+    @lru_cache(maxsize=2048)
+    def _compute_output_path(
+        filename: Optional[str],
+        container: str,
+        index: int,
+        default_ext: str,
+        output_dir: Path,
+    ) -> Path:
+        """Вычисляет путь выходного файла; результат кэшируется по значениям полей.
+
+        Ключ кэша содержит все используемые поля сегмента, поэтому изменение
+        сегмента после вставки не приводит к устаревшему результату.
+        """
+        if filename:
             if "." not in Path(filename).name:
-                filename = f"{filename}.{self.container or default_ext.lstrip('.')}"
+                filename = f"{filename}.{container or default_ext.lstrip('.')}"
         else:
-            extension = self.container or default_ext.lstrip(".")
+            extension = container or default_ext.lstrip(".")
             if not extension.startswith("."):
                 extension = f".{extension}"
-            filename = f"segment_{self.index:03d}{extension}"
+            filename = f"segment_{index:03d}{extension}"
         return output_dir / filename
@@ -1,6 +1,7 @@
 """Диалог для массового создания сегментов из текстового запроса."""
 from __future__ import annotations
 
+import operator
 import re
 from typing import List, Tuple
 
@@ -9,6 +10,14 @@ from PySide6 import QtCore, QtWidgets
 from ..utils.time_parser import parse_time
 from .translations import Translator
 
+# Строка запроса: время, необязательное тире и описание. Пробелы по краям
+# и вокруг тире отбрасываются самим выражением, без отдельных strip().
+_LINE_RE = re.compile(
+    r"\s*(?P<time>(?:\d{1,2}:){1,2}\d{1,2}(?:\.\d{1,3})?|\d+(?:\.\d{1,3})?)"
+    r"\s*(?:(?P<dash>[-–—])\s*)?(?P<title>.*?)\s*"
+)
+_INVALID_SEP_CHARS = frozenset('<>:"/\\|?*')
+
 
 class BulkSegmentDialog(QtWidgets.QDialog):
     """Запрашивает у пользователя список сегментов в текстовом виде."""
@@ -140,8 +149,7 @@ class BulkSegmentDialog(QtWidgets.QDialog):
 
     @staticmethod
     def _contains_invalid_separator_chars(value: str) -> bool:
-        invalid = {'<', '>', ':', '"', '/', '\\', '|', '?', '*'}
-        return any(char in invalid for char in value)
+        return not _INVALID_SEP_CHARS.isdisjoint(value)
 
     def _update_separator_state(self) -> None:
         enabled = (
@@ -154,31 +162,19 @@ class BulkSegmentDialog(QtWidgets.QDialog):
         )
 
     def _parse_lines(self, text: str) -> List[Tuple[float, str | None]]:
-        lines = [line.strip() for line in text.splitlines() if line.strip()]
+        lines = [line for line in text.splitlines() if line and not line.isspace()]
         if not lines:
             raise ValueError(self._translator.tr("bulk_create_error_empty"))
 
-        time_pattern = re.compile(
-            r"^(?P<time>(?:\d{1,2}:){1,2}\d{1,2}(?:\.\d{1,3})?|\d+(?:\.\d{1,3})?)\s*(?P<rest>.*)$"
-        )
         entries: List[Tuple[float, str | None]] = []
         for index, line in enumerate(lines, start=1):
-            match = time_pattern.match(line)
+            match = _LINE_RE.fullmatch(line)
             if not match:
                 raise ValueError(
                     self._translator.tr("bulk_create_error_format").format(line=index)
                 )
-            time_text = match.group("time").strip()
-            remainder = match.group("rest") or ""
-            raw_tail = remainder
-            remainder = remainder.strip()
-
-            has_dash = False
-            if remainder.startswith(("-", "–", "—")):
-                has_dash = True
-                remainder = remainder[1:].strip()
-
-            if has_dash and not remainder:
+            time_text, dash, title = match.group("time", "dash", "title")
+            if dash and not title:
                 raise ValueError(
                     self._translator.tr("bulk_create_error_title").format(line=index)
                 )
@@ -190,13 +186,17 @@ class BulkSegmentDialog(QtWidgets.QDialog):
                     self._translator.tr("bulk_create_error_time").format(line=index)
                 ) from None
 
-            title = remainder if remainder else (raw_tail.strip() or None)
-            entries.append((start_time, title))
+            entries.append((start_time, title or None))
 
-        for idx in range(1, len(entries)):
-            if entries[idx][0] <= entries[idx - 1][0]:
-                raise ValueError(
-                    self._translator.tr("bulk_create_error_order").format(line=idx + 1)
+        starts = [start for start, _ in entries]
+        # Сравнения соседних начал выполняются на уровне C одним проходом;
+        # номер первой строки, нарушающей порядок, берётся из того же списка.
+        in_order = list(map(operator.lt, starts, starts[1:]))
+        if not all(in_order):
+            raise ValueError(
+                self._translator.tr("bulk_create_error_order").format(
+                    line=in_order.index(False) + 2
                 )
+            )
 
         return entries
@@ -3,57 +3,191 @@ from __future__ import annotations
 
 import json
 import logging
+import logging.handlers
+import os
+import queue
 import re
+import threading
+import time
+from collections import OrderedDict
 from dataclasses import replace
 from functools import partial
 from pathlib import Path
-from typing import List
+from typing import TYPE_CHECKING, Callable, List
 
 from PySide6 import QtCore, QtGui, QtWidgets
 
 from ..core.segment_manager import SegmentManager
 from ..models.segment import Segment
 from ..utils import ffmpeg_helper, validators
+from ..utils.probe_cache import ProbeCache
 from ..utils.settings import (
     AppSettings,
     SettingsManager,
     default_log_file,
+    default_probe_cache_file,
     detect_system_language,
 )
 from ..utils.time_parser import format_time, parse_time
-from .bulk_segment_dialog import BulkSegmentDialog
-from .preview_dialog import PreviewDialog
-from .processing_worker import ProcessingWorker
-from .segment_batch_dialog import SegmentBatchDialog
-from .segment_dialog import SegmentDialog
-from .settings_dialog import SettingsDialog
+from .segment_table import SegmentButtonDelegate, SegmentTableModel
 from .translations import Translator
 
+# Диалоги и ProcessingWorker импортируются в методах, которые их открывают:
+# их загрузка не входит во время запуска окна.
+if TYPE_CHECKING:
+    from .processing_worker import ProbeWorker, ProcessingWorker
+
 logger = logging.getLogger(__name__)
 
+# Общий кодировщик JSON: настройки задаются один раз, а ``encode`` собирает
+# документ целиком, и файл записывается одним вызовом ``write``.
+_JSON_ENCODER = json.JSONEncoder(ensure_ascii=False, indent=2)
+
+_VIDEO_FILE_FILTER = "Video Files ({})".format(
+    " ".join(f"*{extension}" for extension in validators.INPUT_EXTENSIONS)
+)
+
+# Форматтер файлового журнала не хранит состояния и разделяется всеми
+# обработчиками.
+_FILE_LOG_FORMATTER = logging.Formatter(
+    "%(asctime)s [%(levelname)s] %(name)s: %(message)s"
+)
+
+# Очистка имён файлов сегментов: запрещённые символы заменяются таблицей
+# str.translate, а пробелы и подчёркивания сжимаются одним готовым шаблоном.
+_FORBIDDEN_FILENAME_CHARS = str.maketrans(dict.fromkeys('\\/:*?"<>|', "_"))
+_FILENAME_SEPARATORS_RE = re.compile(r"[\s_]+")
+
 
 class MainWindow(QtWidgets.QMainWindow):
+    # Иконка приложения строится один раз на процесс и разделяется всеми окнами.
+    _cached_app_icon: QtGui.QIcon | None = None
+    # Логотип окна «О программе», масштабированный при первом открытии.
+    _cached_about_logo: QtGui.QPixmap | None = None
+    # Тёмная тема: цвета ролей палитры и таблица стилей подсказок.
+    _cached_dark_palette: QtGui.QPalette | None = None
+    _DARK_PALETTE_COLORS = (
+        (QtGui.QPalette.ColorRole.Window, (45, 45, 48)),
+        (QtGui.QPalette.ColorRole.WindowText, (220, 220, 220)),
+        (QtGui.QPalette.ColorRole.Base, (30, 30, 30)),
+        (QtGui.QPalette.ColorRole.AlternateBase, (45, 45, 48)),
+        (QtGui.QPalette.ColorRole.ToolTipBase, (255, 255, 255)),
+        (QtGui.QPalette.ColorRole.ToolTipText, (45, 45, 48)),
+        (QtGui.QPalette.ColorRole.Text, (230, 230, 230)),
+        (QtGui.QPalette.ColorRole.Button, (60, 63, 65)),
+        (QtGui.QPalette.ColorRole.ButtonText, (230, 230, 230)),
+        (QtGui.QPalette.ColorRole.BrightText, (255, 59, 48)),
+        (QtGui.QPalette.ColorRole.Highlight, (98, 114, 164)),
+        (QtGui.QPalette.ColorRole.HighlightedText, (255, 255, 255)),
+    )
+    _DARK_STYLESHEET = (
+        "QToolTip { color: #1e1e1e; background-color: #f5f5f5; border: 1px solid #333; }"
+    )
+    SETTINGS_SAVE_DELAY_MS = 500
+    LOG_FLUSH_INTERVAL_MS = 100
+    # Записей в памяти до сброса файла журнала (ошибки сбрасываются сразу).
+    FILE_LOG_BUFFER_CAPACITY = 512
+    PROBE_CACHE_SIZE = 128
+    PROBE_DISK_CACHE_SIZE = 512
+    # Переводимые подписи: атрибут виджета или действия и ключ перевода.
+    _TEXT_KEYS = (
+        ("file_label", "file_label"),
+        ("output_label", "output_label"),
+        ("progress_label", "progress_label"),
+        ("progress_info_label", "progress_idle"),
+        ("log_label", "log_label"),
+        ("settings_action", "settings_title"),
+        ("manual_action", "help_manual"),
+        ("download_ffmpeg_action", "menu_download_ffmpeg"),
+        ("about_action", "help_about"),
+    )
+    # Кнопки: атрибут, ключ подписи и ключ всплывающей подсказки.
+    _BUTTON_KEYS = (
+        ("file_button", "browse", "tooltip_file"),
+        ("metadata_button", "metadata_button", "metadata_tooltip"),
+        ("output_button", "browse", "tooltip_output"),
+        ("add_button", "add_segment", "tooltip_add"),
+        ("edit_button", "edit_segment", "tooltip_edit"),
+        ("remove_button", "remove_segment", "tooltip_remove"),
+        ("duplicate_button", "duplicate_segment", "tooltip_duplicate"),
+        ("save_button", "save_segments", "tooltip_save_segments"),
+        ("load_button", "load_segments", "tooltip_load_segments"),
+        ("generate_button", "bulk_create_button", "bulk_create_tooltip"),
+        ("process_button", "process", "tooltip_process"),
+        ("stop_button", "stop", "tooltip_stop"),
+        ("bulk_edit_button", "bulk_edit_segments", "tooltip_bulk_edit"),
+        ("clear_button", "clear_segments", "tooltip_clear_segments"),
+        ("copy_log_button", "copy_log", "tooltip_copy_log"),
+    )
+    # Шаблоны сообщений о ходе обработки, переводимые один раз на смену языка.
+    _PROGRESS_TEMPLATE_KEYS = (
+        "progress_template",
+        "status_processing_segment",
+        "log_processing_segment",
+        "log_segment_done",
+        "log_segment_failed",
+    )
+
     def __init__(self) -> None:
         super().__init__()
+        # Окно создаётся после QApplication, ссылка на неё не меняется.
+        self._app = QtWidgets.QApplication.instance()
         self.settings_manager = SettingsManager()
         self.app_settings: AppSettings = self.settings_manager.load()
+        self._saved_settings = self.app_settings.clone()
+        # Сохранение настроек откладывается, чтобы серия изменений дала одну
+        # запись на диск.
+        self._settings_save_pending = False
+        self._settings_save_timer = QtCore.QTimer(self)
+        self._settings_save_timer.setSingleShot(True)
+        self._settings_save_timer.setInterval(self.SETTINGS_SAVE_DELAY_MS)
+        self._settings_save_timer.timeout.connect(self._flush_settings_save)
+        # Строки журнала копятся и выводятся в консоль пачкой по таймеру.
+        self._log_buffer: list[str] = []
+        self._pending_progress_texts: tuple[str, str] | None = None
+        self._log_flush_timer = QtCore.QTimer(self)
+        self._log_flush_timer.setSingleShot(True)
+        self._log_flush_timer.setInterval(self.LOG_FLUSH_INTERVAL_MS)
+        self._log_flush_timer.timeout.connect(self._flush_log)
         if not self.app_settings.language:
             self.app_settings.language = detect_system_language()
-            self.settings_manager.save(self.app_settings)
+            self._schedule_settings_save()
 
         self.translator = Translator(self.app_settings.language or "en")
+        self._applied_language: str | None = None
         self.segment_manager = SegmentManager()
         self.input_file: Path | None = None
+        # Домашний каталог — начальная папка диалогов выбора файлов.
+        self._home_dir = str(Path.home())
         self.output_dir: Path | None = None
         self._file_info: dict[str, object] | None = None
         self._probe_data: dict[str, object] | None = None
-        self._segment_probe_cache: dict[Path, dict[str, object]] = {}
-        self._stop_requested = False
-        self._log_file_handler: logging.Handler | None = None
+        self._probe_json_cache: tuple[dict[str, object], str] | None = None
+        # Справочные окна строятся при первом открытии и затем переиспользуются;
+        # при смене языка они удаляются и собираются заново.
+        self._info_dialogs: dict[str, QtWidgets.QDialog] = {}
+        self._json_dialogs: dict[
+            str, tuple[QtWidgets.QDialog, QtWidgets.QLabel, QtWidgets.QPlainTextEdit]
+        ] = {}
+        self._json_dialog_texts: dict[str, str] = {}
+        self._probe_cache: OrderedDict[
+            tuple[str, int, int, bool], dict[str, object]
+        ] = OrderedDict()
+        self._probe_disk_cache = ProbeCache(
+            default_probe_cache_file(), self.PROBE_DISK_CACHE_SIZE
+        )
+        # Общий с ProcessingWorker флаг остановки обработки.
+        self._stop_event = threading.Event()
+        self._log_file_handler: logging.handlers.MemoryHandler | None = None
+        self._log_queue_handler: logging.handlers.QueueHandler | None = None
+        self._log_listener: logging.handlers.QueueListener | None = None
         self._ffmpeg_available = True
         self._interface_locked = False
         self._processing_thread: QtCore.QThread | None = None
         self._processing_worker: ProcessingWorker | None = None
+        self._probe_thread: QtCore.QThread | None = None
+        self._probe_worker: ProbeWorker | None = None
+        self._pending_probe: tuple[Path, os.stat_result] | None = None
         self._button_translation_keys: dict[QtWidgets.QAbstractButton, str] = {}
         self._button_icon_map: dict[
             QtWidgets.QAbstractButton, QtWidgets.QStyle.StandardPixmap
@@ -69,36 +203,70 @@ class MainWindow(QtWidgets.QMainWindow):
         self._create_status_bar()
         self._apply_theme(self.app_settings.theme)
         self._apply_ffmpeg_path()
-        self._configure_file_logging()
         self.retranslate_ui()
         self._check_ffmpeg_availability(initial=True)
+        # Файл журнала открывается после первой отрисовки окна: создание
+        # каталога и открытие файла не задерживают появление интерфейса.
+        QtCore.QTimer.singleShot(0, self, self._configure_file_logging)
+
+    @property
+    def input_file(self) -> Path | None:
+        return self._input_file
+
+    @input_file.setter
+    def input_file(self, value: Path | None) -> None:
+        self._input_file = value
+        # Контейнер по умолчанию зависит только от входного файла, поэтому
+        # вычисляется при его смене, а не при каждом обновлении таблицы.
+        suffix = value.suffix.lstrip(".") if value else ""
+        self._default_container = suffix or "mp4"
+
+    def closeEvent(self, event: QtGui.QCloseEvent) -> None:
+        self._flush_settings_save()
+        if self._probe_thread is not None:
+            self._stop_probe_thread()
+        self._probe_disk_cache.save()
+        self._stop_log_listener()
+        if self._log_file_handler:
+            self._log_file_handler.flush()
+        super().closeEvent(event)
+
+    def _schedule_settings_save(self) -> None:
+        """Запускает (или перезапускает) отложенное сохранение настроек."""
 
-    def _create_app_icon(self) -> QtGui.QIcon:
+        self._settings_save_pending = True
+        self._settings_save_timer.start()
+
+    @QtCore.Slot()
+    def _flush_settings_save(self) -> None:
+        """Немедленно сохраняет настройки, если запись была запланирована."""
+
+        self._settings_save_timer.stop()
+        if self._settings_save_pending:
+            self._settings_save_pending = False
+            # Серия изменений могла вернуть настройки к сохранённым значениям.
+            if self.app_settings != self._saved_settings:
+                self.settings_manager.save(self.app_settings)
+                self._saved_settings = self.app_settings.clone()
+
+    @classmethod
+    def _create_app_icon(cls) -> QtGui.QIcon:
+        if cls._cached_app_icon is None:
+            MainWindow._cached_app_icon = cls._load_app_icon()
+        return cls._cached_app_icon
+
+    @classmethod
+    def _load_app_icon(cls) -> QtGui.QIcon:
+        # QIcon масштабирует изображение сам, по запросу нужного размера, и
+        # запоминает результат; заранее готовить набор размеров не нужно.
         icon_path = Path(__file__).resolve().parent.parent / "logo.ico"
-        pixmap = QtGui.QPixmap(str(icon_path))
-
-        if pixmap.isNull():
-            return self._create_fallback_app_icon()
-
-        icon = QtGui.QIcon()
-        for size in (16, 24, 32, 48, 64, 128, 256):
-            scaled_pixmap = pixmap.scaled(
-                size,
-                size,
-                QtCore.Qt.AspectRatioMode.KeepAspectRatio,
-                QtCore.Qt.TransformationMode.SmoothTransformation,
-            )
-            icon.addPixmap(
-                scaled_pixmap,
-                QtGui.QIcon.Mode.Normal,
-                QtGui.QIcon.State.Off,
-            )
+        icon = QtGui.QIcon(str(icon_path))
         if icon.isNull():
-            return self._create_fallback_app_icon()
-
+            return cls._create_fallback_app_icon()
         return icon
 
-    def _create_fallback_app_icon(self) -> QtGui.QIcon:
+    @staticmethod
+    def _create_fallback_app_icon() -> QtGui.QIcon:
         pixmap = QtGui.QPixmap(256, 256)
         pixmap.fill(QtCore.Qt.GlobalColor.transparent)
 
@@ -115,13 +283,18 @@ class MainWindow(QtWidgets.QMainWindow):
         painter.setBrush(QtGui.QColor(0, 0, 0, 90))
         painter.drawRoundedRect(body_rect, 28, 28)
 
-        hole_brush = QtGui.QBrush(QtGui.QColor("#ffffff"))
+        # Перфорация плёнки: все отверстия собираются в один путь и рисуются
+        # одним вызовом текущим пером рамки.
         hole_radius = 10
-        x_positions = [body_rect.left() + 28 + i * ((body_rect.width() - 56) / 4) for i in range(5)]
-        for x in x_positions:
-            for y in (body_rect.top() + 22, body_rect.bottom() - 22):
-                painter.setBrush(hole_brush)
-                painter.drawEllipse(QtCore.QPoint(int(x), int(y)), hole_radius, hole_radius)
+        hole_step = (body_rect.width() - 56) // 4
+        hole_rows = (body_rect.top() + 22, body_rect.bottom() - 22)
+        holes = QtGui.QPainterPath()
+        for i in range(5):
+            x = body_rect.left() + 28 + i * hole_step
+            for y in hole_rows:
+                holes.addEllipse(QtCore.QPointF(x, y), hole_radius, hole_radius)
+        painter.setBrush(QtGui.QColor("#ffffff"))
+        painter.drawPath(holes)
 
         painter.setBrush(QtGui.QColor("#ffeb3b"))
         painter.setPen(QtGui.QPen(QtGui.QColor("#ffeb3b"), 6))
@@ -205,7 +378,18 @@ class MainWindow(QtWidgets.QMainWindow):
         output_layout.addWidget(self.output_line)
         output_layout.addWidget(self.output_button)
 
-        self.table = QtWidgets.QTableWidget(0, 8)
+        self._segment_model = SegmentTableModel(
+            self.segment_manager,
+            self.translator,
+            self._resolve_segment_output_path,
+            self,
+        )
+        self.table = QtWidgets.QTableView()
+        self.table.setModel(self._segment_model)
+        self._button_delegate = SegmentButtonDelegate(self.table)
+        self._button_delegate.clicked.connect(self._on_table_button_clicked)
+        for column in SegmentTableModel.BUTTON_COLUMNS:
+            self.table.setItemDelegateForColumn(column, self._button_delegate)
         self.table.setSelectionBehavior(
             QtWidgets.QAbstractItemView.SelectionBehavior.SelectRows
         )
@@ -224,8 +408,10 @@ class MainWindow(QtWidgets.QMainWindow):
         header.setSectionResizeMode(6, QtWidgets.QHeaderView.ResizeMode.ResizeToContents)
         header.setSectionResizeMode(7, QtWidgets.QHeaderView.ResizeMode.ResizeToContents)
         self.table.verticalHeader().setVisible(False)
-        self.table.itemDoubleClicked.connect(self.edit_segment)
-        self.table.itemSelectionChanged.connect(self._on_table_selection_changed)
+        self.table.doubleClicked.connect(self._on_table_double_clicked)
+        self.table.selectionModel().selectionChanged.connect(
+            self._on_table_selection_changed
+        )
 
         button_layout = QtWidgets.QHBoxLayout()
         self.add_button = QtWidgets.QPushButton()
@@ -306,9 +492,11 @@ class MainWindow(QtWidgets.QMainWindow):
         self.progress_bar.setValue(0)
 
         self.log_label = QtWidgets.QLabel()
-        self.log_console = QtWidgets.QPlainTextEdit()
-        self.log_console.setReadOnly(True)
-        self.log_console.setMaximumBlockCount(500)
+        # Консоль журнала создаётся при выводе первой строки (см.
+        # ``_ensure_log_console``); до этого место занимает пустая рамка.
+        self.log_console: QtWidgets.QPlainTextEdit | None = None
+        self._log_console_placeholder = QtWidgets.QFrame()
+        self._log_console_placeholder.setFrameShape(QtWidgets.QFrame.Shape.StyledPanel)
 
         self.process_button = QtWidgets.QPushButton()
         self.process_button.clicked.connect(self.process_segments)
@@ -349,7 +537,8 @@ class MainWindow(QtWidgets.QMainWindow):
         log_layout = QtWidgets.QVBoxLayout(log_container)
         log_layout.setContentsMargins(0, 0, 0, 0)
         log_layout.addWidget(self.log_label)
-        log_layout.addWidget(self.log_console)
+        log_layout.addWidget(self._log_console_placeholder)
+        self._log_layout = log_layout
 
         self.main_splitter = QtWidgets.QSplitter(QtCore.Qt.Orientation.Vertical)
         self.main_splitter.addWidget(table_container)
@@ -372,21 +561,27 @@ class MainWindow(QtWidgets.QMainWindow):
         button: QtWidgets.QAbstractButton,
         icon_id: QtWidgets.QStyle.StandardPixmap,
     ) -> None:
+        # Иконка назначается в _update_button_icons при применении темы.
         self._button_icon_map[button] = icon_id
-        button.setIcon(self.style().standardIcon(icon_id))
         button.setIconSize(QtCore.QSize(20, 20))
 
     def _update_button_icons(self) -> None:
         style = self.style()
+        # Одна стандартная иконка может использоваться несколькими кнопками.
+        icons: dict[QtWidgets.QStyle.StandardPixmap, QtGui.QIcon] = {}
         for button, icon_id in self._button_icon_map.items():
-            button.setIcon(style.standardIcon(icon_id))
+            icon = icons.get(icon_id)
+            if icon is None:
+                icon = icons[icon_id] = style.standardIcon(icon_id)
+            button.setIcon(icon)
 
     def _set_button_key(self, button: QtWidgets.QAbstractButton, key: str) -> None:
         self._button_translation_keys[button] = key
 
     def _update_button_labels(self) -> None:
+        tr = self.translator.tr
         for button, key in self._button_translation_keys.items():
-            text = self.translator.tr(key)
+            text = tr(key)
             if self.app_settings.use_icon_buttons:
                 button.setText("")
             else:
@@ -394,81 +589,60 @@ class MainWindow(QtWidgets.QMainWindow):
             button.setAccessibleName(text)
 
     def retranslate_ui(self) -> None:
-        self.file_label.setText(self.translator.tr("file_label"))
-        self._set_button_key(self.file_button, "browse")
-        self._set_button_key(self.metadata_button, "metadata_button")
-        self.output_label.setText(self.translator.tr("output_label"))
-        self._set_button_key(self.output_button, "browse")
-        self.file_button.setToolTip(self.translator.tr("tooltip_file"))
-        self.output_button.setToolTip(self.translator.tr("tooltip_output"))
-        self.metadata_button.setToolTip(self.translator.tr("metadata_tooltip"))
-        self._set_button_key(self.add_button, "add_segment")
-        self.add_button.setToolTip(self.translator.tr("tooltip_add"))
-        self._set_button_key(self.edit_button, "edit_segment")
-        self.edit_button.setToolTip(self.translator.tr("tooltip_edit"))
-        self._set_button_key(self.remove_button, "remove_segment")
-        self.remove_button.setToolTip(self.translator.tr("tooltip_remove"))
-        self._set_button_key(self.duplicate_button, "duplicate_segment")
-        self.duplicate_button.setToolTip(self.translator.tr("tooltip_duplicate"))
-        self._set_button_key(self.save_button, "save_segments")
-        self.save_button.setToolTip(self.translator.tr("tooltip_save_segments"))
-        self._set_button_key(self.load_button, "load_segments")
-        self.load_button.setToolTip(self.translator.tr("tooltip_load_segments"))
-        self._set_button_key(self.generate_button, "bulk_create_button")
-        self.generate_button.setToolTip(self.translator.tr("bulk_create_tooltip"))
-        self._set_button_key(self.process_button, "process")
-        self.process_button.setToolTip(self.translator.tr("tooltip_process"))
-        self._set_button_key(self.stop_button, "stop")
-        self.stop_button.setToolTip(self.translator.tr("tooltip_stop"))
-        self._set_button_key(self.bulk_edit_button, "bulk_edit_segments")
-        self.bulk_edit_button.setToolTip(self.translator.tr("tooltip_bulk_edit"))
-        self._set_button_key(self.clear_button, "clear_segments")
-        self.clear_button.setToolTip(self.translator.tr("tooltip_clear_segments"))
-        self._set_button_key(self.copy_log_button, "copy_log")
-        self.copy_log_button.setToolTip(self.translator.tr("tooltip_copy_log"))
-        self.file_line.setToolTip(self.file_line.text())
-        self.output_line.setToolTip(self.output_line.text())
-        self.table.setToolTip(self.translator.tr("segment_table"))
-        self.progress_label.setText(self.translator.tr("progress_label"))
-        self.progress_info_label.setText(self.translator.tr("progress_idle"))
-        self.log_label.setText(self.translator.tr("log_label"))
-        self.main_menu.setTitle(self.translator.tr("main_menu"))
-        self.settings_action.setText(self.translator.tr("settings_title"))
-        self.manual_action.setText(self.translator.tr("help_manual"))
-        self.download_ffmpeg_action.setText(
-            self.translator.tr("menu_download_ffmpeg")
-        )
-        self.about_action.setText(self.translator.tr("help_about"))
-        self.status_bar.showMessage(self.translator.tr("status_ready"))
-        if not self._ffmpeg_available:
-            self.status_bar.showMessage(self.translator.tr("status_ffmpeg_missing"))
+        # Повторный вызов без смены языка ничего не меняет в подписях.
+        if self._applied_language == self.translator.language:
+            return
+        self._discard_cached_dialogs()
+        tr = self.translator.tr
+        self._progress_templates = {key: tr(key) for key in self._PROGRESS_TEMPLATE_KEYS}
+        # setText у Qt сам пропускает неизменившийся текст, а setToolTip
+        # рассылает событие всегда, поэтому подсказки сравниваются заранее.
+        for name, key in self._TEXT_KEYS:
+            getattr(self, name).setText(tr(key))
+        for name, text_key, tooltip_key in self._BUTTON_KEYS:
+            button = getattr(self, name)
+            self._set_button_key(button, text_key)
+            self._set_tooltip(button, tr(tooltip_key))
+        self._set_tooltip(self.file_line, self.file_line.text())
+        self._set_tooltip(self.output_line, self.output_line.text())
+        self._set_tooltip(self.table, tr("segment_table"))
+        self.main_menu.setTitle(tr("main_menu"))
+        self.status_bar.showMessage(
+            tr("status_ready" if self._ffmpeg_available else "status_ffmpeg_missing")
+        )
         self._update_table_headers()
         if self._file_info:
             self.file_info_label.setText(self._format_file_info(self._file_info))
         self._update_segment_controls_state()
         self._update_button_labels()
+        self._applied_language = self.translator.language
+
+    @staticmethod
+    def _set_tooltip(widget: QtWidgets.QWidget, text: str) -> None:
+        if widget.toolTip() != text:
+            widget.setToolTip(text)
 
     def _update_table_headers(self) -> None:
-        headers = [
-            "#",
-            self.translator.tr("filename"),
-            self.translator.tr("start_time"),
-            self.translator.tr("end_time"),
-            self.translator.tr("format"),
-            self.translator.tr("convert_column"),
-            self.translator.tr("segment_metadata_column"),
-            self.translator.tr("preview"),
-        ]
-        for idx, text in enumerate(headers):
-            item = self.table.horizontalHeaderItem(idx)
-            if item:
-                item.setText(text)
-            else:
-                self.table.setHorizontalHeaderItem(idx, QtWidgets.QTableWidgetItem(text))
+        self._segment_model.retranslate()
 
+    @QtCore.Slot()
     def _on_table_selection_changed(self) -> None:
         self._update_selection_controls()
 
+    @QtCore.Slot(QtCore.QModelIndex)
+    def _on_table_double_clicked(self, index: QtCore.QModelIndex) -> None:
+        if index.column() in SegmentTableModel.BUTTON_COLUMNS:
+            return
+        self.edit_segment()
+
+    @QtCore.Slot(QtCore.QModelIndex)
+    def _on_table_button_clicked(self, index: QtCore.QModelIndex) -> None:
+        row = index.row()
+        if index.column() == SegmentTableModel.METADATA_COLUMN:
+            self._show_segment_metadata_dialog(self._segment_model.output_path(row))
+        elif index.column() == SegmentTableModel.PREVIEW_COLUMN:
+            self._show_preview_for_row(row)
+
     def _selected_rows(self) -> List[int]:
         selection = self.table.selectionModel()
         if not selection:
@@ -479,15 +653,18 @@ class MainWindow(QtWidgets.QMainWindow):
         selection = self.table.selectionModel()
         if not selection:
             return
-        selection.clearSelection()
+        # Одно выделение на все строки: selectionChanged срабатывает один раз.
+        items = QtCore.QItemSelection()
+        row_count = self._segment_model.rowCount()
         for row in rows:
-            if 0 <= row < self.table.rowCount():
-                index = self.table.model().index(row, 0)
-                selection.select(
-                    index,
-                    QtCore.QItemSelectionModel.SelectionFlag.Select
-                    | QtCore.QItemSelectionModel.SelectionFlag.Rows,
-                )
+            if 0 <= row < row_count:
+                index = self._segment_model.index(row, 0)
+                items.select(index, index)
+        selection.select(
+            items,
+            QtCore.QItemSelectionModel.SelectionFlag.ClearAndSelect
+            | QtCore.QItemSelectionModel.SelectionFlag.Rows,
+        )
 
     def _update_selection_controls(self, base_enabled: bool | None = None) -> None:
         if base_enabled is None:
@@ -525,11 +702,14 @@ class MainWindow(QtWidgets.QMainWindow):
             return
         self.app_settings.language = language
         self.translator.set_language(language)
-        self.settings_manager.save(self.app_settings)
+        self._schedule_settings_save()
         self.retranslate_ui()
         self._refresh_table()
 
+    @QtCore.Slot()
     def open_settings(self) -> None:
+        from .settings_dialog import SettingsDialog
+
         dialog = SettingsDialog(self, self.translator, self.app_settings)
         if dialog.exec() != QtWidgets.QDialog.DialogCode.Accepted:
             return
@@ -566,9 +746,13 @@ class MainWindow(QtWidgets.QMainWindow):
         if icon_mode_changed:
             self._update_button_labels()
             self._refresh_table()
-        self.settings_manager.save(self.app_settings)
+        self._schedule_settings_save()
 
+    @QtCore.Slot()
     def show_manual(self) -> None:
+        self._info_dialog("manual", self._build_manual_dialog).exec()
+
+    def _build_manual_dialog(self) -> QtWidgets.QDialog:
         dialog = QtWidgets.QDialog(self)
         dialog.setWindowTitle(self.translator.tr("help_manual"))
         layout = QtWidgets.QVBoxLayout(dialog)
@@ -577,6 +761,31 @@ class MainWindow(QtWidgets.QMainWindow):
         text.setReadOnly(True)
         text.setMinimumSize(500, 400)
         layout.addWidget(text)
+        layout.addWidget(self._close_button_box(dialog))
+        return dialog
+
+    def _info_dialog(
+        self, name: str, build: Callable[[], QtWidgets.QDialog]
+    ) -> QtWidgets.QDialog:
+        """Возвращает справочное окно, создавая его при первом обращении."""
+
+        dialog = self._info_dialogs.get(name)
+        if dialog is None:
+            dialog = self._info_dialogs[name] = build()
+        return dialog
+
+    def _discard_cached_dialogs(self) -> None:
+        for dialog in self._info_dialogs.values():
+            dialog.deleteLater()
+        for dialog, _header, _text in self._json_dialogs.values():
+            dialog.deleteLater()
+        self._info_dialogs.clear()
+        self._json_dialogs.clear()
+        self._json_dialog_texts.clear()
+
+    def _close_button_box(
+        self, dialog: QtWidgets.QDialog
+    ) -> QtWidgets.QDialogButtonBox:
         button_box = QtWidgets.QDialogButtonBox(
             QtWidgets.QDialogButtonBox.StandardButton.Close
         )
@@ -585,14 +794,15 @@ class MainWindow(QtWidgets.QMainWindow):
             close_button.setText(self.translator.tr("preview_close"))
         button_box.rejected.connect(dialog.reject)
         button_box.accepted.connect(dialog.accept)
-        layout.addWidget(button_box)
-        dialog.exec()
+        return button_box
 
+    @QtCore.Slot()
     def open_ffmpeg_download(self) -> None:
         QtGui.QDesktopServices.openUrl(
             QtCore.QUrl("https://ffmpeg.org/download.html")
         )
 
+    @QtCore.Slot()
     def show_metadata(self) -> None:
         if not self.input_file or not self._probe_data:
             QtWidgets.QMessageBox.information(
@@ -602,36 +812,11 @@ class MainWindow(QtWidgets.QMainWindow):
             )
             return
 
-        dialog = QtWidgets.QDialog(self)
-        dialog.setWindowTitle(self.translator.tr("metadata_dialog_title"))
-        dialog.setModal(True)
-        dialog.resize(640, 520)
-
-        layout = QtWidgets.QVBoxLayout(dialog)
-        header = QtWidgets.QLabel(
-            self.translator.tr("metadata_file_label").format(path=str(self.input_file))
-        )
-        header.setTextInteractionFlags(
-            QtCore.Qt.TextInteractionFlag.TextSelectableByMouse
-        )
-        layout.addWidget(header)
-
-        text = QtWidgets.QPlainTextEdit()
-        text.setPlainText(json.dumps(self._probe_data, ensure_ascii=False, indent=2))
-        text.setReadOnly(True)
-        layout.addWidget(text)
-
-        button_box = QtWidgets.QDialogButtonBox(
-            QtWidgets.QDialogButtonBox.StandardButton.Close
+        self._show_json_dialog(
+            "metadata_dialog_title",
+            self.translator.tr("metadata_file_label").format(path=str(self.input_file)),
+            self._probe_json_text(self._probe_data),
         )
-        close_button = button_box.button(QtWidgets.QDialogButtonBox.StandardButton.Close)
-        if close_button:
-            close_button.setText(self.translator.tr("preview_close"))
-        button_box.accepted.connect(dialog.accept)
-        button_box.rejected.connect(dialog.reject)
-        layout.addWidget(button_box)
-
-        dialog.exec()
 
     def _show_segment_metadata_dialog(self, path: Path | None) -> None:
         if not path or not path.exists():
@@ -648,10 +833,7 @@ class MainWindow(QtWidgets.QMainWindow):
             resolved_path = path
 
         try:
-            probe_data = self._segment_probe_cache.get(resolved_path)
-            if probe_data is None:
-                probe_data = ffmpeg_helper.probe_file(resolved_path)
-                self._segment_probe_cache[resolved_path] = probe_data
+            probe_data = self._probe_file(resolved_path)
         except Exception as exc:  # noqa: BLE001
             QtWidgets.QMessageBox.critical(
                 self,
@@ -660,40 +842,86 @@ class MainWindow(QtWidgets.QMainWindow):
             )
             return
 
-        dialog = QtWidgets.QDialog(self)
-        dialog.setWindowTitle(self.translator.tr("segment_metadata_dialog_title"))
-        dialog.setModal(True)
-        dialog.resize(640, 520)
-
-        layout = QtWidgets.QVBoxLayout(dialog)
-        header = QtWidgets.QLabel(
+        self._show_json_dialog(
+            "segment_metadata_dialog_title",
             self.translator.tr("segment_metadata_file_label").format(
                 path=str(resolved_path)
-            )
+            ),
+            _JSON_ENCODER.encode(probe_data),
         )
-        header.setTextInteractionFlags(
-            QtCore.Qt.TextInteractionFlag.TextSelectableByMouse
-        )
-        layout.addWidget(header)
 
-        text = QtWidgets.QPlainTextEdit()
-        text.setPlainText(json.dumps(probe_data, ensure_ascii=False, indent=2))
-        text.setReadOnly(True)
-        layout.addWidget(text)
+    def _show_json_dialog(self, title_key: str, header_text: str, text: str) -> None:
+        """Показывает данные ffprobe в окне, созданном при первом открытии."""
 
-        button_box = QtWidgets.QDialogButtonBox(
-            QtWidgets.QDialogButtonBox.StandardButton.Close
-        )
-        close_button = button_box.button(QtWidgets.QDialogButtonBox.StandardButton.Close)
-        if close_button:
-            close_button.setText(self.translator.tr("preview_close"))
-        button_box.accepted.connect(dialog.accept)
-        button_box.rejected.connect(dialog.reject)
-        layout.addWidget(button_box)
+        entry = self._json_dialogs.get(title_key)
+        if entry is None:
+            dialog = QtWidgets.QDialog(self)
+            dialog.setWindowTitle(self.translator.tr(title_key))
+            dialog.setModal(True)
+            dialog.resize(640, 520)
 
+            layout = QtWidgets.QVBoxLayout(dialog)
+            header = QtWidgets.QLabel()
+            header.setTextInteractionFlags(
+                QtCore.Qt.TextInteractionFlag.TextSelectableByMouse
+            )
+            layout.addWidget(header)
+
+            text_edit = QtWidgets.QPlainTextEdit()
+            text_edit.setReadOnly(True)
+            layout.addWidget(text_edit)
+            layout.addWidget(self._close_button_box(dialog))
+            entry = self._json_dialogs[title_key] = (dialog, header, text_edit)
+
+        dialog, header, text_edit = entry
+        header.setText(header_text)
+        # Тот же документ (например, повторный показ входного файла) заново
+        # не раскладывается.
+        if self._json_dialog_texts.get(title_key) is not text:
+            text_edit.setPlainText(text)
+            self._json_dialog_texts[title_key] = text
+        text_edit.moveCursor(QtGui.QTextCursor.MoveOperation.Start)
         dialog.exec()
 
+    @classmethod
+    def _about_logo(cls) -> QtGui.QPixmap:
+        """Логотип 96×96 для окна «О программе», читаемый с диска один раз."""
+
+        if cls._cached_about_logo is None:
+            base_path = Path(__file__).resolve().parent.parent
+            pixmap = QtGui.QPixmap(str(base_path / "logo.ico"))
+            if pixmap.isNull():
+                pixmap = QtGui.QPixmap(str(base_path / "logo.png"))
+            if not pixmap.isNull():
+                pixmap = pixmap.scaled(
+                    96,
+                    96,
+                    QtCore.Qt.AspectRatioMode.KeepAspectRatio,
+                    QtCore.Qt.TransformationMode.SmoothTransformation,
+                )
+            MainWindow._cached_about_logo = pixmap
+        return cls._cached_about_logo
+
+    def _probe_json_text(self, probe_data: dict[str, object]) -> str:
+        """JSON данных ffprobe для окна метаинформации.
+
+        Данные из кэша проб не изменяются, поэтому текст последнего
+        показанного объекта запоминается и повторно не сериализуется.
+        """
+
+        cached = self._probe_json_cache
+        if cached is None or cached[0] is not probe_data:
+            cached = self._probe_json_cache = (
+                probe_data,
+                _JSON_ENCODER.encode(probe_data),
+            )
+        return cached[1]
+
+    @QtCore.Slot()
     def show_about(self) -> None:
+        self._info_dialog("about", self._build_about_dialog).exec()
+
+    def _build_about_dialog(self) -> QtWidgets.QDialog:
         dialog = QtWidgets.QDialog(self)
         dialog.setWindowTitle(self.translator.tr("help_about"))
         dialog.setModal(True)
@@ -707,19 +935,9 @@ class MainWindow(QtWidgets.QMainWindow):
         header_layout.setSpacing(16)
 
         logo_label = QtWidgets.QLabel()
-        base_path = Path(__file__).resolve().parent.parent
-        pixmap = QtGui.QPixmap(str(base_path / "logo.ico"))
-        if pixmap.isNull():
-            pixmap = QtGui.QPixmap(str(base_path / "logo.png"))
+        pixmap = self._about_logo()
         if not pixmap.isNull():
-            logo_label.setPixmap(
-                pixmap.scaled(
-                    96,
-                    96,
-                    QtCore.Qt.AspectRatioMode.KeepAspectRatio,
-                    QtCore.Qt.TransformationMode.SmoothTransformation,
-                )
-            )
+            logo_label.setPixmap(pixmap)
             logo_label.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
             header_layout.addWidget(logo_label)
 
@@ -766,64 +984,124 @@ class MainWindow(QtWidgets.QMainWindow):
         footer.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
         footer.setStyleSheet("color: #607d8b; font-style: italic;")
         layout.addWidget(footer)
+        layout.addWidget(self._close_button_box(dialog))
+        return dialog
 
-        button_box = QtWidgets.QDialogButtonBox(
-            QtWidgets.QDialogButtonBox.StandardButton.Close
-        )
-        close_button = button_box.button(QtWidgets.QDialogButtonBox.StandardButton.Close)
-        if close_button:
-            close_button.setText(self.translator.tr("preview_close"))
-        button_box.rejected.connect(dialog.reject)
-        button_box.accepted.connect(dialog.accept)
-        layout.addWidget(button_box)
-
-        dialog.exec()
-
+    @QtCore.Slot()
     def select_input_file(self) -> None:
         start_dir = (
             self.app_settings.last_input_dir
             or (str(self.input_file.parent) if self.input_file else None)
-            or str(Path.home())
+            or self._home_dir
         )
         file_path, _ = QtWidgets.QFileDialog.getOpenFileName(
             self,
             self.translator.tr("file_label"),
             start_dir,
-            "Video Files (*.mp4 *.avi *.mkv *.webm *.mov *.flv *.wmv *.mpg *.mpeg *.m4v *.3gp)",
+            _VIDEO_FILE_FILTER,
         )
-        if file_path:
-            try:
-                validators.validate_input_file(file_path)
-                self.input_file = Path(file_path)
-                self.file_line.setText(file_path)
-                self.file_line.setToolTip(file_path)
-                logger.info("Выбран входной файл: %s", file_path)
-                probe_data = ffmpeg_helper.probe_file(self.input_file)
-                self._probe_data = probe_data
-                info = self._extract_file_info(probe_data)
-                self._file_info = info
-                self.file_info_label.setText(self._format_file_info(info))
-                self._handle_metadata_chapters(probe_data)
-                self.app_settings.last_input_dir = str(self.input_file.parent)
-                self.settings_manager.save(self.app_settings)
-            except Exception as exc:  # noqa: BLE001
-                QtWidgets.QMessageBox.critical(
-                    self, self.translator.tr("error"), str(exc)
-                )
-                self._file_info = None
-                self._probe_data = None
-                self.file_info_label.setText(str(exc))
-                self.file_line.clear()
-                self.file_line.setToolTip("")
-                self.input_file = None
-            finally:
-                self._update_segment_controls_state()
+        if not file_path:
+            return
+        try:
+            validators.validate_input_file(file_path)
+            path = Path(file_path)
+            stat = path.stat()
+            probe_data = self._cached_probe(path, stat, fast=True)
+        except Exception as exc:  # noqa: BLE001
+            self._reject_input_file(str(exc))
+            return
+        self._probe_data = None
+        self._file_info = None
+        self.input_file = None
+        self.file_line.setText(file_path)
+        self.file_line.setToolTip(file_path)
+        logger.info("Выбран входной файл: %s", file_path)
+        if probe_data is not None:
+            self._apply_input_probe(path, probe_data)
+            return
+        self._start_input_probe(path, stat)
+
+    def _start_input_probe(self, path: Path, stat: os.stat_result) -> None:
+        """Запускает ffprobe входного файла в отдельном потоке.
+
+        Окно остаётся отзывчивым; до получения результата выбор другого файла
+        и кнопки сегментов недоступны.
+        """
+
+        from .processing_worker import ProbeWorker
+
+        self._pending_probe = (path, stat)
+        self.file_button.setEnabled(False)
+        self.file_info_label.setText(self.translator.tr("file_info_probing"))
+        self._update_segment_controls_state()
+        self._probe_thread = QtCore.QThread(self)
+        self._probe_worker = ProbeWorker(
+            partial(self._run_probe, path, True), _JSON_ENCODER.encode
+        )
+        self._probe_worker.moveToThread(self._probe_thread)
+        self._probe_thread.started.connect(self._probe_worker.run)
+        self._probe_worker.finished.connect(self._on_input_probe_ready)
+        self._probe_worker.failed.connect(self._on_input_probe_failed)
+        self._probe_thread.start()
+
+    def _stop_probe_thread(self) -> None:
+        if self._probe_thread is not None:
+            self._probe_thread.quit()
+            self._probe_thread.wait()
+            self._probe_thread.deleteLater()
+            self._probe_thread = None
+        if self._probe_worker is not None:
+            self._probe_worker.deleteLater()
+            self._probe_worker = None
+        self._pending_probe = None
+        self.file_button.setEnabled(True)
+
+    @QtCore.Slot(dict, str)
+    def _on_input_probe_ready(self, probe_data: dict, json_text: str) -> None:
+        if self._pending_probe is None:
+            return
+        path, stat = self._pending_probe
+        self._stop_probe_thread()
+        self._store_probe(path, stat, True, probe_data)
+        if json_text:
+            # Текст для окна метаинформации уже собран в потоке проверки.
+            self._probe_json_cache = (probe_data, json_text)
+        self._apply_input_probe(path, probe_data)
+
+    @QtCore.Slot(str)
+    def _on_input_probe_failed(self, message: str) -> None:
+        if self._pending_probe is None:
+            return
+        self._stop_probe_thread()
+        self._reject_input_file(message)
+
+    def _reject_input_file(self, message: str) -> None:
+        QtWidgets.QMessageBox.critical(self, self.translator.tr("error"), message)
+        self._file_info = None
+        self._probe_data = None
+        self.file_info_label.setText(message)
+        self.file_line.clear()
+        self.file_line.setToolTip("")
+        self.input_file = None
+        self._update_segment_controls_state()
 
+    def _apply_input_probe(self, path: Path, probe_data: dict[str, object]) -> None:
+        self.input_file = path
+        self._probe_data = probe_data
+        info = self._extract_file_info(probe_data)
+        self._file_info = info
+        self.file_info_label.setText(self._format_file_info(info))
+        self._update_segment_controls_state()
+        self._handle_metadata_chapters(probe_data)
+        self.app_settings.last_input_dir = str(path.parent)
+        self._schedule_settings_save()
+
+    @QtCore.Slot()
     def select_output_dir(self) -> None:
         start_dir = (
             self.app_settings.last_output_dir
             or (str(self.output_dir) if self.output_dir else None)
-            or str(Path.home())
+            or self._home_dir
         )
         directory = QtWidgets.QFileDialog.getExistingDirectory(
             self,
@@ -836,15 +1114,17 @@ class MainWindow(QtWidgets.QMainWindow):
                 self.output_line.setText(str(self.output_dir))
                 logger.info("Выходная директория: %s", self.output_dir)
                 self.app_settings.last_output_dir = str(self.output_dir)
-                self.settings_manager.save(self.app_settings)
-                self._segment_probe_cache.clear()
+                self._schedule_settings_save()
                 self._refresh_table(preserve_selection=True)
             except Exception as exc:  # noqa: BLE001
                 QtWidgets.QMessageBox.critical(
                     self, self.translator.tr("error"), str(exc)
                 )
 
+    @QtCore.Slot()
     def add_segment(self) -> None:
+        from .segment_dialog import SegmentDialog
+
         dialog = SegmentDialog(
             self,
             self.translator,
@@ -852,8 +1132,7 @@ class MainWindow(QtWidgets.QMainWindow):
         )
         if dialog.exec() == QtWidgets.QDialog.DialogCode.Accepted:
             try:
-                segment = dialog.get_segment()
-                self.segment_manager.add_segment(segment)
+                segment = self.segment_manager.add_segment(dialog.get_segment())
                 logger.info(
                     "Добавлен сегмент #%s (%s-%s)",
                     segment.index,
@@ -869,6 +1148,7 @@ class MainWindow(QtWidgets.QMainWindow):
                     self, self.translator.tr("error"), str(exc)
                 )
 
+    @QtCore.Slot()
     def remove_segment(self) -> None:
         rows = self._selected_rows()
         if not rows:
@@ -902,13 +1182,14 @@ class MainWindow(QtWidgets.QMainWindow):
             self.segment_manager.remove_segment(row)
             logger.info("Удалён сегмент #%s", row + 1)
         self._refresh_table()
-        next_row = min(rows[0], self.table.rowCount() - 1)
+        next_row = min(rows[0], self._segment_model.rowCount() - 1)
         if next_row >= 0:
             self._select_rows([next_row])
         else:
             self._select_rows([])
         self._update_selection_controls()
 
+    @QtCore.Slot()
     def edit_segment(self) -> None:
         rows = self._selected_rows()
         if not rows:
@@ -917,6 +1198,8 @@ class MainWindow(QtWidgets.QMainWindow):
         segment = self.segment_manager.get(row)
         if not segment:
             return
+        from .segment_dialog import SegmentDialog
+
         dialog = SegmentDialog(
             self,
             self.translator,
@@ -925,12 +1208,10 @@ class MainWindow(QtWidgets.QMainWindow):
         )
         if dialog.exec() == QtWidgets.QDialog.DialogCode.Accepted:
             try:
-                updated = dialog.get_segment()
-                updated.index = segment.index
-                self.segment_manager.update_segment(row, updated)
-                logger.info("Обновлён сегмент #%s", updated.index)
+                self.segment_manager.update_segment(row, dialog.get_segment())
+                logger.info("Обновлён сегмент #%s", segment.index)
                 self._refresh_table()
-                if row < self.table.rowCount():
+                if row < self._segment_model.rowCount():
                     self._select_rows([row])
                 self._update_selection_controls()
             except Exception as exc:  # noqa: BLE001
@@ -938,6 +1219,7 @@ class MainWindow(QtWidgets.QMainWindow):
                     self, self.translator.tr("error"), str(exc)
                 )
 
+    @QtCore.Slot()
     def duplicate_segment(self) -> None:
         rows = self._selected_rows()
         if not rows:
@@ -946,15 +1228,15 @@ class MainWindow(QtWidgets.QMainWindow):
         segment = self.segment_manager.get(row)
         if not segment:
             return
-        duplicate = replace(segment)
-        duplicate.index = 0
-        self.segment_manager.insert_segment(row + 1, duplicate)
+        # Сегменты неизменяемы: дубликат получит свой номер при перенумерации.
+        self.segment_manager.insert_segment(row + 1, segment)
         logger.info("Дублирован сегмент #%s", row + 1)
         self._refresh_table()
-        if row + 1 < self.table.rowCount():
+        if row + 1 < self._segment_model.rowCount():
             self._select_rows([row + 1])
         self._update_selection_controls()
 
+    @QtCore.Slot()
     def bulk_edit_segments(self) -> None:
         rows = self._selected_rows()
         if not rows:
@@ -966,6 +1248,8 @@ class MainWindow(QtWidgets.QMainWindow):
                 segments.append(segment)
         if not segments:
             return
+        from .segment_batch_dialog import SegmentBatchDialog
+
         dialog = SegmentBatchDialog(self, self.translator, segments)
         if dialog.exec() != QtWidgets.QDialog.DialogCode.Accepted:
             return
@@ -979,15 +1263,19 @@ class MainWindow(QtWidgets.QMainWindow):
             extra_args,
         ) = dialog.get_result()
         for row, segment in zip(rows, segments):
-            if not segment:
-                continue
-            segment.container = container
-            segment.convert = convert
-            segment.remove_audio = remove_audio
-            segment.video_codec = video_codec
-            segment.audio_codec = audio_codec
-            segment.crf = crf
-            segment.extra_args = extra_args
+            self.segment_manager.update_segment(
+                row,
+                replace(
+                    segment,
+                    container=container,
+                    convert=convert,
+                    remove_audio=remove_audio,
+                    video_codec=video_codec,
+                    audio_codec=audio_codec,
+                    crf=crf,
+                    extra_args=extra_args,
+                ),
+            )
         logger.info("Обновлены параметры %s сегментов", len(rows))
         self._append_log(
             self.translator.tr("bulk_edit_log").format(count=len(rows))
@@ -999,11 +1287,12 @@ class MainWindow(QtWidgets.QMainWindow):
     def preview_segment(self) -> None:
         if not self.input_file:
             return
-        row = self.table.currentRow()
+        row = self.table.currentIndex().row()
         if row < 0:
             return
         self._show_preview_for_row(row)
 
+    @QtCore.Slot()
     def clear_segments(self) -> None:
         if not self.segment_manager.segments:
             return
@@ -1029,7 +1318,6 @@ class MainWindow(QtWidgets.QMainWindow):
         ):
             return
         self.segment_manager.clear()
-        self._segment_probe_cache.clear()
         logger.info("Список сегментов очищен")
         self._refresh_table()
         self._select_rows([])
@@ -1040,98 +1328,30 @@ class MainWindow(QtWidgets.QMainWindow):
         segment = self.segment_manager.get(row)
         if not segment:
             return
+        from .preview_dialog import PreviewDialog
+
         dialog = PreviewDialog(self, self.translator, self.input_file, segment.start)
         dialog.exec()
 
     def _refresh_table(self, *, preserve_selection: bool = False) -> None:
         previous_selection = self._selected_rows() if preserve_selection else []
-        self.table.setRowCount(len(self.segment_manager.segments))
-        use_icons = self.app_settings.use_icon_buttons
-        preview_text = (
-            self.translator.tr("preview_icon")
-            if use_icons
-            else self.translator.tr("preview")
-        )
-        metadata_text = (
-            ""
-            if use_icons
-            else self.translator.tr("segment_metadata_column")
-        )
-        default_container = "mp4"
-        if self.input_file and self.input_file.suffix:
-            default_container = self.input_file.suffix.lstrip(".") or default_container
-        for row, segment in enumerate(self.segment_manager.segments):
-            items = [
-                QtWidgets.QTableWidgetItem(str(segment.index)),
-                QtWidgets.QTableWidgetItem(segment.filename or ""),
-                QtWidgets.QTableWidgetItem(format_time(segment.start)),
-                QtWidgets.QTableWidgetItem(
-                    "" if segment.end is None else format_time(segment.end)
-                ),
-                QtWidgets.QTableWidgetItem(segment.container or default_container),
-                QtWidgets.QTableWidgetItem(
-                    self.translator.tr("yes")
-                    if segment.convert
-                    else self.translator.tr("no")
-                ),
-            ]
-            for col, item in enumerate(items):
-                item.setFlags(
-                    QtCore.Qt.ItemFlag.ItemIsSelectable
-                    | QtCore.Qt.ItemFlag.ItemIsEnabled
-                )
-                self.table.setItem(row, col, item)
-
-            output_path = self._resolve_segment_output_path(segment, default_container)
-            file_exists = output_path is not None and output_path.is_file()
-
-            metadata_button = QtWidgets.QPushButton()
-            if use_icons:
-                metadata_button.setIcon(
-                    self.style().standardIcon(
-                        QtWidgets.QStyle.StandardPixmap.SP_FileDialogInfoView
-                    )
-                )
-                metadata_button.setText("")
-            else:
-                metadata_button.setText(metadata_text)
-            metadata_button.setIconSize(QtCore.QSize(20, 20))
-            metadata_button.setAccessibleName(
-                self.translator.tr("segment_metadata_column")
-            )
-            tooltip = (
-                self.translator.tr("segment_metadata_tooltip")
-                if file_exists
-                else self.translator.tr("segment_metadata_missing")
-            )
-            metadata_button.setToolTip(tooltip)
-            metadata_button.setEnabled(file_exists)
-            metadata_button.clicked.connect(
-                partial(self._show_segment_metadata_dialog, output_path)
+        # Сброс модели и восстановление выделения перерисовываются один раз.
+        self.table.setUpdatesEnabled(False)
+        try:
+            self._segment_model.refresh(
+                default_container=self._default_container,
+                use_icons=self.app_settings.use_icon_buttons,
             )
-            self.table.setCellWidget(row, 6, metadata_button)
 
-            preview_button = QtWidgets.QPushButton()
-            if use_icons:
-                preview_button.setIcon(
-                    self.style().standardIcon(
-                        QtWidgets.QStyle.StandardPixmap.SP_MediaPlay
-                    )
-                )
-                preview_button.setText("")
-            else:
-                preview_button.setText(preview_text)
-            preview_button.setToolTip(self.translator.tr("tooltip_preview"))
-            preview_button.setIconSize(QtCore.QSize(20, 20))
-            preview_button.clicked.connect(partial(self._show_preview_for_row, row))
-            self.table.setCellWidget(row, 7, preview_button)
-
-        if preserve_selection and previous_selection:
-            valid_rows = [
-                index for index in previous_selection if index < self.table.rowCount()
-            ]
-            if valid_rows:
-                self._select_rows(valid_rows)
+            if preserve_selection and previous_selection:
+                row_count = self._segment_model.rowCount()
+                valid_rows = [
+                    index for index in previous_selection if index < row_count
+                ]
+                if valid_rows:
+                    self._select_rows(valid_rows)
+        finally:
+            self.table.setUpdatesEnabled(True)
 
         self._update_selection_controls()
 
@@ -1171,22 +1391,27 @@ class MainWindow(QtWidgets.QMainWindow):
         return None
 
     def _collect_segments_from_table(self) -> List[Segment]:
-        return [replace(segment) for segment in self.segment_manager.segments]
+        # Сегменты неизменяемы, поэтому достаточно снимка самого списка.
+        return list(self.segment_manager.segments)
 
-    def save_segments_to_file(self) -> None:
-        default_dir = (
+    def _segments_default_dir(self) -> str:
+        """Начальный каталог диалогов сохранения и загрузки списка сегментов.
+
+        Значения берутся из настроек и состояния окна без обращения к диску:
+        сохранённые пути всегда указывают на каталоги, а отсутствующий
+        каталог диалог выбора файла обрабатывает сам.
+        """
+
+        return (
             self.app_settings.last_output_dir
             or self.app_settings.last_input_dir
             or (str(self.output_dir) if self.output_dir else None)
+            or self._home_dir
         )
-        if default_dir:
-            base_path = Path(default_dir)
-            if base_path.is_dir():
-                initial = base_path / "segments.json"
-            else:
-                initial = base_path
-        else:
-            initial = Path.home() / "segments.json"
+
+    @QtCore.Slot()
+    def save_segments_to_file(self) -> None:
+        initial = Path(self._segments_default_dir()) / "segments.json"
 
         filters = ";;".join(
             [
@@ -1222,8 +1447,7 @@ class MainWindow(QtWidgets.QMainWindow):
                         "remove_audio": segment.remove_audio,
                     }
                 )
-            with open(filename, "w", encoding="utf-8") as handle:
-                json.dump(payload, handle, ensure_ascii=False, indent=2)
+            Path(filename).write_text(_JSON_ENCODER.encode(payload), encoding="utf-8")
             QtWidgets.QMessageBox.information(
                 self,
                 self.translator.tr("info"),
@@ -1237,13 +1461,9 @@ class MainWindow(QtWidgets.QMainWindow):
                 f"{self.translator.tr('segments_save_error')}: {exc}",
             )
 
+    @QtCore.Slot()
     def load_segments_from_file(self) -> None:
-        default_dir = (
-            self.app_settings.last_output_dir
-            or self.app_settings.last_input_dir
-            or (str(self.output_dir) if self.output_dir else None)
-        )
-        initial = default_dir or str(Path.home())
+        initial = self._segments_default_dir()
         filters = ";;".join(
             [
                 self.translator.tr("segments_file_filter"),
@@ -1260,8 +1480,9 @@ class MainWindow(QtWidgets.QMainWindow):
             return
 
         try:
-            with open(filename, "r", encoding="utf-8") as handle:
-                data = json.load(handle)
+            # Файл читается целиком одним вызовом; json.loads сам определяет
+            # кодировку байтов, включая UTF-8 с BOM.
+            data = json.loads(Path(filename).read_bytes())
             if not isinstance(data, list):
                 raise ValueError("Invalid segments format")
 
@@ -1288,9 +1509,9 @@ class MainWindow(QtWidgets.QMainWindow):
                     remove_audio=bool(entry.get("remove_audio", False)),
                 )
                 if not segment.convert:
-                    segment.video_codec = "copy"
-                    segment.audio_codec = "copy"
-                    segment.extra_args = ""
+                    segment = replace(
+                        segment, video_codec="copy", audio_codec="copy", extra_args=""
+                    )
                 self.segment_manager.add_segment(segment)
             self._refresh_table()
             QtWidgets.QMessageBox.information(
@@ -1306,6 +1527,7 @@ class MainWindow(QtWidgets.QMainWindow):
                 f"{self.translator.tr('segments_load_error')}: {exc}",
             )
 
+    @QtCore.Slot()
     def create_segments_from_text(self) -> None:
         if not self.input_file:
             QtWidgets.QMessageBox.warning(
@@ -1315,6 +1537,8 @@ class MainWindow(QtWidgets.QMainWindow):
             )
             return
 
+        from .bulk_segment_dialog import BulkSegmentDialog
+
         dialog = BulkSegmentDialog(self, self.translator)
         if dialog.exec() != QtWidgets.QDialog.DialogCode.Accepted:
             return
@@ -1352,6 +1576,7 @@ class MainWindow(QtWidgets.QMainWindow):
             numbering_separator=separator,
         )
 
+    @QtCore.Slot()
     def process_segments(self) -> None:
         if not self.input_file:
             QtWidgets.QMessageBox.warning(
@@ -1383,29 +1608,36 @@ class MainWindow(QtWidgets.QMainWindow):
                 self, self.translator.tr("info"), self.translator.tr("no_segments")
             )
             return
-        self._stop_requested = False
+        self._stop_event.clear()
         self.process_button.setEnabled(False)
         self.stop_button.setEnabled(True)
         self.progress_bar.setValue(0)
         self.progress_info_label.setText(
-            self.translator.tr("progress_template").format(current=0, total=total)
+            self._progress_templates["progress_template"].format(
+                current=0, total=total
+            )
         )
         self.status_bar.showMessage(self.translator.tr("status_processing"))
-        self.log_console.clear()
+        self._log_buffer.clear()
+        if self.log_console is not None:
+            self.log_console.clear()
         self._start_processing_worker(segments)
 
+    @QtCore.Slot()
     def stop_processing(self) -> None:
         if not self.stop_button.isEnabled():
             return
-        self._stop_requested = True
+        self._stop_event.set()
         self.stop_button.setEnabled(False)
-        if self._processing_worker:
-            self._processing_worker.request_stop()
         self._append_log(self.translator.tr("processing_stop_requested"))
+        self._flush_log()
 
+    @QtCore.Slot()
     def copy_log_to_clipboard(self) -> None:
+        self._flush_log()
         clipboard = QtGui.QGuiApplication.clipboard()
-        clipboard.setText(self.log_console.toPlainText())
+        text = self.log_console.toPlainText() if self.log_console else ""
+        clipboard.setText(text)
         self._append_log(self.translator.tr("log_copy_success"))
 
     def _start_processing_worker(self, segments: List[Segment]) -> None:
@@ -1415,17 +1647,21 @@ class MainWindow(QtWidgets.QMainWindow):
         if self._processing_thread:
             self._stop_processing_thread()
 
+        from .processing_worker import ProcessingWorker
+
         self._processing_thread = QtCore.QThread(self)
         self._processing_worker = ProcessingWorker(
             self.input_file,
             self.output_dir,
             segments,
             self.app_settings,
+            stop_event=self._stop_event,
         )
         self._processing_worker.moveToThread(self._processing_thread)
         self._processing_thread.started.connect(self._processing_worker.run)
         self._processing_worker.segment_started.connect(self._on_segment_started)
         self._processing_worker.segment_finished.connect(self._on_segment_finished)
+        self._processing_worker.segment_failed.connect(self._on_segment_failed)
         self._processing_worker.progress_changed.connect(self.progress_bar.setValue)
         self._processing_worker.error_occurred.connect(self._on_processing_error)
         self._processing_worker.finished.connect(self._on_processing_finished)
@@ -1433,74 +1669,95 @@ class MainWindow(QtWidgets.QMainWindow):
         self._processing_thread.finished.connect(self._cleanup_processing_thread)
         self._processing_thread.start()
 
+    @QtCore.Slot(int, int, str)
     def _on_segment_started(self, index: int, total: int, name: str) -> None:
-        self.progress_info_label.setText(
-            self.translator.tr("progress_template").format(current=index, total=total)
-        )
-        self.status_bar.showMessage(
-            self.translator.tr("status_processing_segment").format(
+        templates = self._progress_templates
+        # Подпись и строка состояния обновляются вместе с журналом по таймеру,
+        # поэтому быстрые сегменты не перерисовывают их на каждом событии.
+        self._pending_progress_texts = (
+            templates["progress_template"].format(current=index, total=total),
+            templates["status_processing_segment"].format(
                 current=index, total=total, name=name
-            )
+            ),
         )
         self._append_log(
-            self.translator.tr("log_processing_segment").format(
+            templates["log_processing_segment"].format(
                 current=index, total=total, name=name
             )
         )
 
+    @QtCore.Slot(int, int, str)
     def _on_segment_finished(self, index: int, total: int, name: str) -> None:
         self._append_log(
-            self.translator.tr("log_segment_done").format(name=name)
+            self._progress_templates["log_segment_done"].format(name=name)
         )
         if index == total:
             self.progress_bar.setValue(100)
 
+    @QtCore.Slot(str, str)
+    def _on_segment_failed(self, name: str, error: str) -> None:
+        logger.error("Сегмент %s не обработан: %s", name, error)
+        self._append_log(
+            self._progress_templates["log_segment_failed"].format(
+                name=name, error=error
+            )
+        )
+
+    @QtCore.Slot(str)
     def _on_processing_error(self, message: str) -> None:
-        logger.exception("Ошибка при обработке сегментов: %s", message)
-        self._append_log(message)
-        QtWidgets.QMessageBox.critical(
-            self, self.translator.tr("error"), message
+        # Ошибки отдельных сегментов уже записаны в журнал по мере обработки;
+        # по окончании показывается одно окно со сводкой.
+        self._append_log(self.translator.tr("processing_failed"))
+        self._flush_log()
+        box = QtWidgets.QMessageBox(
+            QtWidgets.QMessageBox.Icon.Warning,
+            self.translator.tr("error"),
+            self.translator.tr("processing_failed"),
+            QtWidgets.QMessageBox.StandardButton.Ok,
+            self,
         )
+        box.setDetailedText(message)
+        box.exec()
         self._finalize_processing(success=False, stopped=False)
 
+    @QtCore.Slot()
     def _on_processing_finished(self) -> None:
-        self._append_log(self.translator.tr("processing_complete"))
-        QtWidgets.QMessageBox.information(
-            self,
-            self.translator.tr("info"),
-            self.translator.tr("processing_complete"),
-        )
+        message = self.translator.tr("processing_complete")
+        self._append_log(message)
+        self._flush_log()
+        QtWidgets.QMessageBox.information(self, self.translator.tr("info"), message)
         self._finalize_processing(success=True, stopped=False)
 
+    @QtCore.Slot()
     def _on_processing_stopped(self) -> None:
         self._append_log(self.translator.tr("processing_stop_ack"))
         self._finalize_processing(success=False, stopped=True)
 
     def _finalize_processing(self, *, success: bool, stopped: bool) -> None:
-        if stopped:
-            self.status_bar.showMessage(self.translator.tr("status_stopped"))
-            self.progress_info_label.setText(self.translator.tr("progress_idle"))
-            self.progress_bar.setValue(0)
-        elif success:
-            self.status_bar.showMessage(self.translator.tr("status_ready"))
-            self.progress_info_label.setText(self.translator.tr("progress_idle"))
-        else:
-            self.status_bar.showMessage(self.translator.tr("status_ready"))
-            self.progress_info_label.setText(self.translator.tr("progress_idle"))
+        self._flush_log()
+        status_key = "status_stopped" if stopped else "status_ready"
+        self.status_bar.showMessage(self.translator.tr(status_key))
+        self.progress_info_label.setText(self.translator.tr("progress_idle"))
+        if not success:
             self.progress_bar.setValue(0)
 
         self.process_button.setEnabled(True)
         self.stop_button.setEnabled(False)
-        self._stop_requested = False
+        self._stop_event.clear()
         self._stop_processing_thread()
         self._refresh_table(preserve_selection=True)
 
     def _stop_processing_thread(self) -> None:
-        if self._processing_thread:
-            self._processing_thread.quit()
-            self._processing_thread.wait()
+        thread = self._processing_thread
+        if thread:
+            # Очистка выполняется здесь один раз: отложенный вызов по сигналу
+            # finished иначе сработал бы позже и удалил уже следующий поток.
+            thread.finished.disconnect(self._cleanup_processing_thread)
+            thread.quit()
+            thread.wait()
         self._cleanup_processing_thread()
 
+    @QtCore.Slot()
     def _cleanup_processing_thread(self) -> None:
         if self._processing_worker:
             self._processing_worker.deleteLater()
@@ -1510,16 +1767,123 @@ class MainWindow(QtWidgets.QMainWindow):
             self._processing_thread = None
 
     def _append_log(self, message: str) -> None:
-        timestamp = QtCore.QDateTime.currentDateTime().toString("HH:mm:ss")
-        self.log_console.appendPlainText(f"[{timestamp}] {message}")
+        timestamp = time.strftime("%H:%M:%S")
+        self._log_buffer.append(f"[{timestamp}] {message}")
+        if not self._log_flush_timer.isActive():
+            self._log_flush_timer.start()
+
+    @QtCore.Slot()
+    def _flush_log(self) -> None:
+        """Выводит накопленные строки журнала одним добавлением в консоль.
+
+        Вместе с журналом показывается последнее отложенное состояние хода
+        обработки (подпись прогресса и строка состояния).
+        """
+
+        self._log_flush_timer.stop()
+        if self._pending_progress_texts is not None:
+            progress_text, status_text = self._pending_progress_texts
+            self._pending_progress_texts = None
+            self.progress_info_label.setText(progress_text)
+            self.status_bar.showMessage(status_text)
+        if self._log_buffer:
+            console = self._ensure_log_console()
+            console.appendPlainText("\n".join(self._log_buffer))
+            self._log_buffer.clear()
+
+    def _ensure_log_console(self) -> QtWidgets.QPlainTextEdit:
+        """Создаёт консоль журнала при первом обращении вместо заглушки."""
+
+        if self.log_console is None:
+            console = QtWidgets.QPlainTextEdit()
+            console.setReadOnly(True)
+            console.setMaximumBlockCount(500)
+            self._log_layout.replaceWidget(self._log_console_placeholder, console)
+            self._log_console_placeholder.deleteLater()
+            self.log_console = console
+        return self.log_console
+
+    def _probe_file(self, path: Path, *, fast: bool = False) -> dict[str, object]:
+        """Возвращает данные ffprobe файла, запоминая последние результаты.
+
+        Используется и для входного файла, и для готовых сегментов. Ключ
+        кэша — путь, время изменения и размер файла, поэтому перезаписанный
+        на диске файл (например, заново нарезанный сегмент) читается заново.
+        Промах кэша в памяти проверяется по дисковому ``ProbeCache``, ключ
+        которого строится по содержимому файла, а не по пути.
+
+        При ``fast=True`` сначала читается только заголовок контейнера; полный
+        анализ выполняется, если в заголовке нет длительности или размеров
+        кадра видеопотока.
+        """
+
+        stat = path.stat()
+        probe_data = self._cached_probe(path, stat, fast)
+        if probe_data is None:
+            probe_data = self._run_probe(path, fast)
+            self._store_probe(path, stat, fast, probe_data)
+        return probe_data
+
+    def _cached_probe(
+        self, path: Path, stat: os.stat_result, fast: bool
+    ) -> dict[str, object] | None:
+        """Ищет данные ffprobe в кэше в памяти, затем в дисковом кэше."""
+
+        key = (str(path), stat.st_mtime_ns, stat.st_size, fast)
+        cache = self._probe_cache
+        probe_data = cache.get(key)
+        if probe_data is not None:
+            cache.move_to_end(key)
+            return probe_data
+        probe_data = self._probe_disk_cache.get(ProbeCache.make_key(path, stat, fast))
+        if probe_data is not None:
+            self._remember_probe(key, probe_data)
+        return probe_data
+
+    def _store_probe(
+        self,
+        path: Path,
+        stat: os.stat_result,
+        fast: bool,
+        probe_data: dict[str, object],
+    ) -> None:
+        self._probe_disk_cache.put(ProbeCache.make_key(path, stat, fast), probe_data)
+        self._remember_probe(
+            (str(path), stat.st_mtime_ns, stat.st_size, fast), probe_data
+        )
+
+    def _remember_probe(
+        self, key: tuple[str, int, int, bool], probe_data: dict[str, object]
+    ) -> None:
+        cache = self._probe_cache
+        cache[key] = probe_data
+        if len(cache) > self.PROBE_CACHE_SIZE:
+            cache.popitem(last=False)
+
+    def _run_probe(self, path: Path, fast: bool) -> dict[str, object]:
+        if fast:
+            probe_data = ffmpeg_helper.probe_file(path, fast=True)
+            info = self._extract_file_info(probe_data)
+            if info["duration"] is not None and (
+                not info["video_codec"] or info["resolution"] is not None
+            ):
+                return probe_data
+        return ffmpeg_helper.probe_file(path)
 
     def _extract_file_info(self, data: dict[str, object]) -> dict[str, object]:
         duration_raw = data.get("format", {}).get("duration")
         streams = data.get("streams", [])
-        video_streams = [s for s in streams if s.get("codec_type") == "video"]
-        audio_streams = [s for s in streams if s.get("codec_type") == "audio"]
-        video_info = video_streams[0] if video_streams else {}
-        audio_info = audio_streams[0] if audio_streams else {}
+        # Нужны только первые видео- и аудиопотоки: один проход с ранним выходом.
+        video_info: dict[str, object] = {}
+        audio_info: dict[str, object] = {}
+        for stream in streams:
+            codec_type = stream.get("codec_type")
+            if codec_type == "video" and not video_info:
+                video_info = stream
+            elif codec_type == "audio" and not audio_info:
+                audio_info = stream
+            if video_info and audio_info:
+                break
         duration_value = self._safe_float(duration_raw)
         width_raw = video_info.get("width")
         height_raw = video_info.get("height")
@@ -1546,22 +1910,23 @@ class MainWindow(QtWidgets.QMainWindow):
         if not isinstance(raw_chapters, list):
             return
 
+        safe_float = self._safe_float
         chapters: list[tuple[float, float | None, str]] = []
         for index, entry in enumerate(raw_chapters, start=1):
             if not isinstance(entry, dict):
                 continue
-            start_value = self._safe_float(entry.get("start_time"))
+            start_value = safe_float(entry.get("start_time"))
             if start_value is None:
                 continue
-            end_value = self._safe_float(entry.get("end_time"))
+            end_value = safe_float(entry.get("end_time"))
             if end_value is not None and end_value <= start_value:
                 end_value = None
-            tags = entry.get("tags") if isinstance(entry.get("tags"), dict) else {}
-            title = (
-                tags.get("title")
-                or tags.get("TITLE")
-                or f"Chapter {index:02d}"
-            )
+            tags = entry.get("tags")
+            title = None
+            if isinstance(tags, dict):
+                title = tags.get("title") or tags.get("TITLE")
+            if not title:
+                title = f"Chapter {index:02d}"
             chapters.append((start_value, end_value, str(title)))
 
         if not chapters:
@@ -1576,30 +1941,28 @@ class MainWindow(QtWidgets.QMainWindow):
         self, entries: list[tuple[float, str | None]]
     ) -> list[tuple[float, float | None, str | None]]:
         duration = self._get_video_duration()
+        tr = self.translator.tr
         segments: list[tuple[float, float | None, str | None]] = []
+        # Начало следующей строки берётся из готового списка, без индексации
+        # entries на каждой итерации.
+        next_starts: list[float | None] = [start for start, _title in entries[1:]]
+        next_starts.append(None)
 
-        for idx, (start, title) in enumerate(entries, start=1):
+        for idx, ((start, title), next_start) in enumerate(
+            zip(entries, next_starts), start=1
+        ):
             if start < 0:
-                raise ValueError(
-                    self.translator.tr("bulk_create_error_negative").format(line=idx)
-                )
+                raise ValueError(tr("bulk_create_error_negative").format(line=idx))
             if duration is not None and start >= duration:
                 raise ValueError(
-                    self.translator.tr("bulk_create_error_over_duration").format(
-                        line=idx
-                    )
+                    tr("bulk_create_error_over_duration").format(line=idx)
                 )
 
-            next_start = entries[idx][0] if idx < len(entries) else None
             if next_start is not None and next_start <= start:
-                raise ValueError(
-                    self.translator.tr("bulk_create_error_order").format(line=idx + 1)
-                )
+                raise ValueError(tr("bulk_create_error_order").format(line=idx + 1))
             if duration is not None and next_start is not None and next_start > duration:
                 raise ValueError(
-                    self.translator.tr("bulk_create_error_over_duration").format(
-                        line=idx + 1
-                    )
+                    tr("bulk_create_error_over_duration").format(line=idx + 1)
                 )
 
             end_value: float | None
@@ -1607,9 +1970,7 @@ class MainWindow(QtWidgets.QMainWindow):
                 end_value = next_start
             elif duration is not None:
                 if duration <= start:
-                    raise ValueError(
-                        self.translator.tr("bulk_create_error_last_segment")
-                    )
+                    raise ValueError(tr("bulk_create_error_last_segment"))
                 end_value = duration
             else:
                 end_value = None
@@ -1670,12 +2031,7 @@ class MainWindow(QtWidgets.QMainWindow):
         numbering_separator: str = "_",
     ) -> None:
         self.segment_manager.clear()
-        self._segment_probe_cache.clear()
-        default_container = (
-            self.input_file.suffix.lstrip(".")
-            if self.input_file and self.input_file.suffix
-            else "mp4"
-        )
+        default_container = self._default_container
         for idx, (start, end, title) in enumerate(entries, start=1):
             description = (title or "").strip()
             fallback_name = self._generate_default_segment_name(start)
@@ -1755,19 +2111,27 @@ class MainWindow(QtWidgets.QMainWindow):
 
     @staticmethod
     def _sanitize_filename(value: str) -> str:
-        cleaned = re.sub(r"[\\/:*?\"<>|]", "_", value)
-        cleaned = re.sub(r"\s+", " ", cleaned).strip()
-        cleaned = cleaned.replace(" ", "_")
-        cleaned = re.sub(r"_+", "_", cleaned)
+        cleaned = value.translate(_FORBIDDEN_FILENAME_CHARS).strip()
+        cleaned = _FILENAME_SEPARATORS_RE.sub("_", cleaned)
         cleaned = cleaned.strip("_.")
         return cleaned[:80]
 
     def _format_file_info(self, info: dict[str, object]) -> str:
+        template = self.translator.tr("file_info_template")
+        unknown = self.translator.tr("file_info_unknown")
+        if (
+            info.get("duration") is None
+            and info.get("resolution") is None
+            and not info.get("video_codec")
+            and not info.get("audio_codec")
+        ):
+            return template.format(duration=unknown, resolution=unknown, codecs=unknown)
+
         duration_value = info.get("duration")
         if isinstance(duration_value, (int, float)) and duration_value >= 0:
             duration_text = self._format_duration(duration_value)
         else:
-            duration_text = self.translator.tr("file_info_unknown")
+            duration_text = unknown
 
         resolution_value = info.get("resolution")
         if (
@@ -1777,18 +2141,15 @@ class MainWindow(QtWidgets.QMainWindow):
         ):
             resolution_text = f"{resolution_value[0]}x{resolution_value[1]}"
         else:
-            resolution_text = self.translator.tr("file_info_unknown")
+            resolution_text = unknown
 
         codecs = []
         for key in ("video_codec", "audio_codec"):
             value = info.get(key)
             if isinstance(value, str) and value:
                 codecs.append(value.upper())
-        codecs_text = (
-            ", ".join(codecs) if codecs else self.translator.tr("file_info_unknown")
-        )
+        codecs_text = ", ".join(codecs) if codecs else unknown
 
-        template = self.translator.tr("file_info_template")
         return template.format(
             duration=duration_text,
             resolution=resolution_text,
@@ -1797,20 +2158,20 @@ class MainWindow(QtWidgets.QMainWindow):
 
     @staticmethod
     def _format_duration(seconds: float) -> str:
-        total_seconds = int(round(seconds))
-        minutes, sec = divmod(total_seconds, 60)
-        hours, minutes = divmod(minutes, 60)
-        return f"{hours:02d}:{minutes:02d}:{sec:02d}"
+        # Длительность неотрицательна, поэтому округление — это int(x + 0.5).
+        hours, rest = divmod(int(seconds + 0.5), 3600)
+        minutes, secs = divmod(rest, 60)
+        return f"{hours:02d}:{minutes:02d}:{secs:02d}"
 
     @staticmethod
     def _safe_int(value: object) -> int | None:
-        if isinstance(value, int):
-            return value
-        if isinstance(value, float):
-            return int(value)
-        if isinstance(value, str) and value.isdigit():
+        # int() сам принимает целые, дробные и строки с пробелами/знаком.
+        if value is None or isinstance(value, bool):
+            return None
+        try:
             return int(value)
-        return None
+        except (TypeError, ValueError, OverflowError):
+            return None
 
     @staticmethod
     def _safe_float(value: object) -> float | None:
@@ -1823,28 +2184,22 @@ class MainWindow(QtWidgets.QMainWindow):
                 return None
         return None
 
+    @classmethod
+    def _dark_palette(cls) -> QtGui.QPalette:
+        """Тёмная палитра, создаваемая один раз на процесс."""
+
+        if cls._cached_dark_palette is None:
+            palette = QtGui.QPalette()
+            for role, rgb in cls._DARK_PALETTE_COLORS:
+                palette.setColor(role, QtGui.QColor(*rgb))
+            MainWindow._cached_dark_palette = palette
+        return cls._cached_dark_palette
+
     def _apply_theme(self, theme: str) -> None:
-        app = QtWidgets.QApplication.instance()
-        if not app:
-            return
+        app = self._app
         if theme == "dark":
-            palette = QtGui.QPalette()
-            palette.setColor(QtGui.QPalette.ColorRole.Window, QtGui.QColor(45, 45, 48))
-            palette.setColor(QtGui.QPalette.ColorRole.WindowText, QtGui.QColor(220, 220, 220))
-            palette.setColor(QtGui.QPalette.ColorRole.Base, QtGui.QColor(30, 30, 30))
-            palette.setColor(QtGui.QPalette.ColorRole.AlternateBase, QtGui.QColor(45, 45, 48))
-            palette.setColor(QtGui.QPalette.ColorRole.ToolTipBase, QtGui.QColor(255, 255, 255))
-            palette.setColor(QtGui.QPalette.ColorRole.ToolTipText, QtGui.QColor(45, 45, 48))
-            palette.setColor(QtGui.QPalette.ColorRole.Text, QtGui.QColor(230, 230, 230))
-            palette.setColor(QtGui.QPalette.ColorRole.Button, QtGui.QColor(60, 63, 65))
-            palette.setColor(QtGui.QPalette.ColorRole.ButtonText, QtGui.QColor(230, 230, 230))
-            palette.setColor(QtGui.QPalette.ColorRole.BrightText, QtGui.QColor(255, 59, 48))
-            palette.setColor(QtGui.QPalette.ColorRole.Highlight, QtGui.QColor(98, 114, 164))
-            palette.setColor(QtGui.QPalette.ColorRole.HighlightedText, QtGui.QColor(255, 255, 255))
-            app.setPalette(palette)
-            app.setStyleSheet(
-                "QToolTip { color: #1e1e1e; background-color: #f5f5f5; border: 1px solid #333; }"
-            )
+            app.setPalette(self._dark_palette())
+            app.setStyleSheet(self._DARK_STYLESHEET)
         else:
             app.setPalette(app.style().standardPalette())
             app.setStyleSheet("")
@@ -1887,11 +2242,33 @@ class MainWindow(QtWidgets.QMainWindow):
         if hasattr(self, "status_bar") and not initial:
             self.status_bar.showMessage(self.translator.tr("status_ready"))
 
+    def _stop_log_listener(self) -> None:
+        """Останавливает фоновую запись журнала и подключает файл напрямую.
+
+        Очередь дописывается в файл до возврата; записи, сделанные после
+        этого (например, при завершении приложения), идут в буфер файла без
+        фонового потока и сбрасываются ``logging.shutdown``.
+        """
+
+        if self._log_listener is None:
+            return
+        root_logger = logging.getLogger()
+        root_logger.removeHandler(self._log_queue_handler)
+        self._log_listener.stop()
+        self._log_listener = None
+        self._log_queue_handler = None
+        if self._log_file_handler:
+            root_logger.addHandler(self._log_file_handler)
+
     def _configure_file_logging(self) -> None:
         root_logger = logging.getLogger()
+        self._stop_log_listener()
         if self._log_file_handler:
             root_logger.removeHandler(self._log_file_handler)
+            target = self._log_file_handler.target
             self._log_file_handler.close()
+            if target is not None:
+                target.close()
             self._log_file_handler = None
 
         if not self.app_settings.log_to_file:
@@ -1902,10 +2279,30 @@ class MainWindow(QtWidgets.QMainWindow):
         path.parent.mkdir(parents=True, exist_ok=True)
         handler = logging.FileHandler(path, encoding="utf-8")
         handler.setLevel(logging.INFO)
-        formatter = logging.Formatter("%(asctime)s [%(levelname)s] %(name)s: %(message)s")
-        handler.setFormatter(formatter)
-        root_logger.addHandler(handler)
-        self._log_file_handler = handler
-        self.app_settings.log_file_path = str(path)
-        self.settings_manager.save(self.app_settings)
+        handler.setFormatter(_FILE_LOG_FORMATTER)
+        # Записи копятся в памяти и пишутся в файл пачкой: при заполнении
+        # буфера, на записи уровня ERROR и при закрытии окна или выходе.
+        buffered = logging.handlers.MemoryHandler(
+            self.FILE_LOG_BUFFER_CAPACITY,
+            flushLevel=logging.ERROR,
+            target=handler,
+        )
+        buffered.setLevel(logging.INFO)
+        # Поток, создавший запись (часто поток GUI), только кладёт её в
+        # очередь; форматирование и запись в файл выполняет QueueListener в
+        # фоновом потоке.
+        log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+        queue_handler = logging.handlers.QueueHandler(log_queue)
+        queue_handler.setLevel(logging.INFO)
+        listener = logging.handlers.QueueListener(
+            log_queue, buffered, respect_handler_level=True
+        )
+        listener.start()
+        root_logger.addHandler(queue_handler)
+        self._log_file_handler = buffered
+        self._log_queue_handler = queue_handler
+        self._log_listener = listener
+        if self.app_settings.log_file_path != str(path):
+            self.app_settings.log_file_path = str(path)
+            self._schedule_settings_save()
         logger.info("Включено сохранение журнала в файл: %s", path)
@@ -1,13 +1,15 @@
 """Helpers for running long operations in background threads."""
 from __future__ import annotations
 
+import threading
 from pathlib import Path
-from typing import Iterable
+from typing import Callable, Iterable
 
 from PySide6 import QtCore
 
-from ..core.video_processor import VideoProcessor
+from ..core.video_processor import SegmentProcessingError, VideoProcessor
 from ..models.segment import Segment
+from ..utils import ffmpeg_helper
 from ..utils.settings import AppSettings
 
 
@@ -15,11 +17,21 @@ class ProcessingWorker(QtCore.QObject):
     """Execute video processing in a worker thread.
 
     The worker emits simple signals that the UI can convert into
-    user-facing messages in the appropriate language.
+    user-facing messages in the appropriate language. Segments are
+    processed by ``VideoProcessor.slice_segments``, so the worker shares its
+    thread pool, its handling of segments writing to the same file and its
+    failure summary; per-segment callbacks from the pool become signals. A
+    failed segment is reported through ``segment_failed`` and does not stop
+    the others; once all segments are done, ``error_occurred`` carries one
+    summary of every failure. A stop
+    request is a ``threading.Event`` (optionally owned by the caller) shared
+    with ``VideoProcessor``, so the running ffmpeg process is interrupted
+    immediately rather than after the current segment finishes.
     """
 
     segment_started = QtCore.Signal(int, int, str)
     segment_finished = QtCore.Signal(int, int, str)
+    segment_failed = QtCore.Signal(str, str)
     progress_changed = QtCore.Signal(int)
     error_occurred = QtCore.Signal(str)
     finished = QtCore.Signal()
@@ -31,49 +43,139 @@ class ProcessingWorker(QtCore.QObject):
         output_dir: Path,
         segments: Iterable[Segment],
         settings: AppSettings,
+        *,
+        stop_event: threading.Event | None = None,
     ) -> None:
         super().__init__()
         self._input_file = input_file
         self._output_dir = output_dir
         self._segments = list(segments)
-        self._stop_requested = False
+        self._stop_event = stop_event or threading.Event()
         self._settings = settings.clone()
 
     @QtCore.Slot()
     def run(self) -> None:
+        """Process every segment and emit one of the final signals."""
+
         processor = VideoProcessor(
             self._input_file,
             self._output_dir,
             settings=self._settings,
+            cancel_event=self._stop_event,
         )
         total = len(self._segments)
         if total == 0:
             self.finished.emit()
             return
 
-        for index, segment in enumerate(self._segments, start=1):
-            if self._stop_requested:
-                self.stopped.emit()
-                return
+        indices = {
+            id(segment): index
+            for index, segment in enumerate(self._segments, start=1)
+        }
+        lock = threading.Lock()
+        processed = 0
+        last_percent = -1
+
+        def advance() -> int:
+            """Count one more done segment and return the running total."""
 
-            container = segment.container or self._input_file.suffix.lstrip(".") or "mp4"
-            display_name = (
-                segment.filename
-                or f"segment_{segment.index:03d}.{container}"
+            # Callbacks arrive from several pool threads at once.
+            nonlocal processed, last_percent
+            with lock:
+                processed += 1
+                # Integer percent; unchanged values are not sent to the GUI
+                # thread, so a job posts at most 101 progress events.
+                percent = processed * 100 // total
+                if percent != last_percent:
+                    last_percent = percent
+                    self.progress_changed.emit(percent)
+                return processed
+
+        def on_started(segment: Segment) -> None:
+            """Report a segment whose ffmpeg run or copy is starting."""
+
+            self.segment_started.emit(
+                indices[id(segment)], total, self._display_name(segment)
             )
-            self.segment_started.emit(index, total, display_name)
 
-            try:
-                processor.process_segment(segment)
-            except Exception as exc:  # noqa: BLE001
-                self.error_occurred.emit(str(exc))
-                return
+        def on_finished(segment: Segment) -> None:
+            """Report a saved segment and advance the progress."""
+
+            done = advance()
+            self.segment_finished.emit(done, total, self._display_name(segment))
 
-            percent = int(index / total * 100)
-            self.progress_changed.emit(percent)
-            self.segment_finished.emit(index, total, display_name)
+        def on_failed(segment: Segment, exc: Exception) -> None:
+            """Report a failed segment and advance the progress."""
 
-        self.finished.emit()
+            self.segment_failed.emit(self._display_name(segment), str(exc))
+            advance()
+
+        try:
+            processor.slice_segments(
+                self._segments,
+                on_started=on_started,
+                on_finished=on_finished,
+                on_failed=on_failed,
+            )
+        except ffmpeg_helper.FFmpegCancelledError:
+            self.stopped.emit()
+        except SegmentProcessingError as exc:
+            if self._stop_event.is_set():
+                self.stopped.emit()
+                return
+            self.error_occurred.emit(
+                "\n".join(
+                    f"{self._display_name(segment)}: {error}"
+                    for segment, error in exc.failures
+                )
+            )
+        except Exception as exc:  # noqa: BLE001
+            self.error_occurred.emit(str(exc))
+        else:
+            if self._stop_event.is_set():
+                self.stopped.emit()
+            else:
+                self.finished.emit()
+
+    def _display_name(self, segment: Segment) -> str:
+        container = segment.container or self._input_file.suffix.lstrip(".") or "mp4"
+        return segment.filename or f"segment_{segment.index:03d}.{container}"
 
     def request_stop(self) -> None:
-        self._stop_requested = True
+        self._stop_event.set()
+
+
+class ProbeWorker(QtCore.QObject):
+    """Run an ffprobe call in a worker thread.
+
+    Only the blocking call moves off the GUI thread; the caller keeps the
+    probe caches and receives the result through a queued signal. When an
+    ``encode`` callable is given, the result is also serialised here and
+    sent along, so showing it later costs the GUI thread nothing.
+    """
+
+    finished = QtCore.Signal(dict, str)
+    failed = QtCore.Signal(str)
+
+    def __init__(
+        self,
+        probe: Callable[[], dict],
+        encode: Callable[[dict], str] | None = None,
+    ) -> None:
+        """Store the blocking ``probe`` call and the optional ``encode`` step."""
+
+        super().__init__()
+        self._probe = probe
+        self._encode = encode
+
+    @QtCore.Slot()
+    def run(self) -> None:
+        """Run the probe and emit ``finished`` or ``failed``."""
+
+        try:
+            data = self._probe()
+        except Exception as exc:  # noqa: BLE001
+            self.failed.emit(str(exc))
+            return
+        text = self._encode(data) if self._encode is not None else ""
+        self.finished.emit(data, text)
@@ -1,7 +1,6 @@
 """Диалог для массового изменения параметров сегментов."""
 from __future__ import annotations
 
-from dataclasses import replace
 from typing import Iterable, List
 
 from PySide6 import QtWidgets
@@ -25,7 +24,7 @@ class SegmentBatchDialog(QtWidgets.QDialog):
     ) -> None:
         super().__init__(parent)
         self._translator = translator
-        self._segments: List[Segment] = [replace(segment) for segment in segments]
+        self._segments: List[Segment] = list(segments)
         reference = self._segments[0] if self._segments else Segment(start=0.0)
 
         self.setWindowTitle(self._translator.tr("batch_edit_title"))
@@ -24,7 +24,7 @@ class SegmentDialog(QtWidgets.QDialog):
         self.setWindowTitle(self.translator.tr("dialog_title"))
         self.setModal(True)
 
-        self.segment = replace(segment) if segment else Segment(start=0.0)
+        self.segment = segment or Segment(start=0.0)
         self._duration = duration if duration and duration > 0 else None
         self._duration_millis = (
             int(round(self._duration * 1000)) if self._duration is not None else None
@@ -234,20 +234,24 @@ class SegmentDialog(QtWidgets.QDialog):
         container = self.format_combo.currentText()
         convert = self.convert_checkbox.isChecked()
 
-        segment = replace(self.segment)
-        segment.start = start_time
-        segment.end = end_time
-        segment.filename = filename
-        segment.container = container
-        segment.convert = convert
-        segment.crf = self.crf_spin.value()
-        segment.remove_audio = self.remove_audio_checkbox.isChecked()
         if convert:
-            segment.video_codec = self.video_codec_combo.currentText()
-            segment.audio_codec = self.audio_codec_combo.currentText()
-            segment.extra_args = self.extra_args_edit.text().strip()
+            video_codec = self.video_codec_combo.currentText()
+            audio_codec = self.audio_codec_combo.currentText()
+            extra_args = self.extra_args_edit.text().strip()
         else:
-            segment.video_codec = "copy"
-            segment.audio_codec = "copy"
-            segment.extra_args = ""
-        return segment
+            video_codec = "copy"
+            audio_codec = "copy"
+            extra_args = ""
+        return replace(
+            self.segment,
+            start=start_time,
+            end=end_time,
+            filename=filename,
+            container=container,
+            convert=convert,
+            crf=self.crf_spin.value(),
+            remove_audio=self.remove_audio_checkbox.isChecked(),
+            video_codec=video_codec,
+            audio_codec=audio_codec,
+            extra_args=extra_args,
+        )
@@ -0,0 +1,340 @@
+"""Модель и делегат таблицы сегментов главного окна.
+
+``SegmentTableModel`` отображает список ``SegmentManager.segments`` без
+копирования: ячейки формируются по запросу представления и только для
+видимых строк. Столбцы «Метаинфо» и «Предпросмотр» рисуются делегатом
+``SegmentButtonDelegate`` как кнопки средствами ``QStyle``, без создания
+отдельного ``QPushButton`` на каждую строку.
+"""
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Callable
+
+from PySide6 import QtCore, QtGui, QtWidgets
+
+from ..core.segment_manager import SegmentManager
+from ..models.segment import Segment
+from ..utils.time_parser import format_time
+from .translations import Translator
+
+OutputPathResolver = Callable[[Segment, str], "Path | None"]
+"""Функция, возвращающая путь выходного файла сегмента (или ``None``)."""
+
+
+class SegmentTableModel(QtCore.QAbstractTableModel):
+    """Табличная модель поверх списка сегментов."""
+
+    COLUMN_COUNT = 8
+    METADATA_COLUMN = 6
+    PREVIEW_COLUMN = 7
+    BUTTON_COLUMNS = frozenset({METADATA_COLUMN, PREVIEW_COLUMN})
+    # Флаги ячеек вычисляются один раз: flags() вызывается представлением
+    # для каждой видимой ячейки при каждой отрисовке.
+    _DISABLED_FLAGS = QtCore.Qt.ItemFlag.ItemIsSelectable
+    _ENABLED_FLAGS = _DISABLED_FLAGS | QtCore.Qt.ItemFlag.ItemIsEnabled
+    _HEADER_KEYS = (
+        None,
+        "filename",
+        "start_time",
+        "end_time",
+        "format",
+        "convert_column",
+        "segment_metadata_column",
+        "preview",
+    )
+    _TEXT_KEYS = (
+        *(key for key in _HEADER_KEYS if key is not None),
+        "yes",
+        "no",
+        "preview",
+        "segment_metadata_column",
+        "segment_metadata_tooltip",
+        "segment_metadata_missing",
+        "tooltip_preview",
+    )
+
+    def __init__(
+        self,
+        segment_manager: SegmentManager,
+        translator: Translator,
+        output_path_resolver: OutputPathResolver,
+        parent: QtCore.QObject | None = None,
+    ) -> None:
+        """Создаёт модель поверх ``segment_manager``; данные заполняет ``refresh``."""
+
+        super().__init__(parent)
+        self._manager = segment_manager
+        self._translator = translator
+        self._resolve_output_path = output_path_resolver
+        self._row_count = 0
+        self._default_container = "mp4"
+        self._use_icons = True
+        self._output_paths: list[Path | None] = []
+        self._output_exists: list[bool] = []
+        self._metadata_icon = QtGui.QIcon()
+        self._preview_icon = QtGui.QIcon()
+        self._texts: dict[str, str] = {}
+        self._load_texts()
+
+    def refresh(self, *, default_container: str, use_icons: bool) -> None:
+        """Перечитывает сегменты и состояние выходных файлов одним сбросом модели."""
+
+        self.beginResetModel()
+        self._default_container = default_container
+        self._use_icons = use_icons
+        if use_icons and self._metadata_icon.isNull():
+            style = QtWidgets.QApplication.style()
+            self._metadata_icon = style.standardIcon(
+                QtWidgets.QStyle.StandardPixmap.SP_FileDialogInfoView
+            )
+            self._preview_icon = style.standardIcon(
+                QtWidgets.QStyle.StandardPixmap.SP_MediaPlay
+            )
+        segments = self._manager.segments
+        self._output_paths = [
+            self._resolve_output_path(segment, default_container)
+            for segment in segments
+        ]
+        self._output_exists = [
+            path is not None and path.is_file() for path in self._output_paths
+        ]
+        self._row_count = len(segments)
+        self.endResetModel()
+
+    def retranslate(self) -> None:
+        """Сообщает представлению о смене языка заголовков и ячеек.
+
+        Если переведённые подписи не изменились (например, при повторном
+        вызове ``retranslate_ui`` без смены языка), сигналы не отправляются и
+        представление не перерисовывается.
+        """
+
+        previous = self._texts
+        self._load_texts()
+        if self._texts == previous:
+            return
+        self.headerDataChanged.emit(
+            QtCore.Qt.Orientation.Horizontal, 0, self.COLUMN_COUNT - 1
+        )
+        if self._row_count:
+            self.dataChanged.emit(
+                self.index(0, 0),
+                self.index(self._row_count - 1, self.COLUMN_COUNT - 1),
+            )
+
+    def _load_texts(self) -> None:
+        """Переводит постоянные подписи ячеек один раз на смену языка."""
+
+        self._texts = {key: self._translator.tr(key) for key in self._TEXT_KEYS}
+
+    def output_path(self, row: int) -> Path | None:
+        """Путь выходного файла сегмента, вычисленный при последнем обновлении."""
+
+        if 0 <= row < len(self._output_paths):
+            return self._output_paths[row]
+        return None
+
+    def _has_output(self, row: int) -> bool:
+        """Существовал ли выходной файл строки при последнем обновлении."""
+
+        return 0 <= row < len(self._output_exists) and self._output_exists[row]
+
+    def rowCount(self, parent: QtCore.QModelIndex | None = None) -> int:
+        """Число сегментов на момент последнего обновления."""
+
+        return 0 if parent is not None and parent.isValid() else self._row_count
+
+    def columnCount(self, parent: QtCore.QModelIndex | None = None) -> int:
+        """Число столбцов таблицы; у строк дочерних элементов нет."""
+
+        return 0 if parent is not None and parent.isValid() else self.COLUMN_COUNT
+
+    def headerData(
+        self,
+        section: int,
+        orientation: QtCore.Qt.Orientation,
+        role: int = QtCore.Qt.ItemDataRole.DisplayRole,
+    ) -> object:
+        """Переведённый заголовок горизонтального столбца."""
+
+        if (
+            orientation != QtCore.Qt.Orientation.Horizontal
+            or role != QtCore.Qt.ItemDataRole.DisplayRole
+            or not 0 <= section < self.COLUMN_COUNT
+        ):
+            return None
+        key = self._HEADER_KEYS[section]
+        if key is None:
+            return "#"
+        return self._texts[key]
+
+    def flags(self, index: QtCore.QModelIndex) -> QtCore.Qt.ItemFlag:
+        """Готовые флаги ячейки; «Метаинфо» доступна, только если файл существует."""
+
+        if not index.isValid():
+            return QtCore.Qt.ItemFlag.NoItemFlags
+        if index.column() != self.METADATA_COLUMN or self._has_output(index.row()):
+            return self._ENABLED_FLAGS
+        return self._DISABLED_FLAGS
+
+    def data(
+        self,
+        index: QtCore.QModelIndex,
+        role: int = QtCore.Qt.ItemDataRole.DisplayRole,
+    ) -> object:
+        """Значение ячейки для роли ``role``; формируется по запросу представления."""
+
+        row = index.row()
+        if not index.isValid() or row >= len(self._manager.segments):
+            return None
+        column = index.column()
+        if role == QtCore.Qt.ItemDataRole.DisplayRole:
+            segment = self._manager.segments[row]
+            if column == 0:
+                # Номер отдаётся числом: без строки на каждую отрисовку, и
+                # прокси сортировки сравнивает номера как числа.
+                return segment.index
+            return self._display_text(segment, column)
+        if role == QtCore.Qt.ItemDataRole.DecorationRole and self._use_icons:
+            if column == self.METADATA_COLUMN:
+                return self._metadata_icon
+            if column == self.PREVIEW_COLUMN:
+                return self._preview_icon
+            return None
+        if role == QtCore.Qt.ItemDataRole.ToolTipRole:
+            if column == self.METADATA_COLUMN:
+                if self._has_output(row):
+                    return self._texts["segment_metadata_tooltip"]
+                return self._texts["segment_metadata_missing"]
+            if column == self.PREVIEW_COLUMN:
+                return self._texts["tooltip_preview"]
+            return None
+        if role == QtCore.Qt.ItemDataRole.AccessibleTextRole:
+            if column == self.METADATA_COLUMN:
+                return self._texts["segment_metadata_column"]
+            if column == self.PREVIEW_COLUMN:
+                return self._texts["preview"]
+        return None
+
+    def _display_text(self, segment: Segment, column: int) -> str:
+        """Текст ячейки столбца ``column`` для сегмента."""
+
+        if column == 1:
+            return segment.filename or ""
+        if column == 2:
+            return format_time(segment.start)
+        if column == 3:
+            return "" if segment.end is None else format_time(segment.end)
+        if column == 4:
+            return segment.container or self._default_container
+        if column == 5:
+            return self._texts["yes" if segment.convert else "no"]
+        if self._use_icons:
+            return ""
+        if column == self.METADATA_COLUMN:
+            return self._texts["segment_metadata_column"]
+        return self._texts["preview"]
+
+
+class SegmentButtonDelegate(QtWidgets.QStyledItemDelegate):
+    """Рисует ячейку как кнопку и сообщает о щелчке по ней.
+
+    Текст и иконка берутся из ролей ``DisplayRole``/``DecorationRole``, а
+    доступность — из флага ``ItemIsEnabled`` модели.
+    """
+
+    clicked = QtCore.Signal(QtCore.QModelIndex)
+
+    ICON_SIZE = QtCore.QSize(20, 20)
+    _MARGIN = 2
+
+    def paint(
+        self,
+        painter: QtGui.QPainter,
+        option: QtWidgets.QStyleOptionViewItem,
+        index: QtCore.QModelIndex,
+    ) -> None:
+        """Рисует ячейку как кнопку поверх фона выделения."""
+
+        if option.state & QtWidgets.QStyle.StateFlag.State_Selected:
+            painter.fillRect(option.rect, option.palette.highlight())
+        button = self._button_option(option, index)
+        self._style(option).drawControl(
+            QtWidgets.QStyle.ControlElement.CE_PushButton,
+            button,
+            painter,
+            option.widget,
+        )
+
+    def sizeHint(
+        self,
+        option: QtWidgets.QStyleOptionViewItem,
+        index: QtCore.QModelIndex,
+    ) -> QtCore.QSize:
+        """Размер кнопки с иконкой и текстом ячейки плюс поля."""
+
+        button = self._button_option(option, index)
+        contents = QtCore.QSize(0, self.ICON_SIZE.height())
+        if not button.icon.isNull():
+            contents.setWidth(self.ICON_SIZE.width())
+        if button.text:
+            text_width = button.fontMetrics.horizontalAdvance(button.text)
+            contents.setWidth(contents.width() + text_width + 4)
+        size = self._style(option).sizeFromContents(
+            QtWidgets.QStyle.ContentsType.CT_PushButton,
+            button,
+            contents,
+            option.widget,
+        )
+        return size + QtCore.QSize(2 * self._MARGIN, 2 * self._MARGIN)
+
+    def editorEvent(
+        self,
+        event: QtCore.QEvent,
+        model: QtCore.QAbstractItemModel,
+        option: QtWidgets.QStyleOptionViewItem,
+        index: QtCore.QModelIndex,
+    ) -> bool:
+        """Сообщает о щелчке левой кнопкой по доступной ячейке."""
+
+        if (
+            event.type() == QtCore.QEvent.Type.MouseButtonRelease
+            and event.button() == QtCore.Qt.MouseButton.LeftButton
+            and option.rect.contains(event.position().toPoint())
+            and index.flags() & QtCore.Qt.ItemFlag.ItemIsEnabled
+        ):
+            self.clicked.emit(index)
+            return True
+        return super().editorEvent(event, model, option, index)
+
+    def _button_option(
+        self,
+        option: QtWidgets.QStyleOptionViewItem,
+        index: QtCore.QModelIndex,
+    ) -> QtWidgets.QStyleOptionButton:
+        """Параметры отрисовки кнопки по данным и флагам ячейки."""
+
+        button = QtWidgets.QStyleOptionButton()
+        if option.widget is not None:
+            button.initFrom(option.widget)
+        button.rect = option.rect.adjusted(
+            self._MARGIN, self._MARGIN, -self._MARGIN, -self._MARGIN
+        )
+        button.text = index.data(QtCore.Qt.ItemDataRole.DisplayRole) or ""
+        icon = index.data(QtCore.Qt.ItemDataRole.DecorationRole)
+        if isinstance(icon, QtGui.QIcon):
+            button.icon = icon
+            button.iconSize = self.ICON_SIZE
+        button.state = QtWidgets.QStyle.StateFlag.State_Raised
+        if index.flags() & QtCore.Qt.ItemFlag.ItemIsEnabled:
+            button.state |= QtWidgets.QStyle.StateFlag.State_Enabled
+        return button
+
+    @staticmethod
+    def _style(option: QtWidgets.QStyleOptionViewItem) -> QtWidgets.QStyle:
+        """Стиль виджета представления или приложения."""
+
+        if option.widget is not None:
+            return option.widget.style()
+        return QtWidgets.QApplication.style()
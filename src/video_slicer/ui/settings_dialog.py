@@ -1,12 +1,13 @@
 """Диалог настроек приложения."""
 from __future__ import annotations
 
+import os
 from pathlib import Path
 
 from PySide6 import QtCore, QtGui, QtWidgets
 
 from ..utils import ffmpeg_helper
-from ..utils.settings import AppSettings, default_log_file
+from ..utils.settings import ENCODER_PRESETS, AppSettings, default_log_file
 from .translations import Translator
 
 
@@ -84,6 +85,26 @@ class SettingsDialog(QtWidgets.QDialog):
         )
         self.icon_buttons_checkbox.setChecked(self._settings.use_icon_buttons)
 
+        self.max_workers_spin = QtWidgets.QSpinBox()
+        self.max_workers_spin.setRange(0, max(1, os.cpu_count() or 1))
+        self.max_workers_spin.setSpecialValueText(
+            self.translator.tr("settings_max_workers_auto")
+        )
+        self.max_workers_spin.setValue(self._settings.max_workers)
+
+        self.preset_combo = QtWidgets.QComboBox()
+        self.preset_combo.addItem(self.translator.tr("settings_preset_default"), None)
+        for preset in ENCODER_PRESETS:
+            self.preset_combo.addItem(preset, preset)
+        index = self.preset_combo.findData(self._settings.preset)
+        if index >= 0:
+            self.preset_combo.setCurrentIndex(index)
+
+        self.fast_encode_checkbox = QtWidgets.QCheckBox(
+            self.translator.tr("settings_fast_encode")
+        )
+        self.fast_encode_checkbox.setChecked(self._settings.fast_encode)
+
         ffmpeg_layout = QtWidgets.QHBoxLayout()
         ffmpeg_layout.addWidget(self.ffmpeg_edit)
         ffmpeg_layout.addWidget(self.ffmpeg_browse)
@@ -102,6 +123,11 @@ class SettingsDialog(QtWidgets.QDialog):
         form_layout.addRow(self.strip_metadata_checkbox)
         form_layout.addRow(self.embed_metadata_checkbox)
         form_layout.addRow(self.icon_buttons_checkbox)
+        form_layout.addRow(
+            self.translator.tr("settings_max_workers"), self.max_workers_spin
+        )
+        form_layout.addRow(self.translator.tr("settings_preset"), self.preset_combo)
+        form_layout.addRow(self.fast_encode_checkbox)
 
         self.button_box = QtWidgets.QDialogButtonBox(
             QtWidgets.QDialogButtonBox.StandardButton.Ok
@@ -164,4 +190,7 @@ class SettingsDialog(QtWidgets.QDialog):
         result.strip_metadata = self.strip_metadata_checkbox.isChecked()
         result.embed_svs_metadata = self.embed_metadata_checkbox.isChecked()
         result.use_icon_buttons = self.icon_buttons_checkbox.isChecked()
+        result.max_workers = self.max_workers_spin.value()
+        result.preset = self.preset_combo.currentData()
+        result.fast_encode = self.fast_encode_checkbox.isChecked()
         return result
@@ -24,6 +24,11 @@ TRANSLATIONS: Dict[str, Translation] = {
         "нет данных",
         "n/a",
     ),
+    "file_info_probing": Translation(
+        "file_info_probing",
+        "Чтение сведений о файле...",
+        "Reading file information...",
+    ),
     "browse": Translation("browse", "Обзор...", "Browse..."),
     "metadata_button": Translation("metadata_button", "Метаинфо", "Metadata"),
     "metadata_tooltip": Translation(
@@ -161,6 +166,31 @@ TRANSLATIONS: Dict[str, Translation] = {
         "Использовать иконки вместо надписей",
         "Use icons instead of button labels",
     ),
+    "settings_max_workers": Translation(
+        "settings_max_workers",
+        "Параллельных процессов FFmpeg",
+        "Parallel FFmpeg processes",
+    ),
+    "settings_max_workers_auto": Translation(
+        "settings_max_workers_auto",
+        "Авто",
+        "Auto",
+    ),
+    "settings_preset": Translation(
+        "settings_preset",
+        "Пресет кодирования (x264/x265)",
+        "Encoding preset (x264/x265)",
+    ),
+    "settings_preset_default": Translation(
+        "settings_preset_default",
+        "По умолчанию",
+        "Default",
+    ),
+    "settings_fast_encode": Translation(
+        "settings_fast_encode",
+        "Быстрое кодирование (-tune zerolatency, ниже качество)",
+        "Fast encoding (-tune zerolatency, lower quality)",
+    ),
     "theme_light": Translation("theme_light", "Светлая", "Light"),
     "theme_dark": Translation("theme_dark", "Тёмная", "Dark"),
     "help_manual": Translation("help_manual", "Руководство пользователя", "User guide"),
@@ -532,6 +562,11 @@ Additional:
         "Завершено: {name}",
         "Completed: {name}",
     ),
+    "log_segment_failed": Translation(
+        "log_segment_failed",
+        "Ошибка: {name}: {error}",
+        "Failed: {name}: {error}",
+    ),
     "log_copy_success": Translation(
         "log_copy_success",
         "Журнал скопирован в буфер обмена",
@@ -572,6 +607,11 @@ Additional:
         "Обработка завершена успешно",
         "Processing completed successfully",
     ),
+    "processing_failed": Translation(
+        "processing_failed",
+        "Обработка завершена, но часть сегментов не создана",
+        "Processing finished, but some segments failed",
+    ),
     "processing_stop_requested": Translation(
         "processing_stop_requested",
         "Запрошена остановка обработки",
@@ -651,21 +691,25 @@ Additional:
 }
 
 
+# Плоские словари «ключ → строка» для каждого языка, собранные при импорте:
+# перевод сводится к одному поиску в словаре без getattr.
+_CATALOGS: Dict[str, Dict[str, str]] = {
+    language: {key: getattr(item, language) for key, item in TRANSLATIONS.items()}
+    for language in ("ru", "en")
+}
+
+
 class Translator:
     """Простая реализация переводчика."""
 
     def __init__(self, language: str = "ru") -> None:
-        if language not in {"ru", "en"}:
-            raise ValueError("Поддерживаются только языки 'ru' и 'en'")
-        self.language = language
+        self.set_language(language)
 
     def set_language(self, language: str) -> None:
-        if language not in {"ru", "en"}:
+        if language not in _CATALOGS:
             raise ValueError("Поддерживаются только языки 'ru' и 'en'")
         self.language = language
+        self._catalog = _CATALOGS[language]
 
     def tr(self, key: str) -> str:
-        translation = TRANSLATIONS.get(key)
-        if not translation:
-            return key
-        return getattr(translation, self.language)
+        return self._catalog.get(key, key)
@@ -5,17 +5,40 @@ import json
 import logging
 import shutil
 import subprocess
+import threading
+from functools import lru_cache
 from pathlib import Path
-from typing import Iterable, List, Sequence
+from typing import IO, Iterable, List, Sequence
 
 from .time_parser import format_time
 
 logger = logging.getLogger(__name__)
 
+_PIPE_BUFFER_SIZE = 1 << 20
+_PIPE_READ_CHUNK = 1 << 16
+_CANCEL_POLL_INTERVAL = 0.1
+_FAST_PROBE_ARGS = ("-probesize", "32768", "-analyzeduration", "0")
+# Запас после начала сегмента, чтобы ключевой кадр ровно в этот момент попал
+# в окно чтения ffprobe.
+_KEYFRAME_EPSILON = 0.001
+
+# Длина окна (в секундах) перед началом сегмента, в котором ищется ключевой
+# кадр; типичный интервал между ключевыми кадрами заметно меньше.
+KEYFRAME_SEARCH_WINDOW = 20.0
+
+# Общий декодер JSON для вывода ffprobe.
+_JSON_DECODER = json.JSONDecoder()
+
+MP4_LIKE_EXTENSIONS = frozenset({".mp4", ".m4a", ".mov", ".m4v"})
+
 _ffmpeg_command: Sequence[str] = ("ffmpeg",)
 _ffprobe_command: Sequence[str] = ("ffprobe",)
 
 
+class FFmpegCancelledError(RuntimeError):
+    """Процесс ffmpeg остановлен по запросу пользователя."""
+
+
 def set_ffmpeg_paths(ffmpeg: str | None, ffprobe: str | None = None) -> None:
     """Configure explicit paths for ffmpeg/ffprobe commands."""
 
@@ -46,39 +69,118 @@ def ensure_ffmpeg_available() -> None:
     )
 
 
-def run_ffmpeg(args: Iterable[str]) -> subprocess.CompletedProcess[str]:
-    """Запускает ffmpeg с заданными аргументами и возвращает результат."""
+def run_ffmpeg(
+    args: Iterable[str],
+    *,
+    cancel_event: threading.Event | None = None,
+) -> subprocess.CompletedProcess[str]:
+    """Запускает ffmpeg с заданными аргументами и возвращает результат.
+
+    stdout ffmpeg не используется и направляется в ``DEVNULL``. stderr читается
+    крупными блоками в отдельном потоке через буфер размером 1 МиБ, поэтому при
+    большом объёме диагностики (параллельная нарезка) ffmpeg не блокируется на
+    заполненном канале. Текст stderr возвращается в поле ``stderr`` результата.
+
+    Если передан ``cancel_event``, он проверяется во время работы процесса:
+    после его установки ffmpeg завершается и выбрасывается
+    ``FFmpegCancelledError``.
+    """
     ensure_ffmpeg_available()
     command = [*_ffmpeg_command, "-y", *args]
-    logger.debug("Запуск команды FFmpeg: %s", " ".join(command))
-    result = subprocess.run(
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Запуск команды FFmpeg: %s", " ".join(command))
+    process = subprocess.Popen(
         command,
-        stdout=subprocess.PIPE,
+        stdout=subprocess.DEVNULL,
         stderr=subprocess.PIPE,
-        text=True,
-        encoding="utf-8",
-        errors="replace",
-        check=False,
+        bufsize=_PIPE_BUFFER_SIZE,
     )
-    if result.returncode != 0:
-        logger.error("FFmpeg завершился с ошибкой: %s", result.stderr)
-        raise RuntimeError(result.stderr.strip())
-    return result
+    chunks: List[bytes] = []
+    reader = threading.Thread(
+        target=_drain_pipe, args=(process.stderr, chunks), daemon=True
+    )
+    reader.start()
+    returncode = _wait_process(process, cancel_event)
+    reader.join()
+    if returncode is None:
+        raise FFmpegCancelledError("FFmpeg остановлен пользователем")
+    stderr = b"".join(chunks).decode("utf-8", errors="replace")
+    if returncode != 0:
+        logger.error("FFmpeg завершился с ошибкой: %s", stderr)
+        raise RuntimeError(stderr.strip())
+    return subprocess.CompletedProcess(command, returncode, "", stderr)
+
 
+def _wait_process(
+    process: subprocess.Popen, cancel_event: threading.Event | None
+) -> int | None:
+    """Ожидает завершения процесса; ``None`` — процесс прерван ``cancel_event``."""
+    if cancel_event is None:
+        return process.wait()
+    # Ожидание идёт на самом процессе: обычное завершение возвращается сразу,
+    # а флаг остановки проверяется между интервалами.
+    while not cancel_event.is_set():
+        try:
+            return process.wait(timeout=_CANCEL_POLL_INTERVAL)
+        except subprocess.TimeoutExpired:
+            continue
+    process.terminate()
+    try:
+        process.wait(timeout=5)
+    except subprocess.TimeoutExpired:
+        process.kill()
+        process.wait()
+    return None
 
-def probe_file(path: Path) -> dict:
-    """Получает информацию о видеофайле с помощью ffprobe."""
+
+def _drain_pipe(pipe: IO[bytes], sink: List[bytes]) -> None:
+    """Вычитывает канал до конца блоками по 64 КиБ и закрывает его."""
+    with pipe:
+        sink.extend(iter(lambda: pipe.read(_PIPE_READ_CHUNK), b""))
+
+
+def probe_file(path: Path, *, fast: bool = False) -> dict:
+    """Получает информацию о видеофайле с помощью ffprobe.
+
+    При ``fast=True`` ffprobe ограничивается заголовком контейнера
+    (``-probesize 32K -analyzeduration 0``) и не анализирует пакеты потоков.
+    Для MP4/MKV с корректным заголовком этого достаточно, но часть полей
+    (например, размеры кадра у потоков без параметров в заголовке) может
+    отсутствовать.
+    """
     command = [
         *_ffprobe_command,
         "-v",
         "error",
+        *(_FAST_PROBE_ARGS if fast else ()),
         "-show_format",
         "-show_streams",
         "-print_format",
         "json",
         str(path),
     ]
-    logger.debug("Запуск команды ffprobe: %s", " ".join(command))
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Запуск команды ffprobe: %s", " ".join(command))
+    # Вывод читается байтами и декодируется один раз целиком, без построчной
+    # обработки текстового потока; stderr нужен только при ошибке.
+    result = subprocess.run(
+        command,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        check=False,
+    )
+    if result.returncode != 0:
+        stderr = result.stderr.decode("utf-8", errors="replace")
+        logger.error("ffprobe завершился с ошибкой: %s", stderr)
+        raise RuntimeError(stderr.strip())
+    return _JSON_DECODER.decode(result.stdout.decode("utf-8", errors="replace"))
+
+
+def _run_ffprobe(arguments: Sequence[str]) -> str:
+    """Запускает ffprobe и возвращает его stdout; при ошибке — ``RuntimeError``."""
+    command = [*_ffprobe_command, "-v", "error", *arguments]
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Запуск команды ffprobe: %s", " ".join(command))
     result = subprocess.run(
         command,
         stdout=subprocess.PIPE,
@@ -91,7 +193,74 @@ def probe_file(path: Path) -> dict:
     if result.returncode != 0:
         logger.error("ffprobe завершился с ошибкой: %s", result.stderr)
         raise RuntimeError(result.stderr.strip())
-    return json.loads(result.stdout)
+    return result.stdout
+
+
+def probe_start_time(path: Path) -> float:
+    """Возвращает ``format.start_time`` файла (0, если значение не задано)."""
+    output = _run_ffprobe(
+        ["-show_entries", "format=start_time", "-of", "csv=p=0", str(path)]
+    )
+    try:
+        return float(output.strip() or 0)
+    except ValueError:
+        return 0.0
+
+
+def probe_keyframes(
+    path: Path,
+    starts: Iterable[float],
+    *,
+    window: float = KEYFRAME_SEARCH_WINDOW,
+) -> List[float]:
+    """Возвращает ключевые кадры первого видеопотока перед моментами ``starts``.
+
+    ffprobe читает только заголовки пакетов в окнах по ``window`` секунд,
+    заканчивающихся в каждом из ``starts`` (``-read_intervals``), поэтому
+    время запроса не зависит от длины файла. Времена отсчитываются от начала
+    контейнера, как значение ``-ss``: из ``pts_time`` вычитается
+    ``format.start_time``, ненулевой, например, у MPEG-TS и обрезанных MP4.
+    Результат отсортирован и не содержит повторов.
+    """
+    points = sorted(set(starts))
+    if not points:
+        return []
+    offset = probe_start_time(path)
+    # Пересекающиеся окна объединяются, чтобы пакеты не читались дважды.
+    windows: List[List[float]] = []
+    for point in points:
+        begin = max(0.0, point - window)
+        end = point + _KEYFRAME_EPSILON
+        if windows and begin <= windows[-1][1]:
+            windows[-1][1] = end
+        else:
+            windows.append([begin, end])
+    intervals = ",".join(
+        f"{offset + begin:.6f}%{offset + end:.6f}" for begin, end in windows
+    )
+    output = _run_ffprobe(
+        [
+            "-select_streams",
+            "v:0",
+            "-read_intervals",
+            intervals,
+            "-show_entries",
+            "packet=pts_time,flags",
+            "-of",
+            "csv=p=0",
+            str(path),
+        ]
+    )
+    keyframes: set[float] = set()
+    for line in output.splitlines():
+        time_text, _, flags = line.partition(",")
+        if not flags.startswith("K"):
+            continue
+        try:
+            keyframes.add(round(float(time_text) - offset, 6))
+        except ValueError:
+            continue
+    return sorted(keyframes)
 
 
 def generate_thumbnail(input_file: Path, timestamp: float, output_file: Path) -> Path:
@@ -110,6 +279,28 @@ def generate_thumbnail(input_file: Path, timestamp: float, output_file: Path) ->
     return output_file
 
 
+def is_mp4_like(path: Path) -> bool:
+    """Проверяет, использует ли выходной файл контейнер семейства MP4/QuickTime."""
+    return path.suffix.lower() in MP4_LIKE_EXTENSIONS
+
+
+def faststart_args(output_file: Path, extra_args: Iterable[str] = ()) -> List[str]:
+    """Возвращает ``-movflags +faststart`` для MP4-подобных файлов.
+
+    Атом ``moov`` переносится в начало файла, и результат можно воспроизводить
+    потоково. Если пользователь сам передал ``-movflags`` (например, для
+    фрагментированного MP4), флаг не добавляется.
+    """
+    if not is_mp4_like(output_file) or "-movflags" in extra_args:
+        return []
+    return ["-movflags", "+faststart"]
+
+
+@lru_cache(maxsize=4096)
 def format_seconds(value: float) -> str:
-    """Форматирует секунды в строку для передачи в FFmpeg."""
+    """Форматирует секунды в строку для передачи в FFmpeg.
+
+    Результат кэшируется: границы соседних сегментов (конец одного и начало
+    следующего) совпадают, и одно значение форматируется многократно.
+    """
     return format_time(value).rstrip("0").rstrip(".")
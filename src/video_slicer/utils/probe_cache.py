@@ -0,0 +1,94 @@
+"""Дисковый кэш результатов ffprobe, сохраняемый между запусками."""
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+from collections import OrderedDict
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+_JSON_ENCODER = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+_HEAD_SIZE = 4096
+
+
+class ProbeCache:
+    """Хранит данные ffprobe в JSON-файле с ограничением числа записей.
+
+    Ключ записи (см. ``make_key``) не зависит от пути: переименованный или
+    перемещённый файл находится в кэше, а изменённый — нет. Файл кэша
+    читается при первом обращении, а записывается методом ``save`` (через
+    временный файл и атомарную замену) и только если с момента загрузки
+    появились новые записи. Старые записи вытесняются первыми.
+    """
+
+    def __init__(self, path: Path, max_entries: int = 512) -> None:
+        """Создаёт кэш в файле ``path``; сам файл читается при первом обращении."""
+
+        self._path = path
+        self._max_entries = max_entries
+        self._entries: OrderedDict[str, dict] | None = None
+        self._dirty = False
+
+    @staticmethod
+    def make_key(path: Path, stat: os.stat_result, fast: bool = False) -> str:
+        """Ключ файла: SHA-256 первых 4 КиБ, размер и время изменения."""
+
+        with path.open("rb") as handle:
+            digest = hashlib.sha256(handle.read(_HEAD_SIZE)).hexdigest()
+        mode = "fast" if fast else "full"
+        return f"{digest}:{stat.st_size}:{stat.st_mtime_ns}:{mode}"
+
+    def get(self, key: str) -> dict | None:
+        """Возвращает данные по ключу (или ``None``) и отмечает запись свежей."""
+
+        entries = self._load()
+        data = entries.get(key)
+        if data is not None:
+            entries.move_to_end(key)
+        return data
+
+    def put(self, key: str, data: dict) -> None:
+        """Сохраняет данные в памяти, вытесняя самые старые записи сверх лимита."""
+
+        entries = self._load()
+        entries[key] = data
+        entries.move_to_end(key)
+        while len(entries) > self._max_entries:
+            entries.popitem(last=False)
+        self._dirty = True
+
+    def save(self) -> None:
+        """Записывает кэш на диск, если в нём есть несохранённые записи."""
+
+        if not self._dirty or self._entries is None:
+            return
+        try:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            temporary = self._path.with_suffix(".tmp")
+            temporary.write_text(_JSON_ENCODER.encode(self._entries), encoding="utf-8")
+            temporary.replace(self._path)
+        except OSError as exc:
+            logger.warning("Не удалось сохранить кэш ffprobe %s: %s", self._path, exc)
+            return
+        self._dirty = False
+
+    def _load(self) -> OrderedDict[str, dict]:
+        """Читает файл кэша один раз; повреждённый файл считается пустым."""
+
+        if self._entries is None:
+            self._entries = OrderedDict()
+            try:
+                raw = json.loads(self._path.read_text(encoding="utf-8"))
+            except FileNotFoundError:
+                raw = {}
+            except (OSError, ValueError) as exc:
+                logger.warning("Кэш ffprobe %s не прочитан: %s", self._path, exc)
+                raw = {}
+            if isinstance(raw, dict):
+                for key, value in raw.items():
+                    if isinstance(value, dict):
+                        self._entries[key] = value
+        return self._entries
@@ -6,6 +6,19 @@ from pathlib import Path
 
 from PySide6 import QtCore
 
+ENCODER_PRESETS = (
+    "ultrafast",
+    "superfast",
+    "veryfast",
+    "faster",
+    "fast",
+    "medium",
+    "slow",
+    "slower",
+    "veryslow",
+)
+"""Пресеты x264/x265, доступные для выбора в настройках."""
+
 
 def detect_system_language() -> str:
     """Return the preferred language based on the system locale."""
@@ -16,8 +29,8 @@ def detect_system_language() -> str:
     return "en"
 
 
-def default_log_file() -> Path:
-    """Return the default log file location."""
+def app_data_dir() -> Path:
+    """Return (and create) the per-user application data directory."""
 
     base_dir = Path(QtCore.QStandardPaths.writableLocation(
         QtCore.QStandardPaths.StandardLocation.AppDataLocation
@@ -25,7 +38,19 @@ def default_log_file() -> Path:
     if not base_dir:
         base_dir = Path.home() / ".simple-video-slicer"
     base_dir.mkdir(parents=True, exist_ok=True)
-    return base_dir / "svs.log"
+    return base_dir
+
+
+def default_log_file() -> Path:
+    """Return the default log file location."""
+
+    return app_data_dir() / "svs.log"
+
+
+def default_probe_cache_file() -> Path:
+    """Return the location of the persistent ffprobe cache."""
+
+    return app_data_dir() / "probe_cache.json"
 
 
 @dataclass
@@ -42,6 +67,9 @@ class AppSettings:
     strip_metadata: bool = False
     embed_svs_metadata: bool = True
     use_icon_buttons: bool = True
+    max_workers: int = 0
+    preset: str | None = None
+    fast_encode: bool = False
 
     def clone(self) -> "AppSettings":
         return replace(self)
@@ -68,11 +96,17 @@ class SettingsManager:
             strip_metadata=self._settings.value("strip_metadata", False, bool),
             embed_svs_metadata=self._settings.value("embed_svs_metadata", True, bool),
             use_icon_buttons=self._settings.value("use_icon_buttons", True, bool),
+            max_workers=self._settings.value("max_workers", 0, int),
+            preset=self._settings.value("preset", type=str),
+            fast_encode=self._settings.value("fast_encode", False, bool),
         )
         if data.language not in {"ru", "en"}:
             data.language = None
         if data.theme not in {"light", "dark"}:
             data.theme = "light"
+        data.max_workers = max(data.max_workers, 0)
+        if data.preset not in ENCODER_PRESETS:
+            data.preset = None
         return data
 
     def save(self, settings: AppSettings) -> None:
@@ -86,4 +120,7 @@ class SettingsManager:
         self._settings.setValue("strip_metadata", settings.strip_metadata)
         self._settings.setValue("embed_svs_metadata", settings.embed_svs_metadata)
         self._settings.setValue("use_icon_buttons", settings.use_icon_buttons)
+        self._settings.setValue("max_workers", settings.max_workers)
+        self._settings.setValue("preset", settings.preset)
+        self._settings.setValue("fast_encode", settings.fast_encode)
         self._settings.sync()
@@ -7,7 +7,8 @@ from pathlib import Path
 from .time_parser import parse_time
 from . import ffmpeg_helper
 
-SUPPORTED_INPUT_EXTENSIONS = {
+# Порядок важен для фильтра диалога выбора файла; проверки идут по множеству.
+INPUT_EXTENSIONS = (
     ".mp4",
     ".avi",
     ".mkv",
@@ -19,15 +20,18 @@ SUPPORTED_INPUT_EXTENSIONS = {
     ".mpeg",
     ".m4v",
     ".3gp",
-}
+)
+SUPPORTED_INPUT_EXTENSIONS = frozenset(INPUT_EXTENSIONS)
 
-SUPPORTED_OUTPUT_EXTENSIONS = {
-    ".mp4",
-    ".mkv",
-    ".avi",
-    ".webm",
-    ".mov",
-}
+SUPPORTED_OUTPUT_EXTENSIONS = frozenset(
+    {
+        ".mp4",
+        ".mkv",
+        ".avi",
+        ".webm",
+        ".mov",
+    }
+)
 
 
 def ensure_ffmpeg_available() -> None:
@@ -1,7 +1,36 @@
+import os
 import sys
 from pathlib import Path
 
+import pytest
+
 ROOT = Path(__file__).resolve().parents[1]
 SRC = ROOT / "src"
 if SRC.exists():
     sys.path.insert(0, str(SRC))
+
+
+@pytest.fixture
+def ffmpeg_calls(monkeypatch):
+    """Подменяет запуск ffmpeg и собирает переданные аргументы."""
+
+    from video_slicer.utils import ffmpeg_helper
+
+    calls: list[list[str]] = []
+
+    def fake_run_ffmpeg(args, cancel_event=None):
+        calls.append(list(args))
+
+    monkeypatch.setattr(ffmpeg_helper, "run_ffmpeg", fake_run_ffmpeg)
+    monkeypatch.setattr(ffmpeg_helper, "probe_keyframes", lambda path, starts: [])
+    return calls
+
+
+@pytest.fixture(scope="session")
+def qapp():
+    """Создаёт QApplication без оконной системы для тестов виджетов."""
+
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    widgets = pytest.importorskip("PySide6.QtWidgets")
+    app = widgets.QApplication.instance() or widgets.QApplication([])
+    return app
@@ -0,0 +1,48 @@
+import re
+
+import pytest
+
+from video_slicer.ui.bulk_segment_dialog import BulkSegmentDialog
+from video_slicer.ui.translations import Translator
+
+
+def test_invalid_separator_chars():
+    assert BulkSegmentDialog._contains_invalid_separator_chars("a/b")
+    assert BulkSegmentDialog._contains_invalid_separator_chars("\\")
+    assert not BulkSegmentDialog._contains_invalid_separator_chars(" - ")
+
+
+def test_parse_lines(qapp):
+    dialog = BulkSegmentDialog(None, Translator("en"))
+    entries = dialog._parse_lines("00:00 Intro\n01:30 - Part one\n\n1:02:03.5 Final")
+    assert entries == [(0.0, "Intro"), (90.0, "Part one"), (3723.5, "Final")]
+
+
+def test_parse_lines_rejects_unordered(qapp):
+    translator = Translator("en")
+    dialog = BulkSegmentDialog(None, translator)
+    message = translator.tr("bulk_create_error_order").format(line=3)
+    with pytest.raises(ValueError, match=f"^{re.escape(message)}$"):
+        dialog._parse_lines("00:01 A\n00:10 B\n00:10 C\n00:05 D")
+
+
+@pytest.mark.parametrize(
+    ("text", "key"),
+    [
+        ("intro", "bulk_create_error_format"),
+        ("00:10 -", "bulk_create_error_title"),
+        ("1:2:3 Bad", "bulk_create_error_time"),
+    ],
+)
+def test_parse_lines_errors(qapp, text, key):
+    translator = Translator("en")
+    dialog = BulkSegmentDialog(None, translator)
+    message = translator.tr(key).format(line=1)
+    with pytest.raises(ValueError, match=f"^{re.escape(message)}$"):
+        dialog._parse_lines(text)
+
+
+def test_parse_lines_title_edge_cases(qapp):
+    dialog = BulkSegmentDialog(None, Translator("en"))
+    entries = dialog._parse_lines("  00:05  \n00:10 -- odd \n00:20 — Dash  ")
+    assert entries == [(5.0, None), (10.0, "- odd"), (20.0, "Dash")]
@@ -0,0 +1,108 @@
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from video_slicer.utils import ffmpeg_helper
+
+
+def _fake_ffmpeg(tmp_path: Path, code: str) -> str:
+    script = tmp_path / "fake_ffmpeg.py"
+    script.write_text(f"import sys\n{code}\n", encoding="utf-8")
+    return str(script)
+
+
+def test_run_ffmpeg_collects_stderr(monkeypatch, tmp_path):
+    script = _fake_ffmpeg(
+        tmp_path, "sys.stderr.write('x' * 300000)\nsys.stdout.write('ignored')"
+    )
+    monkeypatch.setattr(ffmpeg_helper, "_ffmpeg_command", (sys.executable, script))
+    result = ffmpeg_helper.run_ffmpeg(["-i", "input.mp4"])
+    assert result.returncode == 0
+    assert len(result.stderr) == 300000
+
+
+def test_run_ffmpeg_raises_with_stderr(monkeypatch, tmp_path):
+    script = _fake_ffmpeg(tmp_path, "sys.stderr.write('bad input\\n')\nsys.exit(1)")
+    monkeypatch.setattr(ffmpeg_helper, "_ffmpeg_command", (sys.executable, script))
+    with pytest.raises(RuntimeError, match="bad input"):
+        ffmpeg_helper.run_ffmpeg(["-i", "input.mp4"])
+
+
+def test_run_ffmpeg_cancel_terminates_process(monkeypatch, tmp_path):
+    script = _fake_ffmpeg(tmp_path, "import time\ntime.sleep(30)")
+    monkeypatch.setattr(ffmpeg_helper, "_ffmpeg_command", (sys.executable, script))
+    cancel = threading.Event()
+    threading.Timer(0.2, cancel.set).start()
+    started = time.monotonic()
+    with pytest.raises(ffmpeg_helper.FFmpegCancelledError):
+        ffmpeg_helper.run_ffmpeg(["-i", "input.mp4"], cancel_event=cancel)
+    assert time.monotonic() - started < 10
+
+
+def test_wait_process_returns_as_soon_as_process_exits():
+    class FinishedProcess:
+        def __init__(self):
+            self.timeouts = []
+
+        def wait(self, timeout=None):
+            self.timeouts.append(timeout)
+            return 0
+
+    process = FinishedProcess()
+    started = time.monotonic()
+    assert ffmpeg_helper._wait_process(process, threading.Event()) == 0
+    assert time.monotonic() - started < ffmpeg_helper._CANCEL_POLL_INTERVAL
+    assert process.timeouts == [ffmpeg_helper._CANCEL_POLL_INTERVAL]
+
+
+def test_fast_probe_limits_header_analysis(monkeypatch, tmp_path):
+    script = _fake_ffmpeg(
+        tmp_path, "import json\nprint(json.dumps({'args': sys.argv[1:]}))"
+    )
+    monkeypatch.setattr(ffmpeg_helper, "_ffprobe_command", (sys.executable, script))
+    full = ffmpeg_helper.probe_file(Path("input.mp4"))["args"]
+    fast = ffmpeg_helper.probe_file(Path("input.mp4"), fast=True)["args"]
+    assert "-probesize" not in full
+    assert fast[fast.index("-analyzeduration") + 1] == "0"
+    assert fast[-1] == "input.mp4"
+
+
+def test_faststart_args():
+    assert ffmpeg_helper.faststart_args(Path("a.MP4")) == ["-movflags", "+faststart"]
+    assert ffmpeg_helper.faststart_args(Path("a.mkv")) == []
+
+
+def test_probe_file_decodes_non_utf8_tags(monkeypatch, tmp_path):
+    script = _fake_ffmpeg(
+        tmp_path,
+        "sys.stdout.buffer.write(b'{\"format\": {\"tags\": {\"title\": \"\\xff\"}}}')",
+    )
+    monkeypatch.setattr(ffmpeg_helper, "_ffprobe_command", (sys.executable, script))
+    data = ffmpeg_helper.probe_file(Path("input.mp4"))
+    assert data["format"]["tags"]["title"] == "\ufffd"
+
+
+def test_probe_keyframes_reads_windows_relative_to_start_time(monkeypatch, tmp_path):
+    args_file = tmp_path / "args.txt"
+    script = _fake_ffmpeg(
+        tmp_path,
+        "if '-read_intervals' not in sys.argv:\n"
+        "    print('1.400000')\n"
+        "    sys.exit()\n"
+        f"open({str(args_file)!r}, 'w').write(' '.join(sys.argv[1:]))\n"
+        "print('11.400000,K_')\n"
+        "print('13.400000,__')\n"
+        "print('31.400000,K_')\n"
+        "print('31.400000,K_')",
+    )
+    monkeypatch.setattr(ffmpeg_helper, "_ffprobe_command", (sys.executable, script))
+    keyframes = ffmpeg_helper.probe_keyframes(Path("input.ts"), [12, 40, 5], window=10)
+    assert keyframes == [10.0, 30.0]
+    args = args_file.read_text(encoding="utf-8").split()
+    assert args[args.index("-read_intervals") + 1] == (
+        "1.400000%13.401000,31.400000%41.401000"
+    )
+    assert ffmpeg_helper.probe_keyframes(Path("input.ts"), []) == []
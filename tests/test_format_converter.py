@@ -0,0 +1,35 @@
+from pathlib import Path
+
+from video_slicer.core.format_converter import FormatConverter
+
+
+def test_convert_remux_uses_stream_copy(ffmpeg_calls):
+    FormatConverter().convert(Path("in.mkv"), Path("out.mp4"))
+    assert ffmpeg_calls[0] == [
+        "-i",
+        "in.mkv",
+        "-c",
+        "copy",
+        "-map",
+        "0",
+        "-movflags",
+        "+faststart",
+        "out.mp4",
+    ]
+
+
+def test_convert_with_codecs_keeps_extra_args(ffmpeg_calls):
+    FormatConverter().convert(
+        Path("in.mp4"), Path("out.mkv"), video_codec="h264", extra_args=["-crf", "20"]
+    )
+    assert ffmpeg_calls[0] == [
+        "-i",
+        "in.mp4",
+        "-c:v",
+        "h264",
+        "-c:a",
+        "copy",
+        "-crf",
+        "20",
+        "out.mkv",
+    ]
@@ -0,0 +1,17 @@
+from video_slicer import main as main_module
+
+
+def test_main_reuses_existing_application(qapp, monkeypatch):
+    created = []
+
+    class FakeWindow:
+        def __init__(self):
+            created.append(self)
+
+        def show(self):
+            pass
+
+    monkeypatch.setattr("video_slicer.ui.main_window.MainWindow", FakeWindow)
+    monkeypatch.setattr(type(qapp), "exec", lambda self: 0)
+    assert main_module.main() == 0
+    assert len(created) == 1
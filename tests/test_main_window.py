@@ -0,0 +1,554 @@
+import pytest
+
+from video_slicer.utils.settings import AppSettings
+
+
+class _RecordingSettingsManager:
+    def __init__(self) -> None:
+        self.saved: list[AppSettings] = []
+
+    def load(self) -> AppSettings:
+        return AppSettings(language="en")
+
+    def save(self, settings: AppSettings) -> None:
+        self.saved.append(settings.clone())
+
+
+@pytest.fixture
+def main_window(qapp, monkeypatch, tmp_path):
+    from video_slicer.ui import main_window
+
+    monkeypatch.setattr(main_window, "SettingsManager", _RecordingSettingsManager)
+    monkeypatch.setattr(
+        main_window, "default_probe_cache_file", lambda: tmp_path / "probe.json"
+    )
+    window = main_window.MainWindow()
+    yield window
+    window.deleteLater()
+
+
+def test_app_icon_is_cached(qapp):
+    from video_slicer.ui.main_window import MainWindow
+
+    icon = MainWindow._create_app_icon()
+    assert not icon.isNull()
+    assert icon.pixmap(16, 16).width() == 16
+    assert MainWindow._create_app_icon() is icon
+
+
+def test_settings_saves_are_coalesced(main_window):
+    saved = main_window.settings_manager.saved
+    saved.clear()
+    main_window.set_language("ru")
+    main_window.set_language("en")
+    main_window.set_language("ru")
+    assert saved == []
+    assert main_window._settings_save_timer.isActive()
+
+    main_window.close()
+    assert [settings.language for settings in saved] == ["ru"]
+    assert not main_window._settings_save_timer.isActive()
+
+
+def test_unchanged_settings_are_not_written(main_window):
+    saved = main_window.settings_manager.saved
+    saved.clear()
+    main_window.set_language("ru")
+    main_window.set_language("en")
+    main_window._flush_settings_save()
+    assert saved == []
+
+
+def test_log_lines_are_flushed_in_batches(main_window):
+    main_window._flush_log()
+    main_window._ensure_log_console().clear()
+    for number in range(3):
+        main_window._append_log(f"line {number}")
+    assert main_window.log_console.toPlainText() == ""
+    assert main_window._log_flush_timer.isActive()
+
+    main_window._flush_log()
+    lines = main_window.log_console.toPlainText().splitlines()
+    assert [line.split("] ", 1)[1] for line in lines] == ["line 0", "line 1", "line 2"]
+
+
+def test_log_console_is_created_on_first_line(main_window):
+    from PySide6 import QtWidgets
+
+    main_window._log_buffer.clear()
+    main_window._flush_log()
+    assert main_window.log_console is None
+
+    main_window._append_log("first")
+    main_window._flush_log()
+    console = main_window.log_console
+    assert isinstance(console, QtWidgets.QPlainTextEdit)
+    assert console.parentWidget() is not None
+    assert main_window._ensure_log_console() is console
+
+
+def test_segment_progress_is_shown_on_log_flush(main_window):
+    main_window._flush_log()
+    before = main_window.progress_info_label.text()
+    main_window._on_segment_started(1, 3, "a.mp4")
+    main_window._on_segment_started(2, 3, "b.mp4")
+    assert main_window.progress_info_label.text() == before
+
+    main_window._flush_log()
+    templates = main_window._progress_templates
+    expected = templates["progress_template"].format(current=2, total=3)
+    assert main_window.progress_info_label.text() == expected
+    assert "b.mp4" in main_window.status_bar.currentMessage()
+
+
+def test_input_probe_is_cached_until_file_changes(main_window, monkeypatch, tmp_path):
+    from video_slicer.utils import ffmpeg_helper
+
+    calls: list[str] = []
+
+    def fake_probe_file(path, fast=False):
+        calls.append(str(path))
+        return {"format": {}}
+
+    monkeypatch.setattr(ffmpeg_helper, "probe_file", fake_probe_file)
+    video = tmp_path / "input.mp4"
+    video.write_bytes(b"v1")
+    first = main_window._probe_file(video)
+    assert main_window._probe_file(video) is first
+    assert len(calls) == 1
+
+    video.write_bytes(b"version2")
+    main_window._probe_file(video)
+    assert len(calls) == 2
+
+
+def test_probe_results_persist_across_windows(main_window, monkeypatch, tmp_path):
+    from video_slicer.ui.main_window import MainWindow
+    from video_slicer.utils import ffmpeg_helper
+
+    calls: list[str] = []
+
+    def fake_probe_file(path, fast=False):
+        calls.append(str(path))
+        return {"format": {"duration": "3"}}
+
+    monkeypatch.setattr(ffmpeg_helper, "probe_file", fake_probe_file)
+    video = tmp_path / "input.mp4"
+    video.write_bytes(b"v1")
+    main_window._probe_file(video)
+    main_window.close()
+
+    second = MainWindow()
+    try:
+        assert second._probe_file(video) == {"format": {"duration": "3"}}
+    finally:
+        second.deleteLater()
+    assert len(calls) == 1
+
+
+def test_fast_probe_falls_back_when_header_is_incomplete(
+    main_window, monkeypatch, tmp_path
+):
+    from video_slicer.utils import ffmpeg_helper
+
+    calls: list[bool] = []
+    header = {
+        "format": {"duration": "10"},
+        "streams": [{"codec_type": "video", "codec_name": "h264"}],
+    }
+    full = {
+        "format": {"duration": "10"},
+        "streams": [
+            {"codec_type": "video", "codec_name": "h264", "width": 640, "height": 360}
+        ],
+    }
+
+    def fake_probe_file(path, fast=False):
+        calls.append(fast)
+        return header if fast else full
+
+    monkeypatch.setattr(ffmpeg_helper, "probe_file", fake_probe_file)
+    video = tmp_path / "input.mp4"
+    video.write_bytes(b"v1")
+    assert main_window._probe_file(video, fast=True) is full
+    assert calls == [True, False]
+
+    header["streams"] = full["streams"]
+    video.write_bytes(b"version2")
+    assert main_window._probe_file(video, fast=True) is header
+    assert calls == [True, False, True]
+
+
+def test_retranslate_updates_declared_widgets(main_window):
+    main_window.set_language("ru")
+    tr = main_window.translator.tr
+    assert main_window.file_label.text() == tr("file_label")
+    assert main_window.stop_button.toolTip() == tr("tooltip_stop")
+    assert main_window.about_action.text() == tr("help_about")
+
+
+def test_retranslate_skips_unchanged_language(main_window):
+    main_window.stop_button.setToolTip("custom")
+    main_window.set_language(main_window.translator.language)
+    assert main_window.stop_button.toolTip() == "custom"
+
+
+def test_file_log_is_written_off_thread_until_error(main_window, tmp_path):
+    import logging
+    import time
+
+    log_path = tmp_path / "svs.log"
+    main_window.app_settings.log_to_file = True
+    main_window.app_settings.log_file_path = str(log_path)
+    main_window._configure_file_logging()
+    assert not main_window._settings_save_timer.isActive()
+    try:
+        test_logger = logging.getLogger("video_slicer.tests")
+        test_logger.setLevel(logging.INFO)
+        test_logger.info("buffered line")
+        assert "buffered line" not in log_path.read_text(encoding="utf-8")
+        test_logger.error("failure line")
+        deadline = time.monotonic() + 5
+        content = ""
+        while "failure line" not in content and time.monotonic() < deadline:
+            time.sleep(0.01)
+            content = log_path.read_text(encoding="utf-8")
+        assert "buffered line" in content and "failure line" in content
+
+        main_window._stop_log_listener()
+        assert main_window._log_file_handler in logging.getLogger().handlers
+        test_logger.info("direct line")
+        main_window._log_file_handler.flush()
+        assert "direct line" in log_path.read_text(encoding="utf-8")
+    finally:
+        main_window.app_settings.log_to_file = False
+        main_window._configure_file_logging()
+    assert main_window._log_file_handler is None
+    assert main_window._log_listener is None
+
+
+def test_file_logging_starts_after_construction(qapp, monkeypatch, tmp_path):
+    from PySide6 import QtWidgets
+
+    from video_slicer.ui import main_window
+
+    log_path = tmp_path / "svs.log"
+
+    class _LoggingSettingsManager(_RecordingSettingsManager):
+        def load(self) -> AppSettings:
+            return AppSettings(
+                language="en", log_to_file=True, log_file_path=str(log_path)
+            )
+
+    monkeypatch.setattr(main_window, "SettingsManager", _LoggingSettingsManager)
+    monkeypatch.setattr(
+        main_window, "default_probe_cache_file", lambda: tmp_path / "probe.json"
+    )
+    window = main_window.MainWindow()
+    try:
+        assert window._log_listener is None
+        QtWidgets.QApplication.processEvents()
+        assert window._log_listener is not None
+        assert log_path.exists()
+    finally:
+        window.app_settings.log_to_file = False
+        window._configure_file_logging()
+        window.deleteLater()
+    assert window._log_file_handler is None
+
+
+def test_safe_int_accepts_probe_values(qapp):
+    from video_slicer.ui.main_window import MainWindow
+
+    assert MainWindow._safe_int(1920) == 1920
+    assert MainWindow._safe_int(1080.0) == 1080
+    assert MainWindow._safe_int(" 720\n") == 720
+    assert MainWindow._safe_int("-1") == -1
+    for value in (None, True, "abc", float("nan"), float("inf"), [1]):
+        assert MainWindow._safe_int(value) is None
+
+
+def test_dark_palette_is_cached(qapp):
+    from PySide6 import QtGui
+
+    from video_slicer.ui.main_window import MainWindow
+
+    palette = MainWindow._dark_palette()
+    assert MainWindow._dark_palette() is palette
+    window_color = palette.color(QtGui.QPalette.ColorRole.Window)
+    assert window_color.getRgb()[:3] == (45, 45, 48)
+
+
+def test_extract_file_info_uses_first_streams(main_window):
+    data = {
+        "format": {"duration": "12.5"},
+        "streams": [
+            {"codec_type": "audio", "codec_name": "aac"},
+            {
+                "codec_type": "video",
+                "codec_name": "h264",
+                "width": 1920,
+                "height": 1080,
+            },
+            {"codec_type": "video", "codec_name": "mjpeg", "width": 1, "height": 1},
+        ],
+    }
+    info = main_window._extract_file_info(data)
+    assert info["duration"] == 12.5
+    assert info["resolution"] == (1920, 1080)
+    assert info["video_codec"] == "h264"
+    assert info["audio_codec"] == "aac"
+
+
+def test_format_duration(qapp):
+    from video_slicer.ui.main_window import MainWindow
+
+    assert MainWindow._format_duration(0) == "00:00:00"
+    assert MainWindow._format_duration(59.6) == "00:01:00"
+    assert MainWindow._format_duration(3725.2) == "01:02:05"
+    assert MainWindow._format_duration(360000) == "100:00:00"
+
+
+def test_format_file_info_unknown_values(main_window):
+    unknown = main_window.translator.tr("file_info_unknown")
+    expected = main_window.translator.tr("file_info_template").format(
+        duration=unknown, resolution=unknown, codecs=unknown
+    )
+    assert main_window._format_file_info({}) == expected
+    text = main_window._format_file_info({"duration": 61.0, "audio_codec": "aac"})
+    assert "00:01:01" in text and "AAC" in text
+
+
+def test_dialogs_are_not_imported_with_main_window():
+    import subprocess
+    import sys
+    from pathlib import Path
+
+    code = (
+        "import sys, video_slicer.ui.main_window; "
+        "print(','.join(m for m in sys.modules if m.startswith('video_slicer.')))"
+    )
+    src = Path(__file__).resolve().parents[1] / "src"
+    loaded = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=src,
+    ).stdout.strip().split(",")
+    assert "video_slicer.ui.settings_dialog" not in loaded
+    assert "video_slicer.ui.processing_worker" not in loaded
+    assert "video_slicer.core.video_processor" not in loaded
+
+
+def test_input_file_is_probed_off_the_gui_thread(main_window, monkeypatch, tmp_path):
+    import threading
+    import time
+
+    from PySide6 import QtWidgets
+
+    from video_slicer.utils import ffmpeg_helper
+
+    video = tmp_path / "input.mp4"
+    video.write_bytes(b"video")
+    probe_threads: list[threading.Thread] = []
+    release = threading.Event()
+
+    def fake_probe_file(path, fast=False):
+        probe_threads.append(threading.current_thread())
+        release.wait(5)
+        return {"format": {"duration": "7"}}
+
+    monkeypatch.setattr(ffmpeg_helper, "probe_file", fake_probe_file)
+    monkeypatch.setattr(
+        QtWidgets.QFileDialog,
+        "getOpenFileName",
+        lambda *args, **kwargs: (str(video), ""),
+    )
+    main_window.centralWidget().setEnabled(True)
+    main_window.select_input_file()
+    assert not main_window.file_button.isEnabled()
+    assert main_window.input_file is None
+    release.set()
+
+    deadline = time.monotonic() + 5
+    while main_window.input_file is None and time.monotonic() < deadline:
+        QtWidgets.QApplication.processEvents()
+        time.sleep(0.01)
+    assert main_window.input_file == video
+    assert main_window._file_info["duration"] == 7.0
+    assert main_window.file_button.isEnabled()
+    assert probe_threads and probe_threads[0] is not threading.main_thread()
+    assert main_window._probe_json_cache[0] is main_window._probe_data
+    assert '"duration": "7"' in main_window._probe_json_cache[1]
+
+    main_window.select_input_file()
+    assert main_window.input_file == video
+    assert len(probe_threads) == 1
+
+
+def test_standard_icons_are_shared_between_buttons(main_window):
+    assert all(not button.icon().isNull() for button in main_window.segment_buttons)
+    file_icon = main_window.file_button.icon()
+    assert file_icon.cacheKey() == main_window.load_button.icon().cacheKey()
+
+
+def test_about_logo_and_probe_json_are_cached(main_window):
+    from video_slicer.ui.main_window import MainWindow
+
+    logo = MainWindow._about_logo()
+    assert MainWindow._about_logo() is logo
+    assert max(logo.width(), logo.height()) == 96
+
+    probe = {"format": {"duration": "1"}}
+    text = main_window._probe_json_text(probe)
+    assert main_window._probe_json_text(probe) is text
+    assert main_window._probe_json_text({"format": {}}) != text
+
+
+def test_sanitize_filename_collapses_separators():
+    from video_slicer.ui.main_window import MainWindow
+
+    assert MainWindow._sanitize_filename("  a: b__ c?.  ") == "a_b_c"
+    assert MainWindow._sanitize_filename("_.intro  part_.") == "intro_part"
+
+
+def test_info_dialogs_are_reused_until_language_changes(main_window, monkeypatch):
+    from PySide6 import QtWidgets
+
+    shown: list[QtWidgets.QDialog] = []
+    monkeypatch.setattr(QtWidgets.QDialog, "exec", lambda self: shown.append(self))
+    main_window.show_about()
+    main_window.show_about()
+    main_window.show_manual()
+    assert shown[0] is shown[1]
+    assert shown[2] is not shown[0]
+
+    main_window.set_language("ru")
+    main_window.show_about()
+    assert shown[3] is not shown[0]
+    assert shown[3].windowTitle() == main_window.translator.tr("help_about")
+
+
+def test_metadata_dialog_is_reused_with_current_text(
+    main_window, monkeypatch, tmp_path
+):
+    from PySide6 import QtWidgets
+
+    shown: list[QtWidgets.QDialog] = []
+    monkeypatch.setattr(QtWidgets.QDialog, "exec", lambda self: shown.append(self))
+    main_window.input_file = tmp_path / "input.mp4"
+    main_window._probe_data = {"format": {"duration": "1"}}
+    main_window.show_metadata()
+    main_window._probe_data = {"format": {"duration": "2"}}
+    main_window.show_metadata()
+    assert shown[0] is shown[1]
+    text = shown[1].findChild(QtWidgets.QPlainTextEdit).toPlainText()
+    assert '"duration": "2"' in text
+
+
+def test_segments_file_with_bom_is_loaded(main_window, monkeypatch, tmp_path):
+    from PySide6 import QtWidgets
+
+    segments_file = tmp_path / "segments.json"
+    segments_file.write_text(
+        '[{"start_time": "00:00:05", "end_time": "00:00:09", "filename": "a"}]',
+        encoding="utf-8-sig",
+    )
+    monkeypatch.setattr(
+        QtWidgets.QFileDialog,
+        "getOpenFileName",
+        lambda *args, **kwargs: (str(segments_file), ""),
+    )
+    messages: list[str] = []
+    monkeypatch.setattr(
+        QtWidgets.QMessageBox,
+        "information",
+        lambda *args: messages.append(args[2]),
+    )
+    main_window.load_segments_from_file()
+    segments = main_window.segment_manager.segments
+    assert [(s.start, s.end, s.filename) for s in segments] == [(5.0, 9.0, "a")]
+    assert messages == [main_window.translator.tr("segments_load_success")]
+
+
+def test_build_segments_from_entries_chains_ends(main_window):
+    main_window._file_info = {"duration": 30.0}
+    entries = [(0.0, "intro"), (10.0, None), (20.0, "outro")]
+    assert main_window._build_segments_from_entries(entries) == [
+        (0.0, 10.0, "intro"),
+        (10.0, 20.0, None),
+        (20.0, 30.0, "outro"),
+    ]
+    tr = main_window.translator.tr
+    with pytest.raises(ValueError) as error:
+        main_window._build_segments_from_entries(
+            [(0.0, None), (5.0, None), (5.0, None)]
+        )
+    assert str(error.value) == tr("bulk_create_error_order").format(line=3)
+    with pytest.raises(ValueError) as error:
+        main_window._build_segments_from_entries([(0.0, None), (31.0, None)])
+    assert str(error.value) == tr("bulk_create_error_over_duration").format(line=2)
+
+
+def test_segments_dialogs_start_in_last_directory(main_window, monkeypatch, tmp_path):
+    from pathlib import Path
+
+    from PySide6 import QtWidgets
+
+    starts: list[str] = []
+
+    def fake_get_save_file_name(parent, caption, directory, filters):
+        starts.append(directory)
+        return "", ""
+
+    monkeypatch.setattr(
+        QtWidgets.QFileDialog, "getSaveFileName", fake_get_save_file_name
+    )
+    main_window.app_settings.last_output_dir = str(tmp_path)
+    main_window.save_segments_to_file()
+    main_window.app_settings.last_output_dir = None
+    main_window.app_settings.last_input_dir = None
+    main_window.save_segments_to_file()
+    assert starts == [
+        str(tmp_path / "segments.json"),
+        str(Path(main_window._home_dir) / "segments.json"),
+    ]
+
+
+def test_stopped_thread_cleanup_does_not_touch_next_thread(main_window):
+    from PySide6 import QtCore, QtWidgets
+
+    thread = QtCore.QThread(main_window)
+    thread.finished.connect(main_window._cleanup_processing_thread)
+    thread.start()
+    main_window._processing_thread = thread
+    main_window._stop_processing_thread()
+    assert main_window._processing_thread is None
+
+    next_thread = QtCore.QThread(main_window)
+    main_window._processing_thread = next_thread
+    QtWidgets.QApplication.processEvents()
+    assert main_window._processing_thread is next_thread
+    main_window._processing_thread = None
+
+
+def test_metadata_chapters_are_offered_as_segments(main_window, monkeypatch):
+    offered: list[list[tuple[float, float | None, str]]] = []
+
+    def decline(chapters):
+        offered.append(chapters)
+        return False
+
+    monkeypatch.setattr(main_window, "_prompt_create_segments_from_chapters", decline)
+    main_window._handle_metadata_chapters(
+        {
+            "chapters": [
+                {"start_time": "0.0", "end_time": "5.0", "tags": {"TITLE": "Intro"}},
+                {"start_time": "5.0", "end_time": "5.0", "tags": "broken"},
+                {"end_time": "9.0"},
+                "noise",
+            ]
+        }
+    )
+    assert offered == [[(0.0, 5.0, "Intro"), (5.0, None, "Chapter 02")]]
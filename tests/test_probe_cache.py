@@ -0,0 +1,56 @@
+from video_slicer.utils.probe_cache import ProbeCache
+
+
+def test_entries_survive_reload(tmp_path):
+    cache_file = tmp_path / "cache" / "probe.json"
+    video = tmp_path / "а б.mp4"
+    video.write_bytes(b"video")
+    key = ProbeCache.make_key(video, video.stat())
+    cache = ProbeCache(cache_file)
+    assert cache.get(key) is None
+    cache.put(key, {"format": {"duration": "1.5"}})
+    cache.save()
+    assert not cache_file.with_suffix(".tmp").exists()
+
+    reloaded = ProbeCache(cache_file)
+    assert reloaded.get(key) == {"format": {"duration": "1.5"}}
+
+
+def test_key_follows_content_not_path(tmp_path):
+    video = tmp_path / "a.mp4"
+    video.write_bytes(b"video")
+    key = ProbeCache.make_key(video, video.stat())
+    assert ProbeCache.make_key(video, video.stat(), fast=True) != key
+
+    moved = video.rename(tmp_path / "b.mp4")
+    assert ProbeCache.make_key(moved, moved.stat()) == key
+    moved.write_bytes(b"other")
+    assert ProbeCache.make_key(moved, moved.stat()) != key
+
+
+def test_oldest_entries_are_evicted(tmp_path):
+    cache = ProbeCache(tmp_path / "probe.json", max_entries=2)
+    cache.put("a", {})
+    cache.put("b", {})
+    cache.get("a")
+    cache.put("c", {})
+    assert cache.get("b") is None
+    assert cache.get("a") == {} and cache.get("c") == {}
+
+
+def test_save_without_changes_does_not_write(tmp_path):
+    cache_file = tmp_path / "probe.json"
+    cache = ProbeCache(cache_file)
+    cache.get("missing")
+    cache.save()
+    assert not cache_file.exists()
+
+
+def test_corrupt_file_is_ignored(tmp_path):
+    cache_file = tmp_path / "probe.json"
+    cache_file.write_text("{not json", encoding="utf-8")
+    cache = ProbeCache(cache_file)
+    assert cache.get("a") is None
+    cache.put("a", {"streams": []})
+    cache.save()
+    assert ProbeCache(cache_file).get("a") == {"streams": []}
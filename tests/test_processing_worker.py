@@ -0,0 +1,113 @@
+import os
+import threading
+import time
+from pathlib import Path
+
+from video_slicer.models.segment import Segment
+from video_slicer.ui.processing_worker import ProcessingWorker
+from video_slicer.utils import ffmpeg_helper
+from video_slicer.utils.settings import AppSettings
+
+
+def test_worker_honours_shared_stop_event(qapp, monkeypatch, tmp_path):
+    stop_event = threading.Event()
+    calls: list[str] = []
+
+    def stopping_run_ffmpeg(args, cancel_event=None):
+        calls.append(args[-1])
+        stop_event.set()
+
+    monkeypatch.setattr(ffmpeg_helper, "run_ffmpeg", stopping_run_ffmpeg)
+    monkeypatch.setattr(ffmpeg_helper, "probe_keyframes", lambda path, starts: [])
+    worker = ProcessingWorker(
+        Path("input.mp4"),
+        tmp_path,
+        [Segment(start=0, end=5, index=1), Segment(start=5, end=10, index=2)],
+        AppSettings(max_workers=1),
+        stop_event=stop_event,
+    )
+    events: list[str] = []
+    worker.stopped.connect(lambda: events.append("stopped"))
+    worker.finished.connect(lambda: events.append("finished"))
+
+    worker.run()
+    assert events == ["stopped"]
+    assert len(calls) == 1
+
+
+def test_worker_collects_failures_and_continues(qapp, monkeypatch, tmp_path):
+    calls: list[str] = []
+
+    def failing_run_ffmpeg(args, cancel_event=None):
+        calls.append(args[-1])
+        if not args[-1].endswith("segment_002.mp4"):
+            raise RuntimeError("bad segment")
+
+    monkeypatch.setattr(ffmpeg_helper, "run_ffmpeg", failing_run_ffmpeg)
+    monkeypatch.setattr(ffmpeg_helper, "probe_keyframes", lambda path, starts: [])
+    segments = [Segment(start=idx, end=idx + 1, index=idx + 1) for idx in range(3)]
+    worker = ProcessingWorker(
+        Path("input.mp4"), tmp_path, segments, AppSettings(max_workers=1)
+    )
+    failed: list[str] = []
+    errors: list[str] = []
+    progress: list[int] = []
+    worker.segment_failed.connect(lambda name, error: failed.append(name))
+    worker.error_occurred.connect(errors.append)
+    worker.progress_changed.connect(progress.append)
+    worker.run()
+    qapp.processEvents()
+    assert len(calls) == 3
+    assert failed == ["segment_001.mp4", "segment_003.mp4"]
+    assert errors == ["segment_001.mp4: bad segment\nsegment_003.mp4: bad segment"]
+    assert progress[-1] == 100
+
+
+def test_worker_emits_each_percent_once(qapp, ffmpeg_calls, tmp_path):
+    segments = [Segment(start=idx, end=idx + 1, index=idx + 1) for idx in range(300)]
+    worker = ProcessingWorker(
+        Path("input.mp4"), tmp_path, segments, AppSettings(max_workers=1)
+    )
+    progress: list[int] = []
+    worker.progress_changed.connect(progress.append)
+    worker.run()
+    qapp.processEvents()
+    assert progress == sorted(set(progress))
+    assert progress[-1] == 100
+    assert len(progress) <= 101
+
+
+def test_worker_serialises_segments_with_same_output(qapp, monkeypatch, tmp_path):
+    active: list[str] = []
+    overlaps: list[str] = []
+    lock = threading.Lock()
+
+    def slow_run_ffmpeg(args, cancel_event=None):
+        with lock:
+            if args[-1] in active:
+                overlaps.append(args[-1])
+            active.append(args[-1])
+        time.sleep(0.02)
+        with lock:
+            active.remove(args[-1])
+
+    monkeypatch.setattr(os, "cpu_count", lambda: 4)
+    monkeypatch.setattr(ffmpeg_helper, "run_ffmpeg", slow_run_ffmpeg)
+    monkeypatch.setattr(ffmpeg_helper, "probe_keyframes", lambda path, starts: [])
+    segments = [
+        Segment(start=0, end=5, filename="same", index=1),
+        Segment(start=5, end=10, filename="same", index=2),
+        Segment(start=10, end=15, filename="other", index=3),
+    ]
+    worker = ProcessingWorker(
+        Path("input.mp4"), tmp_path, segments, AppSettings(max_workers=3)
+    )
+    started: list[int] = []
+    events: list[str] = []
+    worker.segment_started.connect(lambda index, total, name: started.append(index))
+    worker.finished.connect(lambda: events.append("finished"))
+    worker.run()
+    qapp.processEvents()
+    assert overlaps == []
+    assert sorted(started) == [1, 2, 3]
+    assert events == ["finished"]
@@ -0,0 +1,26 @@
+from dataclasses import FrozenInstanceError, replace
+from pathlib import Path
+
+import pytest
+
+from video_slicer.models.segment import Segment
+
+
+def test_output_path_defaults():
+    segment = Segment(start=0, container="mkv", index=7)
+    assert segment.output_path(Path("out"), ".mp4") == Path("out/segment_007.mkv")
+
+
+def test_output_path_tracks_replacements():
+    segment = Segment(start=0, filename="intro", container="mp4", index=1)
+    assert segment.output_path(Path("out"), ".mp4") == Path("out/intro.mp4")
+    segment = replace(segment, container="webm")
+    assert segment.output_path(Path("out"), ".mp4") == Path("out/intro.webm")
+    segment = replace(segment, filename="clip.mov")
+    assert segment.output_path(Path("out"), ".mp4") == Path("out/clip.mov")
+
+
+def test_segment_is_immutable():
+    segment = Segment(start=0)
+    with pytest.raises(FrozenInstanceError):
+        segment.start = 1
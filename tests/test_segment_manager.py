@@ -19,3 +19,23 @@ def test_reindex_after_removal():
         manager.add_segment(Segment(start=idx * 10, end=idx * 10 + 5))
     manager.remove_segment(1)
     assert [segment.index for segment in manager.segments] == [1, 2]
+
+
+def test_insert_reindexes_suffix():
+    manager = SegmentManager()
+    for idx in range(3):
+        manager.add_segment(Segment(start=idx * 10, end=idx * 10 + 5))
+    manager.insert_segment(1, Segment(start=1, end=2))
+    assert [segment.index for segment in manager.segments] == [1, 2, 3, 4]
+    assert manager.segments[1].start == 1
+
+
+def test_update_keeps_index_and_shares_unchanged_segments():
+    manager = SegmentManager()
+    stored = [manager.add_segment(Segment(start=idx, end=idx + 1)) for idx in range(3)]
+    manager.update_segment(1, Segment(start=5, end=6))
+    assert manager.segments[1].index == 2
+    assert manager.segments[0] is stored[0]
+    manager.remove_segment(0)
+    assert manager.segments[1] is not stored[2]
+    assert manager.segments[1].index == 2
@@ -0,0 +1,96 @@
+from PySide6 import QtCore
+
+from video_slicer.core.segment_manager import SegmentManager
+from video_slicer.models.segment import Segment
+from video_slicer.ui.segment_table import SegmentTableModel
+from video_slicer.ui.translations import Translator
+
+
+def _make_model(tmp_path, segments):
+    manager = SegmentManager()
+    for segment in segments:
+        manager.add_segment(segment)
+    model = SegmentTableModel(
+        manager,
+        Translator("en"),
+        lambda segment, container: segment.output_path(tmp_path, f".{container}"),
+    )
+    model.refresh(default_container="mp4", use_icons=False)
+    return model
+
+
+def test_model_display(qapp, tmp_path):
+    model = _make_model(
+        tmp_path,
+        [Segment(start=0, end=5, filename="a"), Segment(start=10, filename="b")],
+    )
+    assert model.rowCount() == 2
+    assert model.columnCount() == SegmentTableModel.COLUMN_COUNT
+    assert model.index(0, 1).data() == "a"
+    assert model.index(1, 3).data() == ""
+    assert model.index(1, 0).data() == 2
+    header = model.headerData(1, QtCore.Qt.Orientation.Horizontal)
+    assert header == Translator("en").tr("filename")
+
+
+def test_metadata_column_requires_output(qapp, tmp_path):
+    model = _make_model(
+        tmp_path,
+        [Segment(start=0, end=5, filename="a"), Segment(start=5, filename="b")],
+    )
+    enabled = QtCore.Qt.ItemFlag.ItemIsEnabled
+    column = SegmentTableModel.METADATA_COLUMN
+    assert not model.index(0, column).flags() & enabled
+    model.output_path(0).touch()
+    model.refresh(default_container="mp4", use_icons=False)
+    assert model.index(0, column).flags() & enabled
+    assert not model.index(1, column).flags() & enabled
+    assert model.index(1, SegmentTableModel.PREVIEW_COLUMN).flags() & enabled
+
+
+def test_retranslate_updates_cached_texts(qapp, tmp_path):
+    model = _make_model(tmp_path, [Segment(start=0, end=5, convert=True)])
+    translator = model._translator
+    translator.set_language("ru")
+    model.retranslate()
+    assert model.index(0, 5).data() == translator.tr("yes")
+    header = model.headerData(1, QtCore.Qt.Orientation.Horizontal)
+    assert header == translator.tr("filename")
+
+
+def test_retranslate_without_language_change_is_silent(qapp, tmp_path):
+    model = _make_model(tmp_path, [Segment(start=0, end=5)])
+    emitted: list[object] = []
+    model.headerDataChanged.connect(lambda *args: emitted.append(args))
+    model.dataChanged.connect(lambda *args: emitted.append(args))
+    model.retranslate()
+    assert emitted == []
+    model._translator.set_language("ru")
+    model.retranslate()
+    assert len(emitted) == 2
+
+
+def test_index_column_sorts_numerically(qapp, tmp_path):
+    model = _make_model(
+        tmp_path, [Segment(start=idx, end=idx + 1) for idx in range(12)]
+    )
+    proxy = QtCore.QSortFilterProxyModel()
+    proxy.setSourceModel(model)
+    proxy.sort(0, QtCore.Qt.SortOrder.DescendingOrder)
+    assert [proxy.index(row, 0).data() for row in range(3)] == [12, 11, 10]
+
+
+def test_rows_added_before_refresh_are_safe(qapp, tmp_path):
+    manager = SegmentManager()
+    manager.add_segment(Segment(start=0, end=5, index=1))
+    model = SegmentTableModel(
+        manager,
+        Translator("en"),
+        lambda segment, container: segment.output_path(tmp_path, f".{container}"),
+    )
+    model.refresh(default_container="mp4", use_icons=False)
+    manager.add_segment(Segment(start=5, end=10, index=2))
+    index = model.createIndex(1, SegmentTableModel.METADATA_COLUMN)
+    missing = Translator("en").tr("segment_metadata_missing")
+    assert not model.flags(index) & QtCore.Qt.ItemFlag.ItemIsEnabled
+    assert model.data(index, QtCore.Qt.ItemDataRole.ToolTipRole) == missing
@@ -0,0 +1,19 @@
+import pytest
+
+from video_slicer.ui.translations import TRANSLATIONS, Translator
+
+
+def test_tr_follows_language_switch():
+    translator = Translator("ru")
+    assert translator.tr("error") == TRANSLATIONS["error"].ru
+    translator.set_language("en")
+    assert translator.language == "en"
+    assert translator.tr("error") == TRANSLATIONS["error"].en
+
+
+def test_unknown_key_and_language():
+    translator = Translator("en")
+    assert translator.tr("missing_key") == "missing_key"
+    with pytest.raises(ValueError):
+        translator.set_language("de")
+    assert translator.tr("error") == TRANSLATIONS["error"].en
@@ -0,0 +1,21 @@
+import pytest
+
+from video_slicer.utils import validators
+
+
+def test_validate_input_file_checks_extension(tmp_path):
+    video = tmp_path / "clip.MP4"
+    video.write_bytes(b"")
+    assert validators.validate_input_file(video) == video.resolve()
+
+    text = tmp_path / "notes.txt"
+    text.write_text("x", encoding="utf-8")
+    with pytest.raises(ValueError, match="Неподдерживаемое расширение"):
+        validators.validate_input_file(text)
+
+
+def test_input_extensions_are_ordered_and_unique():
+    assert validators.INPUT_EXTENSIONS[0] == ".mp4"
+    assert len(validators.SUPPORTED_INPUT_EXTENSIONS) == len(
+        validators.INPUT_EXTENSIONS
+    )
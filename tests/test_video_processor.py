@@ -0,0 +1,325 @@
+import os
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from video_slicer.core.video_processor import SegmentProcessingError, VideoProcessor
+from video_slicer.models.segment import Segment
+from video_slicer.utils import ffmpeg_helper
+from video_slicer.utils.settings import AppSettings
+
+
+def test_slice_segments_processes_all(ffmpeg_calls, tmp_path):
+    processor = VideoProcessor(Path("input.mp4"), tmp_path)
+    segments = [
+        Segment(start=idx * 10, end=idx * 10 + 5, index=idx + 1) for idx in range(4)
+    ]
+    processor.slice_segments(segments)
+    outputs = sorted(call[-1] for call in ffmpeg_calls)
+    assert outputs == [str(tmp_path / f"segment_{idx:03d}.mp4") for idx in range(1, 5)]
+
+
+def test_slice_segments_reports_failures_after_batch(monkeypatch, tmp_path):
+    calls: list[str] = []
+
+    def fake_run_ffmpeg(args, cancel_event=None):
+        calls.append(args[-1])
+        if args[-1].endswith("segment_002.mp4"):
+            raise RuntimeError("boom")
+
+    monkeypatch.setattr(ffmpeg_helper, "run_ffmpeg", fake_run_ffmpeg)
+    monkeypatch.setattr(ffmpeg_helper, "probe_keyframes", lambda path, starts: [])
+    processor = VideoProcessor(Path("input.mp4"), tmp_path)
+    segments = [Segment(start=idx, end=idx + 1, index=idx + 1) for idx in range(3)]
+    with pytest.raises(RuntimeError, match="#2: boom"):
+        processor.slice_segments(segments, max_workers=1)
+    assert len(calls) == 3
+
+
+def test_slice_segments_reports_each_segment(monkeypatch, tmp_path):
+    def fake_run_ffmpeg(args, cancel_event=None):
+        if args[-1].endswith("b.mp4"):
+            raise RuntimeError("boom")
+        Path(args[-1]).write_bytes(b"data")
+
+    monkeypatch.setattr(ffmpeg_helper, "run_ffmpeg", fake_run_ffmpeg)
+    monkeypatch.setattr(ffmpeg_helper, "probe_keyframes", lambda path, starts: [])
+    processor = VideoProcessor(Path("input.mp4"), tmp_path)
+    segments = [
+        Segment(start=0, end=5, filename="a", index=1),
+        Segment(start=5, end=10, filename="b", index=2),
+        Segment(start=0, end=5, filename="c", index=3),
+    ]
+    started: list[int] = []
+    finished: list[int] = []
+    failed: list[int] = []
+    with pytest.raises(SegmentProcessingError) as excinfo:
+        processor.slice_segments(
+            segments,
+            max_workers=1,
+            on_started=lambda segment: started.append(segment.index),
+            on_finished=lambda segment: finished.append(segment.index),
+            on_failed=lambda segment, exc: failed.append(segment.index),
+        )
+    assert sorted(started) == [1, 2, 3]
+    assert sorted(finished) == [1, 3]
+    assert failed == [2]
+    assert [segment.index for segment, _ in excinfo.value.failures] == [2]
+
+
+def test_max_workers_respects_settings_cap(tmp_path):
+    processor = VideoProcessor(
+        Path("input.mp4"), tmp_path, settings=AppSettings(max_workers=1)
+    )
+    assert processor.resolve_max_workers(10, None) == 1
+    assert processor.resolve_max_workers(1, 4) == 1
+
+
+def test_process_segment_uses_input_seeking(ffmpeg_calls, tmp_path):
+    processor = VideoProcessor(Path("input.mp4"), tmp_path)
+    processor.process_segment(Segment(start=3600, end=3610, index=1))
+    args = ffmpeg_calls[0]
+    assert args.index("-ss") < args.index("-i")
+    assert args.index("-t") < args.index("-i")
+    assert args.index("-noaccurate_seek") < args.index("-i")
+
+
+def test_reencode_keeps_accurate_seek(ffmpeg_calls, tmp_path):
+    processor = VideoProcessor(Path("input.mp4"), tmp_path)
+    segment = Segment(start=5, end=10, convert=True, video_codec="h264", index=1)
+    processor.process_segment(segment)
+    args = ffmpeg_calls[0]
+    assert args.index("-ss") < args.index("-i")
+    assert "-noaccurate_seek" not in args
+
+
+def test_stream_copy_fast_path(ffmpeg_calls, tmp_path):
+    processor = VideoProcessor(Path("input.mp4"), tmp_path)
+    processor.process_segment(Segment(start=1, end=2, crf=18, index=1))
+    args = ffmpeg_calls[0]
+    assert args[args.index("-c") + 1] == "copy"
+    assert args[args.index("-map") + 1] == "0"
+    assert "-avoid_negative_ts" in args
+    assert "-crf" not in args
+    assert "-c:v" not in args
+
+
+def test_stream_copy_other_container_keeps_default_mapping(ffmpeg_calls, tmp_path):
+    processor = VideoProcessor(Path("input.mkv"), tmp_path)
+    processor.process_segment(
+        Segment(start=1, end=2, container="mp4", remove_audio=True, index=1)
+    )
+    args = ffmpeg_calls[0]
+    assert "-map" not in args
+    assert "-an" in args
+
+
+def test_reencode_adds_threads_and_tuning(ffmpeg_calls, tmp_path):
+    settings = AppSettings(preset="veryfast", fast_encode=True)
+    processor = VideoProcessor(Path("input.mp4"), tmp_path, settings=settings)
+    segment = Segment(
+        start=0, end=5, convert=True, video_codec="h264", extra_args="-preset slow"
+    )
+    processor.process_segment(segment)
+    args = ffmpeg_calls[0]
+    assert args[args.index("-threads") + 1] == "0"
+    assert args[args.index("-tune") + 1] == "zerolatency"
+    assert args[args.index("-preset") + 1] == "veryfast"
+    assert args[-5:-3] == ["-preset", "slow"]
+
+
+def test_tuning_skipped_for_non_x26x_codecs(ffmpeg_calls, tmp_path):
+    settings = AppSettings(preset="veryfast", fast_encode=True)
+    processor = VideoProcessor(Path("input.mp4"), tmp_path, settings=settings)
+    processor.process_segment(Segment(start=0, end=5, convert=True, video_codec="vp9"))
+    args = ffmpeg_calls[0]
+    assert "-threads" in args
+    assert "-preset" not in args
+    assert "-tune" not in args
+
+
+def test_faststart_added_for_mp4_outputs(ffmpeg_calls, tmp_path):
+    processor = VideoProcessor(Path("input.mkv"), tmp_path)
+    processor.process_segment(Segment(start=0, end=5, container="mp4"))
+    processor.process_segment(Segment(start=0, end=5, container="mkv"))
+    mp4_args, mkv_args = ffmpeg_calls
+    assert mp4_args[-3:-1] == ["-movflags", "+faststart"]
+    assert "-movflags" not in mkv_args
+
+
+def test_faststart_respects_user_movflags(ffmpeg_calls, tmp_path):
+    processor = VideoProcessor(Path("input.mp4"), tmp_path)
+    segment = Segment(
+        start=0,
+        end=5,
+        convert=True,
+        video_codec="h264",
+        extra_args="-movflags frag_keyframe+empty_moov",
+    )
+    processor.process_segment(segment)
+    assert ffmpeg_calls[0].count("-movflags") == 1
+
+
+def test_copy_start_snaps_to_previous_keyframe(ffmpeg_calls, monkeypatch, tmp_path):
+    probes: list[set[float]] = []
+
+    def fake_probe_keyframes(path, starts):
+        probes.append(set(starts))
+        return [0.0, 4.0, 8.0]
+
+    monkeypatch.setattr(ffmpeg_helper, "probe_keyframes", fake_probe_keyframes)
+    processor = VideoProcessor(Path("input.mp4"), tmp_path)
+    processor.slice_segments(
+        [
+            Segment(start=5, end=10, index=1),
+            Segment(start=9, end=12, index=2),
+            Segment(start=9, end=12, convert=True, video_codec="h264", index=3),
+        ]
+    )
+    cuts = sorted(
+        (args[args.index("-ss") + 1], args[args.index("-t") + 1])
+        for args in ffmpeg_calls
+    )
+    assert cuts == [
+        ("00:00:04", "00:00:06"),
+        ("00:00:08", "00:00:04"),
+        ("00:00:09", "00:00:03"),
+    ]
+    assert probes == [{5, 9}]
+
+
+def test_keyframe_outside_search_window_is_ignored(ffmpeg_calls, monkeypatch, tmp_path):
+    probes: list[set[float]] = []
+
+    def fake_probe_keyframes(path, starts):
+        probes.append(set(starts))
+        return [0.0]
+
+    monkeypatch.setattr(ffmpeg_helper, "probe_keyframes", fake_probe_keyframes)
+    processor = VideoProcessor(Path("input.mp4"), tmp_path)
+    processor.process_segment(Segment(start=10, end=20, index=1))
+    processor.process_segment(Segment(start=100, end=110, index=2))
+    first, second = ffmpeg_calls
+    assert first[first.index("-ss") + 1] == "00:00:00"
+    assert second[second.index("-ss") + 1] == "00:01:40"
+    assert probes == [{10}, {100}]
+
+
+def test_metadata_args(ffmpeg_calls, tmp_path):
+    settings = AppSettings(strip_metadata=True, embed_svs_metadata=True)
+    processor = VideoProcessor(Path("input.mp4"), tmp_path, settings=settings)
+    processor.process_segment(Segment(start=0, end=1))
+    args = ffmpeg_calls[0]
+    assert args[args.index("-map_metadata") + 1] == "-1"
+    assert f"software={VideoProcessor.SVS_METADATA_SOFTWARE}" in args
+    assert args.count("-metadata") == 3
+
+
+def test_slice_segments_copies_duplicates(monkeypatch, tmp_path):
+    calls: list[str] = []
+
+    def fake_run_ffmpeg(args, cancel_event=None):
+        calls.append(args[-1])
+        Path(args[-1]).write_bytes(b"data")
+
+    monkeypatch.setattr(ffmpeg_helper, "run_ffmpeg", fake_run_ffmpeg)
+    monkeypatch.setattr(ffmpeg_helper, "probe_keyframes", lambda path, starts: [])
+    processor = VideoProcessor(Path("input.mp4"), tmp_path)
+    segments = [
+        Segment(start=0, end=5, filename="a", index=1),
+        Segment(start=0, end=5, filename="b", index=2),
+        Segment(start=0, end=5, filename="c", convert=True, video_codec="h264"),
+    ]
+    processor.slice_segments(segments)
+    assert sorted(Path(call).name for call in calls) == ["a.mp4", "c.mp4"]
+    assert (tmp_path / "b.mp4").read_bytes() == b"data"
+    assert not (tmp_path / "b.mp4").samefile(tmp_path / "a.mp4")
+    (tmp_path / "a.mp4").write_bytes(b"")
+    assert (tmp_path / "b.mp4").read_bytes() == b"data"
+
+
+def test_non_positive_segment_is_rejected(ffmpeg_calls, tmp_path):
+    processor = VideoProcessor(Path("input.mp4"), tmp_path)
+    with pytest.raises(ValueError):
+        processor.process_segment(Segment(start=10, end=10))
+    with pytest.raises(ValueError):
+        processor.process_segment(Segment(start=10, end=5))
+    assert ffmpeg_calls == []
+
+
+def test_slice_segments_reports_non_positive_segments(ffmpeg_calls, tmp_path):
+    processor = VideoProcessor(Path("input.mp4"), tmp_path)
+    segments = [
+        Segment(start=0, end=5, filename="a", index=1),
+        Segment(start=10, end=5, filename="b", index=2),
+    ]
+    with pytest.raises(RuntimeError, match="#2"):
+        processor.slice_segments(segments)
+    assert len(ffmpeg_calls) == 1
+
+
+def test_extra_args_respect_quotes(ffmpeg_calls, tmp_path):
+    processor = VideoProcessor(Path("input.mp4"), tmp_path)
+    segment = Segment(
+        start=0,
+        end=5,
+        convert=True,
+        video_codec="h264",
+        extra_args='-metadata "title=my file"',
+    )
+    processor.process_segment(segment)
+    args = ffmpeg_calls[0]
+    assert args[args.index("-metadata") + 1] == "title=my file"
+
+
+def test_process_segment_removes_partial_output_on_cancel(monkeypatch, tmp_path):
+    def fake_run_ffmpeg(args, cancel_event=None):
+        Path(args[-1]).write_bytes(b"partial")
+        assert cancel_event is not None
+        raise ffmpeg_helper.FFmpegCancelledError("stopped")
+
+    monkeypatch.setattr(ffmpeg_helper, "run_ffmpeg", fake_run_ffmpeg)
+    monkeypatch.setattr(ffmpeg_helper, "probe_keyframes", lambda path, starts: [])
+    processor = VideoProcessor(
+        Path("input.mp4"), tmp_path, cancel_event=threading.Event()
+    )
+    with pytest.raises(ffmpeg_helper.FFmpegCancelledError):
+        processor.process_segment(Segment(start=0, end=5, index=1))
+    assert not (tmp_path / "segment_001.mp4").exists()
+
+
+def test_slice_segments_serialises_shared_output_paths(monkeypatch, tmp_path):
+    lock = threading.Lock()
+    active: set[str] = set()
+    overlaps: list[str] = []
+    starts: list[tuple[str, str]] = []
+
+    def fake_run_ffmpeg(args, cancel_event=None):
+        output = args[-1]
+        with lock:
+            if output in active:
+                overlaps.append(output)
+            active.add(output)
+            starts.append((Path(output).name, args[args.index("-ss") + 1]))
+        time.sleep(0.02)
+        with lock:
+            active.discard(output)
+
+    monkeypatch.setattr(ffmpeg_helper, "run_ffmpeg", fake_run_ffmpeg)
+    monkeypatch.setattr(ffmpeg_helper, "probe_keyframes", lambda path, starts: [])
+    monkeypatch.setattr(os, "cpu_count", lambda: 4)
+    processor = VideoProcessor(Path("input.mp4"), tmp_path)
+    segments = [
+        Segment(start=0, end=5, filename="a", index=1),
+        Segment(start=10, end=15, filename="a", index=2),
+        Segment(start=20, end=25, filename="b", index=3),
+    ]
+    processor.slice_segments(segments, max_workers=3)
+    assert overlaps == []
+    assert [start for name, start in starts if name == "a.mp4"] == [
+        "00:00:00",
+        "00:00:10",
+    ]
+    assert len(starts) == 3